@@ -6,17 +6,55 @@
 
 import os
 import shutil
-from typing import Optional, Dict, Any, List
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Iterator
 from pathlib import Path
 
 from core.interfaces.audio_processor import AudioProcessor
 from core.interfaces.pdf_processor import PDFProcessor, PDFProcessingConfig, PDFContent
 from core.models.audio_data import AudioData
 from utils.logging import get_logger
-from utils.audio_utils import get_audio_metadata, validate_audio_file
+from utils.audio_utils import decode_audio_to_wav, iter_audio_pcm, validate_audio_file
+from utils.text_utils import TextUtils
+from utils.pdf_utils import (
+    MAX_PDF_WORKERS, MIN_PAGES_PER_WORKER, extract_page_range_text, get_pdf_pool, reset_pdf_pool
+)
 
 logger = get_logger(__name__)
 
+# PDFメタデータのキー → 文書情報辞書のキー
+_PDF_METADATA_KEYS = (
+    ('title', '/Title'),
+    ('author', '/Author'),
+    ('subject', '/Subject'),
+    ('creator', '/Creator'),
+    ('producer', '/Producer'),
+    ('creation_date', '/CreationDate'),
+    ('modification_date', '/ModDate'),
+)
+
+
+def _count_pdf_terms(pdf_content: PDFContent) -> Counter:
+    """
+    PDF本文の用語候補を数える
+    
+    全角英数字等をNFKCで揃えてから、用語候補の正規表現で一括抽出して数える。
+    抽出も集計もC実装で完結するため、形態素解析器でトークンごとに
+    Pythonオブジェクトを作るより大幅に速い。
+    """
+    text = unicodedata.normalize('NFKC', pdf_content.text)
+    return Counter(TextUtils.CANDIDATE_RE.findall(text))
+
+
+def _pdf_metadata(info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """PDFの文書情報辞書からメタデータを作成（文書情報がない場合は空文字）"""
+    if not info:
+        return {key: '' for key, _ in _PDF_METADATA_KEYS}
+    return {key: info.get(name, '') for key, name in _PDF_METADATA_KEYS}
+
 
 class FileAdapter(AudioProcessor, PDFProcessor):
     """ファイルアダプター"""
@@ -57,30 +95,11 @@ class FileAdapter(AudioProcessor, PDFProcessor):
             if not is_valid:
                 raise ValueError(f"Invalid input audio file: {error_msg}")
             
-            import ffmpeg
-            
-            # 出力ディレクトリを作成
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # FFmpegを使用して音声を抽出
-            (
-                ffmpeg
-                .input(input_path)
-                .output(
-                    output_path, 
-                    ac=channels,           # チャンネル数
-                    ar=sample_rate,        # サンプルレート
-                    vn=None,               # 動画を無効化
-                    y=None,                # 上書き確認を無効化
-                    af="highpass=f=80,lowpass=f=8000,volume=1.2",  # 音声フィルタ
-                    acodec='pcm_s16le'     # 16bit PCM
-                )
-                .run(quiet=True, overwrite_output=True)
+            # FFmpegを使用して音声を抽出（メタデータもデコード結果から得る）
+            _, output_metadata = decode_audio_to_wav(
+                input_path, output_path, sample_rate, channels
             )
             
-            # 出力ファイルのメタデータを取得
-            output_metadata = get_audio_metadata(output_path)
-            
             # 音声データを作成
             audio_data = AudioData(
                 file_path=output_path,
@@ -101,6 +120,59 @@ class FileAdapter(AudioProcessor, PDFProcessor):
             logger.error(f"Failed to extract audio: {e}")
             raise
     
+    def extract_audio_batch(
+        self, 
+        input_output_pairs: Sequence[Tuple[str, str]],
+        sample_rate: int = 16000,
+        channels: int = 1
+    ) -> List[AudioData]:
+        """
+        複数の音声ファイルからまとめて音声データを抽出する
+        
+        デコードはFFmpegのサブプロセスで行われGILを保持しないため、
+        スレッドで並列に実行します（各FFmpegは1スレッドに制限済み）。
+        
+        Args:
+            input_output_pairs: (入力ファイルパス, 出力ファイルパス)のリスト
+            sample_rate: サンプルレート
+            channels: チャンネル数
+            
+        Returns:
+            List[AudioData]: 入力と同じ順序の音声データ
+        """
+        max_workers = self.config.get('max_parallel_decodes') or os.cpu_count() or 1
+        workers = max(1, min(max_workers, len(input_output_pairs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda pair: self.extract_audio(pair[0], pair[1], sample_rate, channels),
+                input_output_pairs
+            ))
+    
+    def extract_audio_stream(
+        self, 
+        input_path: str, 
+        sample_rate: int = 16000,
+        channels: int = 1,
+        chunk_frames: int = 16000
+    ) -> Iterator[Any]:
+        """
+        音声ファイルをデコードしながらPCMを順に返す
+        
+        Args:
+            input_path: 入力ファイルパス
+            sample_rate: サンプルレート
+            channels: チャンネル数
+            chunk_frames: 1回に返すフレーム数
+            
+        Returns:
+            Iterator[np.ndarray]: float32 PCMの断片
+        """
+        is_valid, error_msg = validate_audio_file(input_path)
+        if not is_valid:
+            raise ValueError(f"Invalid input audio file: {error_msg}")
+        
+        return iter_audio_pcm(input_path, sample_rate, channels, chunk_frames)
+    
     def preprocess_audio(
         self, 
         audio_data: AudioData,
@@ -121,33 +193,6 @@ class FileAdapter(AudioProcessor, PDFProcessor):
         logger.info("Audio preprocessing completed")
         return audio_data
     
-    def validate_audio(self, audio_data: AudioData) -> bool:
-        """
-        音声データの妥当性を検証する
-        
-        Args:
-            audio_data: 検証する音声データ
-            
-        Returns:
-            bool: 妥当性の結果
-        """
-        try:
-            # 基本的な妥当性チェック
-            if not Path(audio_data.file_path).exists():
-                return False
-            
-            if audio_data.duration < 0.1:  # 0.1秒未満
-                return False
-            
-            if audio_data.sample_rate < 8000:  # サンプルレートが低すぎる
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Audio validation failed: {e}")
-            return False
-    
     def get_audio_info(self, audio_data: AudioData) -> Dict[str, Any]:
         """
         音声データの情報を取得する
@@ -185,27 +230,25 @@ class FileAdapter(AudioProcessor, PDFProcessor):
         Returns:
             PDFContent: 抽出された内容
         """
+        if config is None:
+            config = PDFProcessingConfig()
+        
         try:
             import PyPDF2
             
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 
-                # テキストを抽出
+                # 無効化された項目は抽出処理自体を行わない（表・画像は未実装のため常に空）
                 text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                if config.extract_text:
+                    text = self._extract_pages_text(
+                        pdf_path, pdf_reader.pages, 0, len(pdf_reader.pages), config.num_workers
+                    )
                 
-                # メタデータを取得
-                metadata = {
-                    'title': pdf_reader.metadata.get('/Title', '') if pdf_reader.metadata else '',
-                    'author': pdf_reader.metadata.get('/Author', '') if pdf_reader.metadata else '',
-                    'subject': pdf_reader.metadata.get('/Subject', '') if pdf_reader.metadata else '',
-                    'creator': pdf_reader.metadata.get('/Creator', '') if pdf_reader.metadata else '',
-                    'producer': pdf_reader.metadata.get('/Producer', '') if pdf_reader.metadata else '',
-                    'creation_date': pdf_reader.metadata.get('/CreationDate', '') if pdf_reader.metadata else '',
-                    'modification_date': pdf_reader.metadata.get('/ModDate', '') if pdf_reader.metadata else ''
-                }
+                metadata = {}
+                if config.extract_metadata:
+                    metadata = _pdf_metadata(pdf_reader.metadata)
                 
                 # PDF内容を作成
                 pdf_content = PDFContent(
@@ -245,12 +288,13 @@ class FileAdapter(AudioProcessor, PDFProcessor):
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 
-                text = ""
+                pages = pdf_reader.pages
                 start_page = page_range[0] if page_range else 0
-                end_page = page_range[1] if page_range else len(pdf_reader.pages)
+                end_page = page_range[1] if page_range else len(pages)
                 
-                for i in range(start_page, min(end_page, len(pdf_reader.pages))):
-                    text += pdf_reader.pages[i].extract_text() + "\n"
+                text = self._extract_pages_text(
+                    pdf_path, pages, start_page, min(end_page, len(pages))
+                )
                 
                 logger.info(f"PDF text extracted: {pdf_path}")
                 return text
@@ -259,6 +303,51 @@ class FileAdapter(AudioProcessor, PDFProcessor):
             logger.error(f"Failed to extract PDF text: {e}")
             raise
     
+    def _extract_pages_text(
+        self,
+        pdf_path: str,
+        pages: Sequence[Any],
+        start: int,
+        end: int,
+        num_workers: Optional[int] = None
+    ) -> str:
+        """
+        ページ範囲のテキストを抽出する
+        
+        PyPDF2は純Pythonの実装でGILを保持するため、ページ数が多い場合は
+        連続したページ範囲ごとに共有のプロセスプールへ分配し、各プロセスでPDFを開き直して抽出します。
+        
+        Args:
+            pdf_path: PDFファイルパス
+            pages: 開いているPDFのページ（逐次抽出で使用）
+            start: 開始ページ
+            end: 終了ページ（含まない）
+            num_workers: 分割数（Noneの場合は設定値。プールの上限を超えない。1の場合は逐次抽出）
+            
+        Returns:
+            str: ページ順に連結したテキスト
+        """
+        max_workers = num_workers or self.config.get('max_pdf_workers') or MAX_PDF_WORKERS
+        workers = max(1, min(max_workers, MAX_PDF_WORKERS, (end - start) // MIN_PAGES_PER_WORKER))
+        if workers == 1:
+            return "".join(pages[i].extract_text() + "\n" for i in range(start, end))
+        
+        step = -(-(end - start) // workers)
+        bounds = [(s, min(s + step, end)) for s in range(start, end, step)]
+        pool = get_pdf_pool()
+        try:
+            return "".join(pool.map(
+                extract_page_range_text,
+                [pdf_path] * len(bounds),
+                [s for s, _ in bounds],
+                [e for _, e in bounds]
+            ))
+        except BrokenProcessPool:
+            # ワーカーが異常終了した場合は、プールを作り直せるようにしてから逐次抽出する
+            reset_pdf_pool(pool)
+            logger.warning("PDF worker pool broke, falling back to sequential extraction")
+            return "".join(pages[i].extract_text() + "\n" for i in range(start, end))
+    
     def extract_tables(
         self, 
         pdf_path: str,
@@ -297,17 +386,8 @@ class FileAdapter(AudioProcessor, PDFProcessor):
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 
-                metadata = {}
-                if pdf_reader.metadata:
-                    metadata = {
-                        'title': pdf_reader.metadata.get('/Title', ''),
-                        'author': pdf_reader.metadata.get('/Author', ''),
-                        'subject': pdf_reader.metadata.get('/Subject', ''),
-                        'creator': pdf_reader.metadata.get('/Creator', ''),
-                        'producer': pdf_reader.metadata.get('/Producer', ''),
-                        'creation_date': pdf_reader.metadata.get('/CreationDate', ''),
-                        'modification_date': pdf_reader.metadata.get('/ModDate', '')
-                    }
+                info = pdf_reader.metadata
+                metadata = _pdf_metadata(info) if info else {}
                 
                 logger.info(f"PDF metadata extracted: {pdf_path}")
                 return metadata
@@ -350,9 +430,8 @@ class FileAdapter(AudioProcessor, PDFProcessor):
         Returns:
             List[str]: 重要概念のリスト
         """
-        # 簡易実装：実際の実装では、より詳細な概念抽出を行う
-        logger.warning("Key concept extraction from PDF not implemented yet")
-        return []
+        top_k = self.config.get('key_concepts_top_k', 50)
+        return [term for term, _ in _count_pdf_terms(pdf_content).most_common(top_k)]
     
     def analyze_document_structure(
         self, 
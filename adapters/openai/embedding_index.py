@@ -0,0 +1,262 @@
+"""
+埋め込みインデックス
+
+埋め込みベクトルを正規化済みの行列として保持し、コサイン類似度検索を行います。
+"""
+
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple, Callable
+
+import numpy as np
+
+
+DEFAULT_EMBEDDING_DIMENSION = 1536
+
+# int8量子化時に一度に逆量子化する行数（一時バッファの上限）
+_SCAN_BLOCK_ROWS = 4096
+
+
+def normalize_vector(vector) -> np.ndarray:
+    """ベクトルをfloat32に変換してL2正規化する"""
+    v = np.asarray(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(v)
+    if norm > 0:
+        v = v / norm
+    return v
+
+
+def quantize_vector(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """ベクトルを対称int8量子化する（コードとスケールを返す）"""
+    scale = float(np.abs(vector).max()) / 127.0
+    if scale == 0.0:
+        return np.zeros(vector.shape, dtype=np.int8), 1.0
+    codes = np.clip(np.round(vector / scale), -127, 127).astype(np.int8)
+    return codes, scale
+
+
+@lru_cache(maxsize=1)
+def _int8_scan_kernel() -> Optional[Callable]:
+    """
+    int8コードとfloat32クエリの内積をスケール込みで計算するNumbaカーネルを取得
+
+    逆量子化の一時バッファを作らずに行単位で並列計算する。
+    Numba未導入の場合はNoneを返し、NumPyのブロック走査にフォールバックする。
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def scan(codes, scales, query, out):
+        rows, dimension = codes.shape
+        for i in prange(rows):
+            acc = np.float32(0.0)
+            for j in range(dimension):
+                acc += codes[i, j] * query[j]
+            out[i] = acc * scales[i]
+
+    return scan
+
+
+class EmbeddingIndex:
+    """埋め込みベクトルのインデックス"""
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_EMBEDDING_DIMENSION,
+        quantized: bool = False
+    ):
+        """
+        埋め込みインデックスを初期化
+
+        Args:
+            dimension: 埋め込みベクトルの次元数
+            quantized: int8量子化して保持するか（メモリ使用量は約1/4）
+        """
+        self.dimension = dimension
+        self.quantized = quantized
+        self._dtype = np.int8 if quantized else np.float32
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._group_codes: Dict[str, int] = {}
+        self._vectors = np.empty((0, dimension), dtype=self._dtype)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._groups = np.empty(0, dtype=np.int32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def add(self, item_id: str, vector, group: Optional[str] = None) -> None:
+        """
+        ベクトルを追加する（既存IDの場合は上書き）
+
+        Args:
+            item_id: アイテムID
+            vector: 埋め込みベクトル
+            group: 絞り込み用のグループ（分野など）
+        """
+        v = normalize_vector(vector)
+        if v.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimension}, got {v.shape[0]}"
+            )
+
+        position = self._positions.get(item_id)
+        if position is None:
+            position = self._size
+            self._reserve(position + 1)
+            self._ids.append(item_id)
+            self._positions[item_id] = position
+            self._size += 1
+
+        if self.quantized:
+            self._vectors[position], self._scales[position] = quantize_vector(v)
+        else:
+            self._vectors[position] = v
+        self._groups[position] = self._group_code(group)
+
+    def add_quantized(
+        self,
+        item_id: str,
+        codes: bytes,
+        scale: float,
+        group: Optional[str] = None
+    ) -> None:
+        """
+        量子化済みのベクトルを追加する（既存IDの場合は上書き）
+
+        Args:
+            item_id: アイテムID
+            codes: 正規化済みベクトルのint8コード（get_quantizedの戻り値）
+            scale: 量子化スケール
+            group: 絞り込み用のグループ（分野など）
+        """
+        q = np.frombuffer(codes, dtype=np.int8)
+        if not self.quantized:
+            self.add(item_id, q.astype(np.float32) * scale, group)
+            return
+        if q.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimension}, got {q.shape[0]}"
+            )
+
+        position = self._positions.get(item_id)
+        if position is None:
+            position = self._size
+            self._reserve(position + 1)
+            self._ids.append(item_id)
+            self._positions[item_id] = position
+            self._size += 1
+
+        self._vectors[position] = q
+        self._scales[position] = scale
+        self._groups[position] = self._group_code(group)
+
+    def get_quantized(self, item_id: str) -> Optional[Tuple[bytes, float]]:
+        """
+        保持しているベクトルをint8コードとスケールで取得する
+
+        Args:
+            item_id: アイテムID
+
+        Returns:
+            Optional[Tuple[bytes, float]]: (int8コード, スケール)（未登録の場合はNone）
+        """
+        position = self._positions.get(item_id)
+        if position is None:
+            return None
+        if self.quantized:
+            return self._vectors[position].tobytes(), float(self._scales[position])
+        codes, scale = quantize_vector(self._vectors[position])
+        return codes.tobytes(), scale
+
+    def search(
+        self,
+        query,
+        top_k: int = 5,
+        group: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        コサイン類似度の上位k件を検索する
+
+        Args:
+            query: クエリの埋め込みベクトル
+            top_k: 取得する上位k個
+            group: 絞り込み用のグループ（分野など）
+
+        Returns:
+            List[Tuple[str, float]]: (アイテムID, 類似度)のリスト
+        """
+        if self._size == 0 or top_k <= 0:
+            return []
+
+        scores = self._scores(normalize_vector(query))
+
+        if group is not None:
+            code = self._group_codes.get(group)
+            if code is None:
+                return []
+            scores = np.where(self._groups[:self._size] == code, scores, -np.inf)
+
+        k = min(top_k, self._size)
+        if k < self._size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(self._size)
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            (self._ids[i], float(scores[i]))
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+
+    def _scores(self, q: np.ndarray) -> np.ndarray:
+        """全ベクトルとのコサイン類似度を計算"""
+        if not self.quantized:
+            return self._vectors[:self._size] @ q
+
+        scores = np.empty(self._size, dtype=np.float32)
+        kernel = _int8_scan_kernel()
+        if kernel is not None:
+            kernel(self._vectors[:self._size], self._scales[:self._size], q, scores)
+            return scores
+
+        # クエリはfloat32のまま、コードをブロック単位で逆量子化して内積を取る
+        for start in range(0, self._size, _SCAN_BLOCK_ROWS):
+            end = min(start + _SCAN_BLOCK_ROWS, self._size)
+            block = self._vectors[start:end].astype(np.float32)
+            scores[start:end] = (block @ q) * self._scales[start:end]
+        return scores
+
+    def _group_code(self, group: Optional[str]) -> int:
+        """グループ名を整数コードに変換"""
+        if group is None:
+            return -1
+        code = self._group_codes.get(group)
+        if code is None:
+            code = len(self._group_codes)
+            self._group_codes[group] = code
+        return code
+
+    def _reserve(self, capacity: int) -> None:
+        """行列の容量を確保（倍々で拡張）"""
+        current = self._vectors.shape[0]
+        if capacity <= current:
+            return
+
+        new_capacity = max(capacity, current * 2, 64)
+        vectors = np.empty((new_capacity, self.dimension), dtype=self._dtype)
+        vectors[:self._size] = self._vectors[:self._size]
+        scales = np.ones(new_capacity, dtype=np.float32)
+        scales[:self._size] = self._scales[:self._size]
+        groups = np.full(new_capacity, -1, dtype=np.int32)
+        groups[:self._size] = self._groups[:self._size]
+        self._vectors = vectors
+        self._scales = scales
+        self._groups = groups
@@ -0,0 +1,201 @@
+"""
+HNSW埋め込みインデックス
+
+FAISSのHNSWグラフで近似最近傍検索を行う埋め込みインデックスです。
+知識ベースが大きい（1万件以上）場合に、全件走査のEmbeddingIndexの代わりに使います。
+"""
+
+import json
+from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
+from .embedding_index import DEFAULT_EMBEDDING_DIMENSION, normalize_vector, quantize_vector
+
+
+class HNSWEmbeddingIndex:
+    """FAISS HNSWによる埋め込みベクトルのインデックス"""
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_EMBEDDING_DIMENSION,
+        m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64
+    ):
+        """
+        HNSWインデックスを初期化
+
+        Args:
+            dimension: 埋め込みベクトルの次元数
+            m: グラフの各ノードの接続数
+            ef_construction: 構築時の探索幅
+            ef_search: 検索時の探索幅
+
+        Raises:
+            ImportError: faissがインストールされていない場合
+        """
+        import faiss
+
+        self.dimension = dimension
+        # 正規化済みベクトルの内積 = コサイン類似度
+        self._index = faiss.IndexHNSWFlat(dimension, m, faiss.METRIC_INNER_PRODUCT)
+        self._index.hnsw.efConstruction = ef_construction
+        self._index.hnsw.efSearch = ef_search
+        # FAISSの連番ID → アイテムID / グループ（上書きされた古いIDはNone）
+        self._labels: List[Optional[str]] = []
+        self._groups: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def add(self, item_id: str, vector, group: Optional[str] = None) -> None:
+        """
+        ベクトルを追加する（既存IDの場合は上書き）
+
+        HNSWは削除に対応しないため、上書き時は新しいノードを追加し古いノードを無効にする。
+
+        Args:
+            item_id: アイテムID
+            vector: 埋め込みベクトル
+            group: 絞り込み用のグループ（分野など）
+        """
+        v = normalize_vector(vector)
+        if v.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimension}, got {v.shape[0]}"
+            )
+
+        previous = self._positions.get(item_id)
+        if previous is not None:
+            self._labels[previous] = None
+
+        self._index.add(v.reshape(1, -1))
+        self._positions[item_id] = len(self._labels)
+        self._labels.append(item_id)
+        self._groups.append(group)
+
+    def add_quantized(
+        self,
+        item_id: str,
+        codes: bytes,
+        scale: float,
+        group: Optional[str] = None
+    ) -> None:
+        """
+        量子化済みのベクトルを追加する（既存IDの場合は上書き）
+
+        Args:
+            item_id: アイテムID
+            codes: 正規化済みベクトルのint8コード
+            scale: 量子化スケール
+            group: 絞り込み用のグループ（分野など）
+        """
+        q = np.frombuffer(codes, dtype=np.int8)
+        self.add(item_id, q.astype(np.float32) * scale, group)
+
+    def get_quantized(self, item_id: str) -> Optional[Tuple[bytes, float]]:
+        """
+        保持しているベクトルをint8コードとスケールで取得する
+
+        Args:
+            item_id: アイテムID
+
+        Returns:
+            Optional[Tuple[bytes, float]]: (int8コード, スケール)（未登録の場合はNone）
+        """
+        position = self._positions.get(item_id)
+        if position is None:
+            return None
+        codes, scale = quantize_vector(self._index.reconstruct(position))
+        return codes.tobytes(), scale
+
+    def search(
+        self,
+        query,
+        top_k: int = 5,
+        group: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        コサイン類似度の上位k件を近似検索する
+
+        Args:
+            query: クエリの埋め込みベクトル
+            top_k: 取得する上位k個
+            group: 絞り込み用のグループ（分野など）
+
+        Returns:
+            List[Tuple[str, float]]: (アイテムID, 類似度)のリスト
+        """
+        total = self._index.ntotal
+        if total == 0 or top_k <= 0:
+            return []
+
+        q = normalize_vector(query).reshape(1, -1)
+        # 無効ノードやグループ外の結果を除くと件数が減るため、足りなければ取得数を広げる
+        fetch = min(top_k, total)
+        while True:
+            scores, ids = self._index.search(q, fetch)
+            hits = []
+            for position, score in zip(ids[0].tolist(), scores[0].tolist()):
+                if position < 0:
+                    continue
+                item_id = self._labels[position]
+                if item_id is None:
+                    continue
+                if group is not None and self._groups[position] != group:
+                    continue
+                hits.append((item_id, score))
+                if len(hits) == top_k:
+                    return hits
+            if fetch >= total:
+                return hits
+            fetch = min(fetch * 4, total)
+
+    def save(self, path: str) -> None:
+        """
+        インデックスを保存する（アイテムIDは<path>.jsonに保存）
+
+        Args:
+            path: 保存先のパス
+        """
+        import faiss
+
+        faiss.write_index(self._index, path)
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump({"labels": self._labels, "groups": self._groups}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str, ef_search: int = 64) -> 'HNSWEmbeddingIndex':
+        """
+        保存したインデックスを読み込む
+
+        Args:
+            path: saveで指定したパス
+            ef_search: 検索時の探索幅
+
+        Returns:
+            HNSWEmbeddingIndex: 読み込んだインデックス
+        """
+        import faiss
+
+        index = faiss.read_index(path)
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self = cls.__new__(cls)
+        self.dimension = index.d
+        self._index = index
+        self._index.hnsw.efSearch = ef_search
+        self._labels = data["labels"]
+        self._groups = data["groups"]
+        self._positions = {
+            item_id: position
+            for position, item_id in enumerate(self._labels)
+            if item_id is not None
+        }
+        return self
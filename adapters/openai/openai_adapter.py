@@ -5,7 +5,10 @@ OpenAI APIとの連携を実装します。
 """
 
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Iterator
+import httpx
 import openai
 from openai import OpenAI
 
@@ -13,14 +16,119 @@ from core.interfaces.rag_interface import RAGInterface, RAGConfig, KnowledgeItem
 from core.interfaces.text_processor import TextProcessor, TextProcessingConfig
 from core.interfaces.output_generator import OutputGenerator, OutputConfig, OutputFormat
 from core.models.processing_result import ProcessingResult
+from config.presets.preset_manager import compile_rules
 from utils.logging import get_logger
+from .embedding_index import EmbeddingIndex, DEFAULT_EMBEDDING_DIMENSION
+from .hnsw_index import HNSWEmbeddingIndex
+from .semantic_cache import SemanticCache
 
 logger = get_logger(__name__)
 
+# プロンプトの固定部分はモジュール読み込み時に一度だけ構築する
+_RAG_PREFIX = """
+以下のテキストについて、専門的な知識を活用して品質を向上させてください。
+
+テキスト:
+"""
+_RAG_SUFFIX = """
+
+改善のポイント:
+1. 専門用語の正確性
+2. 概念の統一性
+3. 文脈の適切性
+4. 全体的な品質
+
+改善されたテキストを出力してください。
+"""
+_UNIFY_SUFFIX = """
+
+修正のポイント:
+1. 同じ概念を表す用語は統一する
+2. 専門用語の表記を統一する
+3. 理論の体系性を保つ
+4. 文脈に応じた適切な表現を選択する
+
+修正されたテキストを出力してください。
+"""
+_VALIDATE_SUFFIX = """
+
+検証項目:
+1. 専門用語の正確性
+2. 用語の統一性
+3. 文脈に適した用語の使用
+4. 誤字・脱字の有無
+
+検証結果をJSON形式で出力してください。
+"""
+
+
+@lru_cache(maxsize=32)
+def _unify_prefix(domain: str) -> str:
+    """概念統一プロンプトの分野別前半部分"""
+    return f"""
+以下の{domain}分野のテキストについて、概念・理論の統一性を保つように修正してください。
+
+テキスト:
+"""
+
+
+@lru_cache(maxsize=32)
+def _validate_prefix(domain: str) -> str:
+    """用語検証プロンプトの分野別前半部分"""
+    return f"""
+以下の{domain}分野のテキストについて、専門用語の妥当性を検証してください。
+
+テキスト:
+"""
+
+
+@lru_cache(maxsize=32)
+def _expert_system_prompt(domain: str) -> str:
+    """分野別のシステムプロンプト"""
+    return f"あなたは{domain}分野の専門家です。"
+
+
+@lru_cache(maxsize=8)
+def _glossary_matcher(items: frozenset):
+    """用語辞書の一括置換器（同じ内容の辞書は使い回す）"""
+    return compile_rules(dict(items))
+
+
+@lru_cache(maxsize=32)
+def _output_prompt_parts(config: OutputConfig) -> Tuple[str, str]:
+    """出力生成プロンプトの設定依存部分（テキストの前後）"""
+    prefix = f"""
+以下の講義録テキストから、{config.title}の形式で出力を生成してください。
+
+テキスト:
+"""
+    suffix = f"""
+
+出力形式: {config.format.value}
+タイムスタンプを含む: {config.include_timestamps}
+用語集を含む: {config.include_glossary}
+サマリーを含む: {config.include_summary}
+確認問題を含む: {config.include_questions}
+
+適切な形式で出力を生成してください。
+"""
+    return prefix, suffix
+
 
 class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
     """OpenAIアダプター"""
     
+    # タスク別の既定モデル（軽量なタスクは小型モデルに振り分ける）
+    _TASK_MODEL_MAP = {
+        'postprocess': 'gpt-4o-mini',
+        'rag': 'gpt-4o',
+        'unify': 'gpt-4o',
+        'validate': 'gpt-4o-mini',
+        'summary': 'gpt-4o-mini',
+        'questions': 'gpt-4o-mini',
+        'output': 'gpt-4o-mini'
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         OpenAIアダプターを初期化
@@ -30,8 +138,30 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         """
         self.config = config or {}
         self.client = None
+        self._knowledge_items: Dict[str, KnowledgeItem] = {}
+        dimension = self.config.get('embedding_dimension', DEFAULT_EMBEDDING_DIMENSION)
+        self._knowledge_index = self._create_knowledge_index(dimension)
+        self._query_cache: Optional[SemanticCache] = None
+        if self.config.get('semantic_cache', False):
+            self._query_cache = SemanticCache(
+                dimension,
+                threshold=self.config.get('cache_threshold', 0.95),
+                tables=self.config.get('lsh_tables', 16)
+            )
         self._initialize_client()
     
+    def _create_knowledge_index(self, dimension: int):
+        """設定に応じた知識ベースの埋め込みインデックスを作成"""
+        if self.config.get('index_backend', 'flat') == 'hnsw':
+            try:
+                return HNSWEmbeddingIndex(dimension)
+            except ImportError:
+                logger.warning("faiss is not installed, falling back to flat embedding index")
+        return EmbeddingIndex(
+            dimension,
+            quantized=self.config.get('quantize_embeddings', True)
+        )
+    
     def _initialize_client(self):
         """OpenAIクライアントを初期化"""
         try:
@@ -45,7 +175,8 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             self.client = OpenAI(
                 api_key=api_key,
                 base_url=base_url,
-                organization=organization
+                organization=organization,
+                http_client=self._create_http_client()
             )
             
             logger.info("OpenAI client initialized successfully")
@@ -54,6 +185,45 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
     
+    def _model_for(self, task: str) -> str:
+        """
+        タスクに対応するモデル名を取得
+        
+        優先順位: task_models の指定 > model の指定 > タスクごとの既定モデル
+        """
+        task_models = self.config.get('task_models') or {}
+        if task in task_models:
+            return task_models[task]
+        model = self.config.get('model')
+        if model:
+            return model
+        return self._TASK_MODEL_MAP.get(task, 'gpt-4')
+    
+    def _create_http_client(self) -> httpx.Client:
+        """接続プールを調整したHTTPクライアントを作成"""
+        http2 = self.config.get('http2', True)
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 is not installed, falling back to HTTP/1.1")
+                http2 = False
+        
+        return httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self.config.get('max_connections', 200),
+                max_keepalive_connections=self.config.get('max_keepalive_connections', 100),
+                keepalive_expiry=self.config.get('keepalive_expiry', 120)
+            ),
+            timeout=httpx.Timeout(
+                connect=5.0,
+                read=self.config.get('timeout', 30),
+                write=10.0,
+                pool=5.0
+            )
+        )
+    
     # RAGInterface インターフェースの実装
     
     def process_with_rag(
@@ -79,8 +249,9 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             prompt = self._build_rag_prompt(text, config)
             
             # OpenAI APIを呼び出し
+            model = self._model_for('rag')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
                     {"role": "system", "content": "あなたは専門的な講義録の品質向上を支援するAIアシスタントです。"},
                     {"role": "user", "content": prompt}
@@ -90,7 +261,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("RAG processing completed")
+            logger.info(f"RAG processing completed (model: {model})")
             return result
             
         except Exception as e:
@@ -114,9 +285,57 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             List[KnowledgeItem]: 関連知識アイテム
         """
-        # 簡易実装：実際の実装では、ベクトルデータベースを使用
-        logger.warning("Knowledge retrieval not implemented yet")
-        return []
+        return self.retrieve_knowledge_batch([query], domain, top_k)[0]
+    
+    def retrieve_knowledge_batch(
+        self, 
+        queries: Sequence[str],
+        domain: Optional[str] = None,
+        top_k: int = 5
+    ) -> List[List[KnowledgeItem]]:
+        """
+        複数のクエリで知識ベースを検索する（埋め込みは1回のAPI呼び出しにまとめる）
+        
+        Args:
+            queries: 検索クエリのリスト
+            domain: 分野
+            top_k: 取得する上位k個
+            
+        Returns:
+            List[List[KnowledgeItem]]: クエリごとの関連知識アイテム
+        """
+        cache = self._query_cache
+        scope = (domain, top_k)
+        results: List[Optional[List[str]]] = [None] * len(queries)
+        pending = []
+        for i, query in enumerate(queries):
+            if cache is not None:
+                results[i] = cache.get_text(query, scope)
+            if results[i] is None:
+                pending.append(i)
+        
+        try:
+            if pending:
+                vectors = self._embed([queries[i] for i in pending])
+                for i, query_vector in zip(pending, vectors):
+                    item_ids = None
+                    if cache is not None:
+                        item_ids = cache.get(query_vector, scope)
+                    if item_ids is None:
+                        hits = self._knowledge_index.search(query_vector, top_k, group=domain)
+                        item_ids = [item_id for item_id, _ in hits]
+                    if cache is not None:
+                        cache.put(queries[i], query_vector, item_ids, scope)
+                    results[i] = item_ids
+            
+            return [
+                [self._knowledge_items[item_id] for item_id in item_ids]
+                for item_ids in results
+            ]
+            
+        except Exception as e:
+            logger.error(f"Knowledge retrieval failed: {e}")
+            return [[] for _ in queries]
     
     def add_knowledge(
         self, 
@@ -131,9 +350,27 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             bool: 追加の成功/失敗
         """
-        # 簡易実装：実際の実装では、ベクトルデータベースを使用
-        logger.warning("Knowledge addition not implemented yet")
-        return True
+        try:
+            if knowledge_item.quantized_embedding is not None:
+                self._knowledge_index.add_quantized(
+                    knowledge_item.id,
+                    knowledge_item.quantized_embedding,
+                    knowledge_item.scale,
+                    group=knowledge_item.domain
+                )
+            else:
+                vector = self._embed([knowledge_item.content])[0]
+                self._knowledge_index.add(
+                    knowledge_item.id, vector, group=knowledge_item.domain
+                )
+                self._store_quantized_embedding(knowledge_item)
+            self._knowledge_items[knowledge_item.id] = knowledge_item
+            self._invalidate_query_cache()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Knowledge addition failed: {e}")
+            return False
     
     def update_knowledge(
         self, 
@@ -150,9 +387,24 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             bool: 更新の成功/失敗
         """
-        # 簡易実装：実際の実装では、ベクトルデータベースを使用
-        logger.warning("Knowledge update not implemented yet")
-        return True
+        knowledge_item = self._knowledge_items.get(knowledge_id)
+        if knowledge_item is None:
+            logger.warning(f"Knowledge not found: {knowledge_id}")
+            return False
+        
+        try:
+            vector = self._embed([updated_content])[0]
+            self._knowledge_index.add(
+                knowledge_id, vector, group=knowledge_item.domain
+            )
+            knowledge_item.content = updated_content
+            self._store_quantized_embedding(knowledge_item)
+            self._invalidate_query_cache()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Knowledge update failed: {e}")
+            return False
     
     def search_similar_terms(
         self, 
@@ -169,9 +421,22 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             List[Tuple[str, float]]: (用語, 類似度)のリスト
         """
-        # 簡易実装：実際の実装では、埋め込みモデルを使用
-        logger.warning("Similar term search not implemented yet")
-        return []
+        try:
+            term_vector = self._embed([term])[0]
+            hits = self._knowledge_index.search(
+                term_vector,
+                self.config.get('similar_terms_top_k', 10),
+                group=domain
+            )
+            similar_terms = []
+            for item_id, score in hits:
+                item = self._knowledge_items[item_id]
+                similar_terms.append((item.metadata.get('term', item.content), score))
+            return similar_terms
+            
+        except Exception as e:
+            logger.error(f"Similar term search failed: {e}")
+            return []
     
     def unify_concepts(
         self, 
@@ -191,25 +456,13 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             str: 概念統一済みテキスト
         """
         try:
-            prompt = f"""
-以下の{domain}分野のテキストについて、概念・理論の統一性を保つように修正してください。
-
-テキスト:
-{text}
-
-修正のポイント:
-1. 同じ概念を表す用語は統一する
-2. 専門用語の表記を統一する
-3. 理論の体系性を保つ
-4. 文脈に応じた適切な表現を選択する
-
-修正されたテキストを出力してください。
-"""
+            prompt = _unify_prefix(domain) + text + _UNIFY_SUFFIX
             
+            model = self._model_for('unify')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
-                    {"role": "system", "content": f"あなたは{domain}分野の専門家です。"},
+                    {"role": "system", "content": _expert_system_prompt(domain)},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.config.get('temperature', 0.3),
@@ -217,7 +470,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("Concept unification completed")
+            logger.info(f"Concept unification completed (model: {model})")
             return result
             
         except Exception as e:
@@ -240,25 +493,13 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             Dict[str, Any]: 検証結果
         """
         try:
-            prompt = f"""
-以下の{domain}分野のテキストについて、専門用語の妥当性を検証してください。
-
-テキスト:
-{text}
-
-検証項目:
-1. 専門用語の正確性
-2. 用語の統一性
-3. 文脈に適した用語の使用
-4. 誤字・脱字の有無
-
-検証結果をJSON形式で出力してください。
-"""
+            prompt = _validate_prefix(domain) + text + _VALIDATE_SUFFIX
             
+            model = self._model_for('validate')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
-                    {"role": "system", "content": f"あなたは{domain}分野の専門家です。"},
+                    {"role": "system", "content": _expert_system_prompt(domain)},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=self.config.get('temperature', 0.3),
@@ -266,7 +507,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("Terminology validation completed")
+            logger.info(f"Terminology validation completed (model: {model})")
             
             # 簡易実装：実際の実装では、JSONをパース
             return {
@@ -292,9 +533,10 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             List[KnowledgeItem]: 分野別知識
         """
-        # 簡易実装：実際の実装では、ベクトルデータベースを使用
-        logger.warning("Domain knowledge retrieval not implemented yet")
-        return []
+        return [
+            item for item in self._knowledge_items.values()
+            if item.domain == domain
+        ]
     
     # TextProcessor インターフェースの実装
     
@@ -353,8 +595,9 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
 修正されたテキストを出力してください。
 """
             
+            model = self._model_for('postprocess')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
                     {"role": "system", "content": "あなたはテキストの後処理を専門とするAIアシスタントです。"},
                     {"role": "user", "content": prompt}
@@ -364,7 +607,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("Text postprocessing completed")
+            logger.info(f"Text postprocessing completed (model: {model})")
             return result
             
         except Exception as e:
@@ -386,52 +629,15 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         Returns:
             str: 辞書適用済みテキスト
         """
-        # 簡易実装：実際の実装では、より詳細な処理を行う
-        result = text
-        for term, replacement in glossary.items():
-            result = result.replace(term, replacement)
-        return result
-    
-    def unify_concepts(
-        self, 
-        text: str,
-        domain: str,
-        context: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """
-        概念・理論の統一性を保つ
-        
-        Args:
-            text: 処理するテキスト
-            domain: 分野
-            context: 文脈情報
-            
-        Returns:
-            str: 概念統一済みテキスト
-        """
-        # RAGInterfaceの実装を再利用
-        return self.unify_concepts(text, domain, context)
+        if not glossary:
+            return text
+        matcher = _glossary_matcher(frozenset(glossary.items()))
+        if matcher is None:
+            return text
+        return matcher.apply(text)
     
-    def extract_unknown_terms(
-        self, 
-        text: str,
-        known_terms: List[str],
-        top_k: int = 200
-    ) -> List[Tuple[str, int]]:
-        """
-        未知語候補を抽出する
-        
-        Args:
-            text: 処理するテキスト
-            known_terms: 既知の用語リスト
-            top_k: 抽出する上位k個
-            
-        Returns:
-            List[Tuple[str, int]]: (用語, 頻度)のリスト
-        """
-        # 簡易実装：実際の実装では、より詳細な処理を行う
-        logger.warning("Unknown term extraction not implemented yet")
-        return []
+    # unify_concepts はRAGInterfaceの実装をそのまま共有する
+    # extract_unknown_terms はTextProcessorの既定実装を使う
     
     def validate_text_quality(
         self, 
@@ -473,39 +679,103 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             config = OutputConfig()
         
         try:
-            prompt = f"""
-以下の講義録テキストから、{config.title}の形式で出力を生成してください。
-
-テキスト:
-{processing_result.processed_text}
-
-出力形式: {config.format.value}
-タイムスタンプを含む: {config.include_timestamps}
-用語集を含む: {config.include_glossary}
-サマリーを含む: {config.include_summary}
-確認問題を含む: {config.include_questions}
-
-適切な形式で出力を生成してください。
-"""
-            
+            model = self._model_for('output')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
-                messages=[
-                    {"role": "system", "content": "あなたは講義録の出力生成を専門とするAIアシスタントです。"},
-                    {"role": "user", "content": prompt}
-                ],
+                model=model,
+                messages=self._output_messages(processing_result, config),
                 temperature=self.config.get('temperature', 0.3),
                 max_tokens=self.config.get('max_tokens', 4000)
             )
             
             result = response.choices[0].message.content
-            logger.info("Output generation completed")
+            logger.info(f"Output generation completed (model: {model})")
             return result
             
         except Exception as e:
             logger.error(f"Output generation failed: {e}")
             return processing_result.processed_text  # フォールバック
     
+    def _output_messages(
+        self, 
+        processing_result: ProcessingResult,
+        config: OutputConfig
+    ) -> List[Dict[str, str]]:
+        """出力生成用のメッセージを作成"""
+        prefix, suffix = _output_prompt_parts(config)
+        prompt = prefix + processing_result.processed_text + suffix
+        return [
+            {"role": "system", "content": "あなたは講義録の出力生成を専門とするAIアシスタントです。"},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _generate_output_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: OutputConfig
+    ) -> Iterator[str]:
+        """
+        処理結果から出力を生成し、受信した順に断片を返す
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[str]: 生成された出力の断片
+        """
+        emitted = False
+        try:
+            model = self._model_for('output')
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=self._output_messages(processing_result, config),
+                temperature=self.config.get('temperature', 0.3),
+                max_tokens=self.config.get('max_tokens', 4000),
+                stream=True
+            )
+            
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    emitted = True
+                    yield content
+            
+            logger.info(f"Output generation completed (model: {model}, streamed)")
+            
+        except Exception as e:
+            logger.error(f"Output generation failed: {e}")
+            if not emitted:
+                yield processing_result.processed_text  # フォールバック
+    
+    def generate_batch(
+        self, 
+        processing_results: Sequence[ProcessingResult],
+        config: Optional[OutputConfig] = None
+    ) -> List[str]:
+        """
+        複数の処理結果からまとめて出力を生成する
+        
+        同じHTTPクライアント（接続プール）を共有したまま、リクエストを並列に発行します。
+        
+        Args:
+            processing_results: 処理結果のリスト
+            config: 出力設定（全件で共通）
+            
+        Returns:
+            List[str]: 処理結果と同じ順序の出力
+        """
+        if config is None:
+            config = OutputConfig()
+        
+        workers = max(1, min(self.config.get('max_concurrent_requests', 8), len(processing_results)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda result: self.generate_output(result, config),
+                processing_results
+            ))
+    
     def generate_markdown(
         self, 
         processing_result: ProcessingResult,
@@ -526,6 +796,26 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         
         return self.generate_output(processing_result, config)
     
+    def generate_markdown_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: Optional[OutputConfig] = None
+    ) -> Iterator[str]:
+        """
+        Markdown形式の出力を生成された順に分割して返す
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[str]: Markdown形式の出力の断片
+        """
+        if config is None:
+            config = OutputConfig(format=OutputFormat.MARKDOWN)
+        
+        return self._generate_output_stream(processing_result, config)
+    
     def generate_html(
         self, 
         processing_result: ProcessingResult,
@@ -546,6 +836,26 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
         
         return self.generate_output(processing_result, config)
     
+    def generate_html_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: Optional[OutputConfig] = None
+    ) -> Iterator[str]:
+        """
+        HTML形式の出力を生成された順に分割して返す
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[str]: HTML形式の出力の断片
+        """
+        if config is None:
+            config = OutputConfig(format=OutputFormat.HTML)
+        
+        return self._generate_output_stream(processing_result, config)
+    
     def generate_pdf(
         self, 
         processing_result: ProcessingResult,
@@ -595,8 +905,9 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
 サマリーを出力してください。
 """
             
+            model = self._model_for('summary')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
                     {"role": "system", "content": "あなたは講義録のサマリー生成を専門とするAIアシスタントです。"},
                     {"role": "user", "content": prompt}
@@ -606,7 +917,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("Summary generation completed")
+            logger.info(f"Summary generation completed (model: {model})")
             return result
             
         except Exception as e:
@@ -660,8 +971,9 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
 問題を出力してください。
 """
             
+            model = self._model_for('questions')
             response = self.client.chat.completions.create(
-                model=self.config.get('model', 'gpt-4'),
+                model=model,
                 messages=[
                     {"role": "system", "content": "あなたは講義録の確認問題生成を専門とするAIアシスタントです。"},
                     {"role": "user", "content": prompt}
@@ -671,7 +983,7 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
             )
             
             result = response.choices[0].message.content
-            logger.info("Questions generation completed")
+            logger.info(f"Questions generation completed (model: {model})")
             
             # 簡易実装：実際の実装では、問題を分割
             return [result]
@@ -682,18 +994,23 @@ class OpenAIAdapter(RAGInterface, TextProcessor, OutputGenerator):
     
     def _build_rag_prompt(self, text: str, config: RAGConfig) -> str:
         """RAG用のプロンプトを構築"""
-        prompt = f"""
-以下のテキストについて、専門的な知識を活用して品質を向上させてください。
-
-テキスト:
-{text}
-
-改善のポイント:
-1. 専門用語の正確性
-2. 概念の統一性
-3. 文脈の適切性
-4. 全体的な品質
-
-改善されたテキストを出力してください。
-"""
-        return prompt
+        return _RAG_PREFIX + text + _RAG_SUFFIX
+    
+    def _store_quantized_embedding(self, knowledge_item: KnowledgeItem) -> None:
+        """索引に登録した埋め込みをint8コードとして知識アイテムに保持"""
+        knowledge_item.quantized_embedding, knowledge_item.scale = (
+            self._knowledge_index.get_quantized(knowledge_item.id)
+        )
+    
+    def _invalidate_query_cache(self) -> None:
+        """知識ベースの変更時に検索結果キャッシュを破棄"""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+    
+    def _embed(self, texts: List[str]):
+        """テキストを埋め込みベクトルに変換"""
+        response = self.client.embeddings.create(
+            model=self.config.get('embedding_model', 'text-embedding-3-small'),
+            input=texts
+        )
+        return [item.embedding for item in response.data]
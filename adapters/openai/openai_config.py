@@ -4,20 +4,35 @@ OpenAI設定
 OpenAI APIの設定を管理します。
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, Dict, Any, List
 
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class OpenAIConfig:
     """OpenAI設定"""
     api_key: str = ""
-    model: str = "gpt-4"
+    model: Optional[str] = None  # 全タスク共通のモデル（Noneの場合はタスクごとの既定モデル）
     temperature: float = 0.3
     max_tokens: int = 4000
     timeout: int = 30
     base_url: Optional[str] = None
     organization: Optional[str] = None
+    embedding_model: str = "text-embedding-3-small"
+    quantize_embeddings: bool = True
+    index_backend: str = "flat"
+    semantic_cache: bool = False
+    cache_threshold: float = 0.95
+    lsh_tables: int = 16
+    http2: bool = True
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 120.0
+    task_models: Optional[Dict[str, str]] = None
     
     def __post_init__(self):
         """初期化後の処理"""
@@ -27,20 +42,18 @@ class OpenAIConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
-        return {
-            'api_key': self.api_key,
-            'model': self.model,
-            'temperature': self.temperature,
-            'max_tokens': self.max_tokens,
-            'timeout': self.timeout,
-            'base_url': self.base_url,
-            'organization': self.organization
-        }
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'OpenAIConfig':
-        """辞書からインスタンスを作成"""
-        return cls(**data)
+        """辞書からインスタンスを作成（未知のキーは警告して無視）"""
+        unknown = data.keys() - _FIELD_NAME_SET
+        if not unknown:
+            return cls(**data)
+        
+        # 綴り間違いに気付けるよう、無視するキーを警告する
+        logger.warning(f"Ignoring unknown OpenAI config keys: {', '.join(sorted(unknown))}")
+        return cls(**{key: value for key, value in data.items() if key in _FIELD_NAME_SET})
     
     def get_available_models(self) -> List[str]:
         """利用可能なモデル一覧を取得"""
@@ -56,9 +69,14 @@ class OpenAIConfig:
             return False
         
         # モデルの検証
-        if self.model not in self.get_available_models():
+        if self.model is not None and self.model not in self.get_available_models():
             return False
         
+        if self.task_models:
+            for task_model in self.task_models.values():
+                if task_model not in self.get_available_models():
+                    return False
+        
         # 数値パラメータの検証
         if not (0.0 <= self.temperature <= 2.0):
             return False
@@ -69,4 +87,21 @@ class OpenAIConfig:
         if not (1 <= self.timeout <= 300):
             return False
         
+        if not (1 <= self.max_keepalive_connections <= self.max_connections):
+            return False
+        
+        if not (0.0 < self.cache_threshold <= 1.0):
+            return False
+        
+        if self.lsh_tables < 1:
+            return False
+        
+        if self.index_backend not in ("flat", "hnsw"):
+            return False
+        
         return True
+
+
+# フィールド名はクラス定義時に一度だけ取得する
+_FIELD_NAMES = tuple(f.name for f in fields(OpenAIConfig))
+_FIELD_NAME_SET = frozenset(_FIELD_NAMES)
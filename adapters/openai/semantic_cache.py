@@ -0,0 +1,135 @@
+"""
+セマンティックキャッシュ
+
+クエリの埋め込みベクトルをランダム射影LSHでバケット化し、
+コサイン類似度が閾値以上の過去クエリの検索結果を再利用します。
+"""
+
+from typing import Optional, Dict, List, Tuple, Hashable, Any
+
+import numpy as np
+
+from .embedding_index import normalize_vector
+
+
+# 1テーブルあたりのハッシュビット数
+DEFAULT_LSH_BITS = 16
+
+# キャッシュ上限（超えた場合は全エントリを破棄して作り直す）
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class SemanticCache:
+    """埋め込みLSHによるセマンティックキャッシュ"""
+
+    def __init__(
+        self,
+        dimension: int,
+        threshold: float = 0.95,
+        tables: int = 16,
+        bits: int = DEFAULT_LSH_BITS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        seed: int = 0
+    ):
+        """
+        セマンティックキャッシュを初期化
+
+        Args:
+            dimension: 埋め込みベクトルの次元数
+            threshold: ヒットとみなすコサイン類似度の下限
+            tables: LSHテーブル数
+            bits: 1テーブルあたりのハッシュビット数
+            max_entries: 保持するエントリ数の上限
+            seed: 射影ベクトル生成用の乱数シード
+        """
+        self.threshold = threshold
+        self.tables = tables
+        self.bits = bits
+        self.max_entries = max_entries
+        rng = np.random.default_rng(seed)
+        self._projections = rng.standard_normal(
+            (tables * bits, dimension)
+        ).astype(np.float32)
+        self._weights = (1 << np.arange(bits, dtype=np.int64))
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        """全エントリを破棄する"""
+        self._texts: Dict[Tuple[str, Hashable], int] = {}
+        self._buckets: List[Dict[Tuple[int, Hashable], List[int]]] = [
+            {} for _ in range(self.tables)
+        ]
+        self._vectors: List[np.ndarray] = []
+        self._values: List[Any] = []
+
+    def get_text(self, text: str, scope: Hashable = None) -> Optional[Any]:
+        """
+        同一テキストのクエリ結果を取得する（埋め込み計算も省略できる）
+
+        Args:
+            text: クエリテキスト
+            scope: 結果の有効範囲（分野・件数など）
+
+        Returns:
+            Optional[Any]: キャッシュ済みの値（なければNone）
+        """
+        position = self._texts.get((text, scope))
+        return None if position is None else self._values[position]
+
+    def get(self, vector, scope: Hashable = None) -> Optional[Any]:
+        """
+        類似クエリの結果を取得する
+
+        Args:
+            vector: クエリの埋め込みベクトル
+            scope: 結果の有効範囲（分野・件数など）
+
+        Returns:
+            Optional[Any]: キャッシュ済みの値（なければNone）
+        """
+        if not self._values:
+            return None
+
+        v = normalize_vector(vector)
+        candidates = set()
+        for buckets, code in zip(self._buckets, self._hash(v)):
+            candidates.update(buckets.get((code, scope), ()))
+        if not candidates:
+            return None
+
+        # バケット衝突は近似なので、候補は厳密なコサイン類似度で確認する
+        positions = list(candidates)
+        scores = np.stack([self._vectors[i] for i in positions]) @ v
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._values[positions[best]]
+
+    def put(self, text: str, vector, value: Any, scope: Hashable = None) -> None:
+        """
+        クエリ結果を登録する
+
+        Args:
+            text: クエリテキスト
+            vector: クエリの埋め込みベクトル
+            value: キャッシュする値
+            scope: 結果の有効範囲（分野・件数など）
+        """
+        if len(self._values) >= self.max_entries:
+            self.clear()
+
+        v = normalize_vector(vector)
+        position = len(self._values)
+        self._vectors.append(v)
+        self._values.append(value)
+        self._texts[(text, scope)] = position
+        for buckets, code in zip(self._buckets, self._hash(v)):
+            buckets.setdefault((code, scope), []).append(position)
+
+    def _hash(self, v: np.ndarray) -> List[int]:
+        """各テーブルのLSHハッシュ値を計算"""
+        signs = (self._projections @ v > 0).reshape(self.tables, self.bits)
+        return (signs @ self._weights).tolist()
@@ -4,18 +4,29 @@ Pub/Subアダプター
 Cloud Pub/Subとの連携を実装します。
 """
 
-import json
+import itertools
+import os
 import threading
 import time
-from typing import Optional, Dict, Any, List, Callable
-from datetime import datetime
+import zlib
+from time import time_ns
+from collections import deque
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Union, Tuple
 from enum import Enum
 
+import orjson
 from google.cloud import pubsub_v1
 from google.cloud.pubsub_v1 import PublisherClient, SubscriberClient
+from google.cloud.pubsub_v1.publisher.futures import Future
 from google.cloud.pubsub_v1.subscriber.message import Message
+from google.cloud.pubsub_v1.types import BatchSettings, PublisherOptions
+from google.protobuf.json_format import MessageToDict
+from google.pubsub_v1.services.publisher.transports import PublisherGrpcTransport
 
 from utils.logging import get_logger
+from .pubsub_config import PubSubConfig
 
 logger = get_logger(__name__)
 
@@ -28,42 +39,128 @@ class MessageType(Enum):
     SYSTEM_EVENT = "system_event"
 
 
+# メッセージタイプの逆引き表
+_MSG_TYPE_MAP: Dict[str, MessageType] = {m.value: m for m in MessageType}
+
+# gRPCチャネルのオプション（メッセージサイズ上限なし、キープアライブ有効）
+_GRPC_CHANNEL_OPTIONS = [
+    ('grpc.max_send_message_length', -1),
+    ('grpc.max_receive_message_length', -1),
+    ('grpc.keepalive_time_ms', 30000),
+]
+
+# リスニング停止時にストリームの終了を待つ上限（秒）
+_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+# 直近の秒の書式化結果（秒が変わったときだけstrftimeする）
+_timestamp_cache = (0, "1970-01-01T00:00:00")
+
+
+def _iso_utc_now() -> str:
+    """現在のUTC時刻をISO 8601形式（マイクロ秒付き）で取得"""
+    global _timestamp_cache
+    seconds, nanos = divmod(time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+# メッセージエンベロープの固定部分（タイプごとに事前にエンコードしておく）
+_ENVELOPE_PREFIXES: Dict[MessageType, bytes] = {
+    m: b'{"type":' + orjson.dumps(m.value) + b',"data":' for m in MessageType
+}
+_ENVELOPE_SUFFIX = b',"version":"1.0"}'
+
+
+def _encode_envelope(message_type: MessageType, data: Dict[str, Any]) -> bytes:
+    """
+    メッセージエンベロープをエンコード
+    
+    中間の辞書を作らず、dataのJSONを固定部分のバイト列でつなぎ合わせる。
+    出力は {'type', 'data', 'timestamp', 'version'} の辞書をエンコードした場合と同じ。
+    """
+    return b''.join((
+        _ENVELOPE_PREFIXES[message_type],
+        orjson.dumps(data),
+        b',"timestamp":"',
+        _iso_utc_now().encode('ascii'),
+        b'"',
+        _ENVELOPE_SUFFIX
+    ))
+
+
+# バッチハンドラーに渡す要素（データ, 属性, メッセージ）
+BatchItem = Tuple[Dict[str, Any], Dict[str, str], Message]
+
+
 class PubSubAdapter:
     """Pub/Subアダプター"""
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    # メッセージタイプごとの固定属性
+    _LECTURE_ATTRIBUTES = {'message_type': MessageType.LECTURE_PROCESSING.value}
+    _RAG_ATTRIBUTES = {'message_type': MessageType.RAG_PROCESSING.value}
+    _NOTIFICATION_ATTRIBUTES = {'message_type': MessageType.NOTIFICATION.value}
+    
+    def __init__(self, config: Optional[Union[PubSubConfig, Dict[str, Any]]] = None):
         """
         Pub/Subアダプターを初期化
         
         Args:
-            config: Pub/Sub設定
+            config: Pub/Sub設定（辞書形式も受け付ける）
         """
-        self.config = config or {}
+        if config is None:
+            config = PubSubConfig()
+        elif isinstance(config, dict):
+            config = self._from_dict_compat(config)
+        self.config: PubSubConfig = config
         self.publisher = None
+        self._publishers: List[PublisherClient] = []
+        self._publisher_cycle = None
         self.subscriber = None
         self.topic_path = None
         self.subscription_path = None
         self._message_handlers = {}
-        self._running = False
-        self._thread = None
+        self._futures: List[Any] = []
+        self._stream_subscribers: List[SubscriberClient] = []
+        self._handler_pool: Optional[ThreadPoolExecutor] = None
+        self._batch_handlers: Dict[MessageType, Tuple[Callable[[List[BatchItem]], bool], int, float]] = {}
+        self._batches: Dict[MessageType, deque] = {}
+        self._batch_started: Dict[MessageType, float] = {}
+        self._batch_lock = threading.Lock()
+        self._batch_stop = threading.Event()
+        self._batch_thread: Optional[threading.Thread] = None
+        self._pending = set()
+        self._pending_lock = threading.Lock()
         self._initialize_clients()
     
+    @staticmethod
+    def _from_dict_compat(data: Dict[str, Any]) -> PubSubConfig:
+        """辞書形式の設定をPubSubConfigに変換（旧来の呼び出し元向け）"""
+        known_fields = PubSubConfig.__dataclass_fields__
+        return PubSubConfig.from_dict({key: value for key, value in data.items() if key in known_fields})
+    
     def _initialize_clients(self):
         """Pub/Subクライアントを初期化"""
         try:
-            # パブリッシャーを作成
-            self.publisher = PublisherClient()
+            # パブリッシャーを作成（バッチ発行、チャネルごとに1クライアント）
+            # 専用チャネルは複数チャネルを使う場合のみ作成し、エミュレーター利用時は
+            # 接続先・認証情報の設定をクライアントに任せる（各クライアントは個別のチャネルを持つ）
+            channel_pool_size = max(1, self.config.channel_pool_size)
+            dedicated_channel = channel_pool_size > 1 and not os.environ.get("PUBSUB_EMULATOR_HOST")
+            self._publishers = [
+                self._create_publisher(dedicated_channel) for _ in range(channel_pool_size)
+            ]
+            self._publisher_cycle = itertools.cycle(self._publishers)
+            self.publisher = self._publishers[0]
             
             # サブスクライバーを作成
             self.subscriber = SubscriberClient()
             
             # パスを設定
-            project_id = self.config.get('project_id')
-            topic_name = self.config.get('topic_name', 'darwin-topic')
-            subscription_name = self.config.get('subscription_name', 'darwin-subscription')
-            
-            self.topic_path = self.publisher.topic_path(project_id, topic_name)
-            self.subscription_path = self.subscriber.subscription_path(project_id, subscription_name)
+            self.topic_path = self.config.get_topic_path()
+            self.subscription_path = self.config.get_subscription_path()
             
             logger.info(f"Pub/Sub clients initialized: {self.topic_path}")
             
@@ -71,6 +168,33 @@ class PubSubAdapter:
             logger.error(f"Failed to initialize Pub/Sub clients: {e}")
             raise
     
+    def _create_publisher(self, dedicated_channel: bool = False) -> PublisherClient:
+        """
+        パブリッシャーを作成
+        
+        Args:
+            dedicated_channel: チャネルオプションを指定した専用のgRPCチャネルを使うか
+            
+        Returns:
+            PublisherClient: パブリッシャー
+        """
+        batch_settings = BatchSettings(
+            max_messages=self.config.publish_batch_max_messages,
+            max_bytes=self.config.publish_batch_max_bytes,
+            max_latency=self.config.publisher_max_latency_ms / 1000
+        )
+        client_kwargs = dict(
+            batch_settings=batch_settings,
+            publisher_options=PublisherOptions(
+                enable_message_ordering=self.config.enable_message_ordering
+            )
+        )
+        if dedicated_channel:
+            channel = PublisherGrpcTransport.create_channel(options=_GRPC_CHANNEL_OPTIONS)
+            client_kwargs['transport'] = PublisherGrpcTransport(channel=channel)
+        
+        return PublisherClient(**client_kwargs)
+    
     def create_topic(self) -> bool:
         """
         トピックを作成
@@ -106,14 +230,28 @@ class PubSubAdapter:
             if not self.subscriber or not self.subscription_path or not self.topic_path:
                 return False
             
+            request = {
+                'name': self.subscription_path,
+                'topic': self.topic_path,
+                'ack_deadline_seconds': self.config.ack_deadline_seconds,
+                'message_retention_duration': {
+                    'seconds': self.config.message_retention_duration * 24 * 60 * 60  # 日数を秒に変換
+                },
+                'enable_message_ordering': self.config.enable_message_ordering
+            }
+            
+            # デッドレタートピックが設定されている場合は配信試行回数を制限する
+            dead_letter_topic_name = self.config.dead_letter_topic_name
+            if dead_letter_topic_name:
+                request['dead_letter_policy'] = pubsub_v1.types.DeadLetterPolicy(
+                    dead_letter_topic=self.publisher.topic_path(
+                        self.config.project_id, dead_letter_topic_name
+                    ),
+                    max_delivery_attempts=self.config.max_delivery_attempts
+                )
+            
             # サブスクリプションを作成
-            self.subscriber.create_subscription(
-                name=self.subscription_path,
-                topic=self.topic_path,
-                ack_deadline_seconds=self.config.get('ack_deadline_seconds', 600),
-                message_retention_duration=self.config.get('message_retention_duration', 7) * 24 * 60 * 60,  # 日数を秒に変換
-                enable_message_ordering=self.config.get('enable_message_ordering', False)
-            )
+            self.subscriber.create_subscription(request=request)
             logger.info(f"Subscription created: {self.subscription_path}")
             return True
             
@@ -129,53 +267,103 @@ class PubSubAdapter:
         self, 
         message_type: MessageType,
         data: Dict[str, Any],
-        attributes: Optional[Dict[str, str]] = None
-    ) -> Optional[str]:
+        attributes: Optional[Dict[str, str]] = None,
+        flush: bool = False,
+        ordering_key: Optional[str] = None
+    ) -> Optional[Union[str, Future]]:
         """
         メッセージを発行
         
+        発行はバッチ化されるため、既定では完了を待たずにFutureを返します。
+        まとめて完了を待つ場合は flush() を呼び出してください。
+        
         Args:
             message_type: メッセージタイプ
             data: データ
             attributes: 属性
+            flush: Trueの場合は発行完了を待ってメッセージIDを返す
+            ordering_key: 順序キー（メッセージ順序付けが有効な場合のみ使用）
             
         Returns:
-            Optional[str]: メッセージID
+            Optional[Union[str, Future]]: メッセージID（flush=True）または発行中のFuture
         """
         try:
             if not self.publisher or not self.topic_path:
                 return None
             
-            # メッセージデータを作成
-            message_data = {
-                'type': message_type.value,
-                'data': data,
-                'timestamp': datetime.utcnow().isoformat(),
-                'version': '1.0'
-            }
+            # 順序キーは順序付けが有効な場合のみ付与し、同じキーは同じパブリッシャーに送る
+            if ordering_key and self.config.enable_message_ordering:
+                publisher = self._publishers[zlib.crc32(ordering_key.encode('utf-8')) % len(self._publishers)]
+                future = publisher.publish(
+                    self.topic_path,
+                    _encode_envelope(message_type, data),
+                    ordering_key=ordering_key,
+                    **(attributes or {})
+                )
+                # 失敗すると同じキーの発行が停止されるため再開しておく
+                future.add_done_callback(
+                    lambda f: f.exception() and publisher.resume_publish(self.topic_path, ordering_key)
+                )
+            else:
+                future = next(self._publisher_cycle).publish(
+                    self.topic_path,
+                    _encode_envelope(message_type, data),
+                    **(attributes or {})
+                )
             
-            # メッセージを発行
-            future = self.publisher.publish(
-                self.topic_path,
-                json.dumps(message_data).encode('utf-8'),
-                **(attributes or {})
-            )
+            if flush:
+                message_id = future.result()
+                logger.info(f"Message published: {message_id}")
+                return message_id
             
-            message_id = future.result()
-            logger.info(f"Message published: {message_id}")
-            return message_id
+            with self._pending_lock:
+                self._pending.add(future)
+            future.add_done_callback(self._on_publish_done)
+            return future
             
         except Exception as e:
             logger.error(f"Failed to publish message: {e}")
             return None
     
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        発行中のメッセージの完了をまとめて待つ
+        
+        Args:
+            timeout: タイムアウト（秒）
+            
+        Returns:
+            bool: すべての発行が完了したか
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        
+        if not pending:
+            return True
+        
+        done, not_done = futures.wait(pending, timeout=timeout)
+        if not_done:
+            logger.warning(f"Publish flush timed out: {len(not_done)} pending")
+        return not not_done
+    
+    def _on_publish_done(self, future: Future):
+        """発行完了時のコールバック"""
+        with self._pending_lock:
+            self._pending.discard(future)
+        
+        try:
+            logger.debug(f"Message published: {future.result()}")
+        except Exception as e:
+            logger.error(f"Failed to publish message: {e}")
+    
     def publish_lecture_processing_message(
         self, 
         lecture_id: str,
         audio_file_path: str,
         pdf_file_path: Optional[str] = None,
-        domain: str = "general"
-    ) -> Optional[str]:
+        domain: str = "general",
+        flush: bool = False
+    ) -> Optional[Union[str, Future]]:
         """
         講義処理メッセージを発行
         
@@ -184,9 +372,10 @@ class PubSubAdapter:
             audio_file_path: 音声ファイルパス
             pdf_file_path: PDFファイルパス
             domain: 分野
+            flush: Trueの場合は発行完了を待ってメッセージIDを返す
             
         Returns:
-            Optional[str]: メッセージID
+            Optional[Union[str, Future]]: メッセージID（flush=True）または発行中のFuture
         """
         data = {
             'lecture_id': lecture_id,
@@ -196,19 +385,23 @@ class PubSubAdapter:
         }
         
         attributes = {
+            **self._LECTURE_ATTRIBUTES,
             'lecture_id': lecture_id,
-            'domain': domain,
-            'message_type': MessageType.LECTURE_PROCESSING.value
+            'domain': domain
         }
         
-        return self.publish_message(MessageType.LECTURE_PROCESSING, data, attributes)
+        return self.publish_message(
+            MessageType.LECTURE_PROCESSING, data, attributes,
+            flush=flush, ordering_key=lecture_id
+        )
     
     def publish_rag_processing_message(
         self, 
         lecture_id: str,
         text_content: str,
-        domain: str = "general"
-    ) -> Optional[str]:
+        domain: str = "general",
+        flush: bool = False
+    ) -> Optional[Union[str, Future]]:
         """
         RAG処理メッセージを発行
         
@@ -216,9 +409,10 @@ class PubSubAdapter:
             lecture_id: 講義ID
             text_content: テキスト内容
             domain: 分野
+            flush: Trueの場合は発行完了を待ってメッセージIDを返す
             
         Returns:
-            Optional[str]: メッセージID
+            Optional[Union[str, Future]]: メッセージID（flush=True）または発行中のFuture
         """
         data = {
             'lecture_id': lecture_id,
@@ -227,19 +421,20 @@ class PubSubAdapter:
         }
         
         attributes = {
+            **self._RAG_ATTRIBUTES,
             'lecture_id': lecture_id,
-            'domain': domain,
-            'message_type': MessageType.RAG_PROCESSING.value
+            'domain': domain
         }
         
-        return self.publish_message(MessageType.RAG_PROCESSING, data, attributes)
+        return self.publish_message(MessageType.RAG_PROCESSING, data, attributes, flush=flush)
     
     def publish_notification_message(
         self, 
         user_id: str,
         message: str,
-        notification_type: str = "info"
-    ) -> Optional[str]:
+        notification_type: str = "info",
+        flush: bool = False
+    ) -> Optional[Union[str, Future]]:
         """
         通知メッセージを発行
         
@@ -247,9 +442,10 @@ class PubSubAdapter:
             user_id: ユーザーID
             message: メッセージ
             notification_type: 通知タイプ
+            flush: Trueの場合は発行完了を待ってメッセージIDを返す
             
         Returns:
-            Optional[str]: メッセージID
+            Optional[Union[str, Future]]: メッセージID（flush=True）または発行中のFuture
         """
         data = {
             'user_id': user_id,
@@ -258,12 +454,12 @@ class PubSubAdapter:
         }
         
         attributes = {
+            **self._NOTIFICATION_ATTRIBUTES,
             'user_id': user_id,
-            'notification_type': notification_type,
-            'message_type': MessageType.NOTIFICATION.value
+            'notification_type': notification_type
         }
         
-        return self.publish_message(MessageType.NOTIFICATION, data, attributes)
+        return self.publish_message(MessageType.NOTIFICATION, data, attributes, flush=flush)
     
     def register_message_handler(
         self, 
@@ -280,9 +476,39 @@ class PubSubAdapter:
         self._message_handlers[message_type] = handler
         logger.info(f"Message handler registered: {message_type.value}")
     
+    def register_batch_handler(
+        self, 
+        message_type: MessageType,
+        handler: Callable[[List[BatchItem]], bool],
+        max_messages: Optional[int] = None,
+        max_wait_ms: Optional[int] = None
+    ):
+        """
+        バッチハンドラーを登録
+        
+        メッセージは件数が max_messages に達するか、最初のメッセージから
+        max_wait_ms が経過するまで蓄積され、まとめてハンドラーに渡されます。
+        ハンドラーがTrueを返すとバッチ内の全メッセージをACK、Falseなら全てNACKします。
+        
+        Args:
+            message_type: メッセージタイプ
+            handler: (データ, 属性, メッセージ)のリストを受け取るハンドラー関数
+            max_messages: バッチの最大件数
+            max_wait_ms: バッチの最大待ち時間（ミリ秒）
+        """
+        if max_messages is None:
+            max_messages = self.config.batch_max_messages
+        if max_wait_ms is None:
+            max_wait_ms = self.config.batch_max_wait_ms
+        
+        with self._batch_lock:
+            self._batch_handlers[message_type] = (handler, max_messages, max_wait_ms / 1000)
+            self._batches.setdefault(message_type, deque())
+        logger.info(f"Batch handler registered: {message_type.value}")
+    
     def start_listening(self):
-        """メッセージリスニングを開始"""
-        if self._running:
+        """メッセージリスニングを開始（StreamingPull）"""
+        if self._futures:
             logger.warning("Already listening for messages")
             return
         
@@ -290,58 +516,100 @@ class PubSubAdapter:
             logger.error("Subscriber not initialized")
             return
         
-        self._running = True
-        self._thread = threading.Thread(target=self._listen_for_messages)
-        self._thread.start()
-        logger.info("Started listening for messages")
+        # ストリームごとに別チャネルを持つクライアントを用意する
+        parallel_pull_count = max(1, self.config.parallel_pull_count)
+        self._stream_subscribers = [self.subscriber] + [
+            SubscriberClient() for _ in range(parallel_pull_count - 1)
+        ]
+        
+        # フロー制御の上限は全ストリームの合計で守る
+        flow_control = pubsub_v1.types.FlowControl(
+            max_messages=max(1, self.config.max_outstanding_messages // parallel_pull_count),
+            max_bytes=max(1, self.config.max_outstanding_bytes // parallel_pull_count)
+        )
+        
+        # ハンドラーはストリームのコールバックスレッドとは別のプールで実行する
+        self._handler_pool = ThreadPoolExecutor(
+            max_workers=self.config.handler_concurrency,
+            thread_name_prefix='pubsub-handler'
+        )
+        
+        if self._batch_handlers:
+            self._batch_stop.clear()
+            self._batch_thread = threading.Thread(
+                target=self._flush_batches_periodically,
+                name='pubsub-batch-flusher',
+                daemon=True
+            )
+            self._batch_thread.start()
+        
+        self._futures = [
+            subscriber.subscribe(
+                self.subscription_path,
+                callback=self._process_message,
+                flow_control=flow_control
+            )
+            for subscriber in self._stream_subscribers
+        ]
+        logger.info(f"Started listening for messages: {parallel_pull_count} stream(s)")
     
     def stop_listening(self):
         """メッセージリスニングを停止"""
-        self._running = False
-        if self._thread:
-            self._thread.join()
+        if not self._futures:
+            return
+        
+        # キャンセルは即座に反映され、終了待ちは上限付き
+        for future in self._futures:
+            future.cancel()
+        
+        for future in self._futures:
+            try:
+                future.result(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+            except futures.TimeoutError:
+                logger.warning("Timed out waiting for streaming pull shutdown")
+            except Exception as e:
+                logger.debug(f"Streaming pull finished: {e}")
+        
+        # 蓄積中のバッチを処理してからワーカーを停止する
+        if self._batch_thread:
+            self._batch_stop.set()
+            self._batch_thread.join()
+            self._batch_thread = None
+        self._flush_batches(force=True)
+        
+        if self._handler_pool:
+            self._handler_pool.shutdown(wait=True)
+            self._handler_pool = None
+        
+        # 追加で作成したクライアントを閉じる
+        for subscriber in self._stream_subscribers[1:]:
+            subscriber.close()
+        
+        self._futures = []
+        self._stream_subscribers = []
         logger.info("Stopped listening for messages")
     
-    def _listen_for_messages(self):
-        """メッセージをリスニング"""
-        try:
-            while self._running:
-                # メッセージを取得
-                response = self.subscriber.pull(
-                    request={
-                        'subscription': self.subscription_path,
-                        'max_messages': 10
-                    },
-                    timeout=1.0
-                )
-                
-                if not response.received_messages:
-                    continue
-                
-                # メッセージを処理
-                for message in response.received_messages:
-                    self._process_message(message)
-                
-        except Exception as e:
-            logger.error(f"Error listening for messages: {e}")
-    
     def _process_message(self, message: Message):
-        """メッセージを処理"""
+        """メッセージを処理（StreamingPullのコールバック）"""
         try:
             # メッセージデータを解析
-            message_data = json.loads(message.data.decode('utf-8'))
+            message_data = orjson.loads(message.data)
             message_type = message_data.get('type')
             data = message_data.get('data', {})
             attributes = dict(message.attributes)
             
             # メッセージタイプを取得
-            try:
-                msg_type = MessageType(message_type)
-            except ValueError:
+            msg_type = _MSG_TYPE_MAP.get(message_type)
+            if msg_type is None:
                 logger.error(f"Unknown message type: {message_type}")
                 message.ack()
                 return
             
+            # バッチハンドラーが登録されている場合は蓄積する
+            if msg_type in self._batch_handlers:
+                self._enqueue_batch(msg_type, (data, attributes, message))
+                return
+            
             # ハンドラーを取得
             handler = self._message_handlers.get(msg_type)
             if not handler:
@@ -349,23 +617,99 @@ class PubSubAdapter:
                 message.ack()
                 return
             
-            # ハンドラーを実行
-            try:
-                success = handler(data, attributes)
-                if success:
-                    message.ack()
-                    logger.info(f"Message processed successfully: {message.message_id}")
-                else:
-                    message.nack()
-                    logger.warning(f"Message processing failed: {message.message_id}")
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
+            # ハンドラーをワーカースレッドで実行
+            self._handler_pool.submit(self._run_handler, handler, data, attributes, message)
+            
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            message.nack()
+    
+    def _run_handler(
+        self, 
+        handler: Callable[[Dict[str, Any], Dict[str, str]], bool],
+        data: Dict[str, Any],
+        attributes: Dict[str, str],
+        message: Message
+    ):
+        """ハンドラーを実行してACK/NACKする"""
+        try:
+            success = handler(data, attributes)
+            if success:
+                message.ack()
+                logger.info(f"Message processed successfully: {message.message_id}")
+            else:
                 message.nack()
-                
+                logger.warning(f"Message processing failed: {message.message_id}")
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             message.nack()
     
+    def _enqueue_batch(self, msg_type: MessageType, item: BatchItem):
+        """メッセージをバッチに追加し、件数に達したらハンドラーへ渡す"""
+        handler, max_messages, _ = self._batch_handlers[msg_type]
+        
+        with self._batch_lock:
+            batch = self._batches[msg_type]
+            if not batch:
+                self._batch_started[msg_type] = time.monotonic()
+            batch.append(item)
+            
+            if len(batch) < max_messages:
+                return
+            items = list(batch)
+            batch.clear()
+        
+        self._handler_pool.submit(self._run_batch_handler, handler, items)
+    
+    def _flush_batches_periodically(self):
+        """待ち時間を超えたバッチを定期的に処理する"""
+        interval = min(wait for _, _, wait in self._batch_handlers.values())
+        while not self._batch_stop.wait(max(interval / 2, 0.005)):
+            self._flush_batches()
+    
+    def _flush_batches(self, force: bool = False):
+        """待ち時間を超えた（force=Trueの場合は全ての）バッチを処理する"""
+        now = time.monotonic()
+        ready = []
+        
+        with self._batch_lock:
+            for msg_type, batch in self._batches.items():
+                if not batch:
+                    continue
+                handler, _, max_wait = self._batch_handlers[msg_type]
+                if force or now - self._batch_started[msg_type] >= max_wait:
+                    ready.append((handler, list(batch)))
+                    batch.clear()
+        
+        for handler, items in ready:
+            if self._handler_pool:
+                self._handler_pool.submit(self._run_batch_handler, handler, items)
+            else:
+                self._run_batch_handler(handler, items)
+    
+    def _run_batch_handler(
+        self, 
+        handler: Callable[[List[BatchItem]], bool],
+        items: List[BatchItem]
+    ):
+        """バッチハンドラーを実行してまとめてACK/NACKする"""
+        try:
+            success = handler(items)
+        except Exception as e:
+            logger.error(f"Error processing message batch: {e}")
+            success = False
+        
+        for _, _, message in items:
+            if success:
+                message.ack()
+            else:
+                message.nack()
+        
+        if success:
+            logger.info(f"Message batch processed successfully: {len(items)} messages")
+        else:
+            logger.warning(f"Message batch processing failed: {len(items)} messages")
+    
     def get_subscription_info(self) -> Optional[Dict[str, Any]]:
         """
         サブスクリプション情報を取得
@@ -381,13 +725,7 @@ class PubSubAdapter:
                 subscription=self.subscription_path
             )
             
-            return {
-                'name': subscription.name,
-                'topic': subscription.topic,
-                'ack_deadline_seconds': subscription.ack_deadline_seconds,
-                'message_retention_duration': subscription.message_retention_duration.total_seconds(),
-                'enable_message_ordering': subscription.enable_message_ordering
-            }
+            return MessageToDict(subscription._pb, preserving_proto_field_name=True)
             
         except Exception as e:
             logger.error(f"Failed to get subscription info: {e}")
@@ -7,6 +7,13 @@ Cloud Pub/Subの設定を管理します。
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# パブリッシャーのバッチ待ち時間の既定値（ミリ秒）
+_DEFAULT_PUBLISHER_MAX_LATENCY_MS = 100
+
 
 @dataclass
 class PubSubConfig:
@@ -18,7 +25,18 @@ class PubSubConfig:
     message_retention_duration: int = 7  # 日数
     ack_deadline_seconds: int = 600
     max_delivery_attempts: int = 5
+    dead_letter_topic_name: str = ""
     enable_message_ordering: bool = False
+    max_outstanding_messages: int = 1000
+    max_outstanding_bytes: int = 100 * 1024 * 1024  # 100 MiB
+    publisher_max_latency_ms: int = _DEFAULT_PUBLISHER_MAX_LATENCY_MS
+    publish_batch_max_messages: int = 100
+    publish_batch_max_bytes: int = 1_000_000
+    parallel_pull_count: int = 1
+    handler_concurrency: int = 8
+    batch_max_messages: int = 100
+    batch_max_wait_ms: int = 100
+    channel_pool_size: int = 1
     
     def __post_init__(self):
         """初期化後の処理"""
@@ -32,6 +50,24 @@ class PubSubConfig:
         
         if not self.subscription_name:
             self.subscription_name = os.getenv("PUBSUB_SUBSCRIPTION_NAME", "darwin-subscription")
+        
+        if not self.dead_letter_topic_name:
+            self.dead_letter_topic_name = os.getenv("PUBSUB_DEAD_LETTER_TOPIC_NAME", "")
+        
+        # 明示的に指定された値は環境変数で上書きしない
+        if self.publisher_max_latency_ms == _DEFAULT_PUBLISHER_MAX_LATENCY_MS:
+            max_latency_ms = os.getenv("PUBSUB_PUBLISHER_MAX_LATENCY_MS")
+            if max_latency_ms:
+                try:
+                    value = int(max_latency_ms)
+                except ValueError:
+                    value = 0
+                if 1 <= value <= 1000:
+                    self.publisher_max_latency_ms = value
+                else:
+                    logger.warning(
+                        f"Ignoring invalid PUBSUB_PUBLISHER_MAX_LATENCY_MS: {max_latency_ms!r}"
+                    )
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
@@ -43,7 +79,18 @@ class PubSubConfig:
             'message_retention_duration': self.message_retention_duration,
             'ack_deadline_seconds': self.ack_deadline_seconds,
             'max_delivery_attempts': self.max_delivery_attempts,
-            'enable_message_ordering': self.enable_message_ordering
+            'dead_letter_topic_name': self.dead_letter_topic_name,
+            'enable_message_ordering': self.enable_message_ordering,
+            'max_outstanding_messages': self.max_outstanding_messages,
+            'max_outstanding_bytes': self.max_outstanding_bytes,
+            'publisher_max_latency_ms': self.publisher_max_latency_ms,
+            'publish_batch_max_messages': self.publish_batch_max_messages,
+            'publish_batch_max_bytes': self.publish_batch_max_bytes,
+            'parallel_pull_count': self.parallel_pull_count,
+            'handler_concurrency': self.handler_concurrency,
+            'batch_max_messages': self.batch_max_messages,
+            'batch_max_wait_ms': self.batch_max_wait_ms,
+            'channel_pool_size': self.channel_pool_size
         }
     
     @classmethod
@@ -81,8 +128,45 @@ class PubSubConfig:
         if self.ack_deadline_seconds < 10 or self.ack_deadline_seconds > 600:
             return False
         
-        # 最大配信試行回数の検証
-        if self.max_delivery_attempts < 1 or self.max_delivery_attempts > 10:
+        # 最大配信試行回数の検証（デッドレターポリシーを使う場合、Pub/Subの制約は5〜100回）
+        if self.dead_letter_topic_name:
+            if self.max_delivery_attempts < 5 or self.max_delivery_attempts > 100:
+                return False
+        elif self.max_delivery_attempts < 1 or self.max_delivery_attempts > 10:
+            return False
+        
+        # デッドレタートピックの検証
+        if self.dead_letter_topic_name == self.topic_name:
+            return False
+        
+        # フロー制御の検証
+        if self.max_outstanding_messages < 1:
+            return False
+        
+        if self.max_outstanding_bytes < 1024 * 1024:
+            return False
+        
+        # パブリッシャーのバッチ待ち時間の検証
+        if self.publisher_max_latency_ms < 1 or self.publisher_max_latency_ms > 1000:
+            return False
+        
+        # 並列ストリーム数の検証
+        if self.parallel_pull_count < 1 or self.parallel_pull_count > 32:
+            return False
+        
+        # ハンドラー並列数の検証
+        if self.handler_concurrency < 1:
+            return False
+        
+        # 受信バッチの検証
+        if self.batch_max_messages < 1:
+            return False
+        
+        if self.batch_max_wait_ms < 1 or self.batch_max_wait_ms > 60000:
+            return False
+        
+        # gRPCチャネル数の検証
+        if self.channel_pool_size < 1 or self.channel_pool_size > 16:
             return False
         
         return True
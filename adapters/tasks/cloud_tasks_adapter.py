@@ -4,18 +4,27 @@ Cloud Tasksアダプター
 Cloud Tasksとの連携を実装します。
 """
 
-import json
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+import asyncio
+import itertools
+from time import time_ns
+from typing import Optional, Dict, Any, List, Iterator
 from enum import Enum
 
+import orjson
 from google.cloud import tasks_v2
-from google.protobuf import timestamp_pb2
+from google.cloud.tasks_v2.services.cloud_tasks.transports import CloudTasksGrpcTransport
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.timestamp_pb2 import Timestamp
 
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# gRPCチャネルのオプション（キープアライブ有効）
+_GRPC_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+]
+
 
 class TaskPriority(Enum):
     """タスク優先度"""
@@ -36,6 +45,12 @@ class TaskStatus(Enum):
 class CloudTasksAdapter:
     """Cloud Tasksアダプター"""
     
+    # タスク種別ごとの固定ヘッダー
+    _LECTURE_HEADERS = {'X-Task-Type': 'lecture-processing'}
+    _RAG_HEADERS = {'X-Task-Type': 'rag-processing'}
+    _NOTIFICATION_HEADERS = {'X-Task-Type': 'notification'}
+    _BASE_HEADERS = {'Content-Type': 'application/json'}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Cloud Tasksアダプターを初期化
@@ -45,14 +60,31 @@ class CloudTasksAdapter:
         """
         self.config = config or {}
         self.client = None
+        self._clients: List[tasks_v2.CloudTasksClient] = []
+        self._client_cycle = None
+        self._async_client = None
         self.queue_path = None
         self._initialize_client()
     
     def _initialize_client(self):
         """Cloud Tasksクライアントを初期化"""
         try:
-            # クライアントを作成
-            self.client = tasks_v2.CloudTasksClient()
+            # クライアントを作成（チャネルごとに1クライアント）
+            # 1チャネルの場合は接続先・認証情報の設定を既定のクライアント生成に任せる
+            channel_pool_size = max(1, self.config.get('channel_pool_size', 1))
+            if channel_pool_size == 1:
+                self._clients = [tasks_v2.CloudTasksClient()]
+            else:
+                self._clients = [
+                    tasks_v2.CloudTasksClient(
+                        transport=CloudTasksGrpcTransport(
+                            channel=CloudTasksGrpcTransport.create_channel(options=_GRPC_CHANNEL_OPTIONS)
+                        )
+                    )
+                    for _ in range(channel_pool_size)
+                ]
+            self._client_cycle = itertools.cycle(self._clients)
+            self.client = self._clients[0]
             
             # キューパスを設定
             project_id = self.config.get('project_id')
@@ -92,42 +124,10 @@ class CloudTasksAdapter:
             if not self.client or not self.queue_path:
                 raise ValueError("Cloud Tasks client not initialized")
             
-            # ベースURLを取得
-            base_url = self.config.get('base_url', '')
-            if not base_url:
-                raise ValueError("Base URL not configured")
-            
-            # 完全なURLを構築
-            url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-            
-            # リクエストボディを作成
-            if payload:
-                body = json.dumps(payload).encode('utf-8')
-            else:
-                body = b''
+            task = self._build_task(endpoint, payload, delay_seconds, headers)
             
             # タスクを作成
-            task = {
-                'http_request': {
-                    'http_method': tasks_v2.HttpMethod.POST,
-                    'url': url,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        **(headers or {})
-                    },
-                    'body': body
-                }
-            }
-            
-            # スケジュール時間を設定
-            if delay_seconds > 0:
-                schedule_time = datetime.utcnow() + timedelta(seconds=delay_seconds)
-                timestamp = timestamp_pb2.Timestamp()
-                timestamp.FromDatetime(schedule_time)
-                task['schedule_time'] = timestamp
-            
-            # タスクを作成
-            response = self.client.create_task(
+            response = next(self._client_cycle).create_task(
                 parent=self.queue_path,
                 task=task
             )
@@ -140,6 +140,97 @@ class CloudTasksAdapter:
             logger.error(f"Failed to create task: {e}")
             return None
     
+    async def create_tasks_bulk(
+        self, 
+        task_specs: List[Dict[str, Any]],
+        max_concurrency: int = 32
+    ) -> List[Optional[str]]:
+        """
+        複数のタスクを非同期に一括作成
+        
+        非同期クライアントは最初の呼び出し時のイベントループに紐づくため、
+        同じイベントループから呼び出してください。
+        
+        Args:
+            task_specs: タスク定義のリスト（endpoint, payload, delay_seconds, headers）
+            max_concurrency: 同時に発行するリクエスト数の上限
+            
+        Returns:
+            List[Optional[str]]: タスク名のリスト（失敗したタスクはNone）
+        """
+        if not self.queue_path:
+            logger.error("Cloud Tasks client not initialized")
+            return [None] * len(task_specs)
+        
+        if self._async_client is None:
+            self._async_client = tasks_v2.CloudTasksAsyncClient()
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def create_one(spec: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                try:
+                    task = self._build_task(
+                        spec['endpoint'],
+                        spec.get('payload'),
+                        spec.get('delay_seconds', 0),
+                        spec.get('headers')
+                    )
+                    response = await self._async_client.create_task(
+                        parent=self.queue_path,
+                        task=task
+                    )
+                    return response.name
+                except Exception as e:
+                    logger.error(f"Failed to create task: {e}")
+                    return None
+        
+        task_names = await asyncio.gather(*(create_one(spec) for spec in task_specs))
+        created = sum(1 for name in task_names if name)
+        logger.info(f"Tasks created: {created}/{len(task_specs)}")
+        return list(task_names)
+    
+    def _build_task(
+        self, 
+        endpoint: str,
+        payload: Optional[Dict[str, Any]],
+        delay_seconds: int,
+        headers: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """タスク定義を構築"""
+        # ベースURLを取得
+        base_url = self.config.get('base_url', '')
+        if not base_url:
+            raise ValueError("Base URL not configured")
+        
+        # 完全なURLを構築
+        url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        
+        # リクエストボディを作成
+        if payload:
+            body = orjson.dumps(payload)
+        else:
+            body = b''
+        
+        # タスクを作成
+        task = {
+            'http_request': {
+                'http_method': tasks_v2.HttpMethod.POST,
+                'url': url,
+                'headers': {
+                    **self._BASE_HEADERS,
+                    **(headers or {})
+                },
+                'body': body
+            }
+        }
+        
+        # スケジュール時間を設定
+        if delay_seconds > 0:
+            task['schedule_time'] = Timestamp(seconds=time_ns() // 1_000_000_000 + delay_seconds)
+        
+        return task
+    
     def create_lecture_processing_task(
         self, 
         lecture_id: str,
@@ -161,26 +252,55 @@ class CloudTasksAdapter:
         Returns:
             Optional[str]: タスク名
         """
+        return self.create_task(
+            task_name=f"lecture-processing-{lecture_id}",
+            priority=priority,
+            **self._lecture_processing_task_spec(lecture_id, audio_file_path, pdf_file_path, domain)
+        )
+    
+    async def create_lecture_processing_tasks_bulk(
+        self, 
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 32
+    ) -> List[Optional[str]]:
+        """
+        講義処理タスクを非同期に一括作成
+        
+        Args:
+            items: create_lecture_processing_task の引数（lecture_id, audio_file_path, pdf_file_path, domain）の辞書のリスト
+            max_concurrency: 同時に発行するリクエスト数の上限
+            
+        Returns:
+            List[Optional[str]]: タスク名のリスト（失敗したタスクはNone）
+        """
+        task_specs = [self._lecture_processing_task_spec(**item) for item in items]
+        return await self.create_tasks_bulk(task_specs, max_concurrency)
+    
+    def _lecture_processing_task_spec(
+        self, 
+        lecture_id: str,
+        audio_file_path: str,
+        pdf_file_path: Optional[str] = None,
+        domain: str = "general"
+    ) -> Dict[str, Any]:
+        """講義処理タスクの定義を構築"""
         payload = {
             'lecture_id': lecture_id,
             'audio_file_path': audio_file_path,
             'pdf_file_path': pdf_file_path,
-            'domain': domain,
-            'created_at': datetime.utcnow().isoformat()
+            'domain': domain
         }
         
         headers = {
-            'X-Task-Type': 'lecture-processing',
+            **self._LECTURE_HEADERS,
             'X-Lecture-ID': lecture_id
         }
         
-        return self.create_task(
-            task_name=f"lecture-processing-{lecture_id}",
-            endpoint="/api/v1/process-lecture",
-            payload=payload,
-            priority=priority,
-            headers=headers
-        )
+        return {
+            'endpoint': "/api/v1/process-lecture",
+            'payload': payload,
+            'headers': headers
+        }
     
     def create_rag_processing_task(
         self, 
@@ -204,12 +324,11 @@ class CloudTasksAdapter:
         payload = {
             'lecture_id': lecture_id,
             'text_content': text_content,
-            'domain': domain,
-            'created_at': datetime.utcnow().isoformat()
+            'domain': domain
         }
         
         headers = {
-            'X-Task-Type': 'rag-processing',
+            **self._RAG_HEADERS,
             'X-Lecture-ID': lecture_id
         }
         
@@ -243,17 +362,16 @@ class CloudTasksAdapter:
         payload = {
             'user_id': user_id,
             'message': message,
-            'notification_type': notification_type,
-            'created_at': datetime.utcnow().isoformat()
+            'notification_type': notification_type
         }
         
         headers = {
-            'X-Task-Type': 'notification',
+            **self._NOTIFICATION_HEADERS,
             'X-User-ID': user_id
         }
         
         return self.create_task(
-            task_name=f"notification-{user_id}-{int(datetime.utcnow().timestamp())}",
+            task_name=f"notification-{user_id}-{time_ns() // 1_000_000_000}",
             endpoint="/api/v1/send-notification",
             payload=payload,
             priority=priority,
@@ -279,26 +397,8 @@ class CloudTasksAdapter:
             
             task = self.client.get_task(name=task_name)
             
-            return {
-                'name': task.name,
-                'schedule_time': task.schedule_time.ToDatetime().isoformat() if task.schedule_time else None,
-                'create_time': task.create_time.ToDatetime().isoformat() if task.create_time else None,
-                'dispatch_deadline': task.dispatch_deadline.total_seconds() if task.dispatch_deadline else None,
-                'dispatch_count': task.dispatch_count,
-                'response_count': task.response_count,
-                'first_attempt': {
-                    'schedule_time': task.first_attempt.schedule_time.ToDatetime().isoformat() if task.first_attempt.schedule_time else None,
-                    'dispatch_time': task.first_attempt.dispatch_time.ToDatetime().isoformat() if task.first_attempt.dispatch_time else None,
-                    'response_time': task.first_attempt.response_time.ToDatetime().isoformat() if task.first_attempt.response_time else None,
-                    'response_status': task.first_attempt.response_status.code if task.first_attempt.response_status else None
-                } if task.first_attempt else None,
-                'last_attempt': {
-                    'schedule_time': task.last_attempt.schedule_time.ToDatetime().isoformat() if task.last_attempt.schedule_time else None,
-                    'dispatch_time': task.last_attempt.dispatch_time.ToDatetime().isoformat() if task.last_attempt.dispatch_time else None,
-                    'response_time': task.last_attempt.response_time.ToDatetime().isoformat() if task.last_attempt.response_time else None,
-                    'response_status': task.last_attempt.response_status.code if task.last_attempt.response_status else None
-                } if task.last_attempt else None
-            }
+            # 時刻はRFC3339、期間は"600s"形式の文字列で出力される
+            return MessageToDict(task._pb, preserving_proto_field_name=True)
             
         except Exception as e:
             logger.error(f"Failed to get task: {e}")
@@ -307,44 +407,40 @@ class CloudTasksAdapter:
     def list_tasks(
         self, 
         max_results: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
         タスク一覧を取得
         
+        結果は逐次取得されるため、必要な件数だけ読み出せば残りのページは取得されません。
+        
         Args:
             max_results: 最大取得数
             
         Returns:
-            List[Dict[str, Any]]: タスク一覧
+            Iterator[Dict[str, Any]]: タスク情報のイテレーター
         """
         try:
             if not self.client or not self.queue_path:
-                return []
+                return
             
-            tasks = self.client.list_tasks(parent=self.queue_path)
+            tasks = self.client.list_tasks(
+                request={
+                    'parent': self.queue_path,
+                    'page_size': min(max_results, 1000)
+                }
+            )
             
-            task_list = []
-            count = 0
-            for task in tasks:
-                if count >= max_results:
-                    break
-                
-                task_info = {
+            for task in itertools.islice(tasks, max_results):
+                yield {
                     'name': task.name,
                     'schedule_time': task.schedule_time.ToDatetime().isoformat() if task.schedule_time else None,
                     'create_time': task.create_time.ToDatetime().isoformat() if task.create_time else None,
                     'dispatch_count': task.dispatch_count,
                     'response_count': task.response_count
                 }
-                
-                task_list.append(task_info)
-                count += 1
-            
-            return task_list
             
         except Exception as e:
             logger.error(f"Failed to list tasks: {e}")
-            return []
     
     def delete_task(
         self, 
@@ -422,22 +518,7 @@ class CloudTasksAdapter:
             
             queue = self.client.get_queue(name=self.queue_path)
             
-            return {
-                'name': queue.name,
-                'state': queue.state.name,
-                'purge_time': queue.purge_time.ToDatetime().isoformat() if queue.purge_time else None,
-                'rate_limits': {
-                    'max_dispatches_per_second': queue.rate_limits.max_dispatches_per_second,
-                    'max_burst_size': queue.rate_limits.max_burst_size,
-                    'max_concurrent_dispatches': queue.rate_limits.max_concurrent_dispatches
-                },
-                'retry_config': {
-                    'max_attempts': queue.retry_config.max_attempts,
-                    'max_retry_duration': queue.retry_config.max_retry_duration.total_seconds() if queue.retry_config.max_retry_duration else None,
-                    'min_backoff': queue.retry_config.min_backoff.total_seconds() if queue.retry_config.min_backoff else None,
-                    'max_backoff': queue.retry_config.max_backoff.total_seconds() if queue.retry_config.max_backoff else None
-                }
-            }
+            return MessageToDict(queue._pb, preserving_proto_field_name=True)
             
         except Exception as e:
             logger.error(f"Failed to get queue info: {e}")
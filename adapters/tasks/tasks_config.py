@@ -4,11 +4,23 @@
 Cloud Tasksの設定を管理します。
 """
 
+import os
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
 
 
-@dataclass
+# デフォルトのリトライ設定（インスタンス間で共有するため読み取り専用）
+_DEFAULT_RETRY: Mapping[str, Any] = MappingProxyType({
+    'max_attempts': 3,
+    'max_retry_duration': '600s',
+    'min_backoff': '5s',
+    'max_backoff': '60s',
+    'max_doublings': 3
+})
+
+
+@dataclass(slots=True)
 class TasksConfig:
     """タスク管理設定"""
     project_id: str = ""
@@ -17,33 +29,26 @@ class TasksConfig:
     service_account_email: Optional[str] = None
     base_url: str = ""
     timeout_seconds: int = 3600
-    retry_config: Optional[Dict[str, Any]] = None
+    retry_config: Optional[Mapping[str, Any]] = None
+    channel_pool_size: int = 1
     
     def __post_init__(self):
         """初期化後の処理"""
-        import os
-        
         if not self.project_id:
-            self.project_id = os.getenv("GCP_PROJECT_ID", "")
+            self.project_id = os.environ.get("GCP_PROJECT_ID", "")
         
         if not self.queue_name:
-            self.queue_name = os.getenv("TASKS_QUEUE_NAME", "darwin-queue")
+            self.queue_name = os.environ.get("TASKS_QUEUE_NAME", "darwin-queue")
         
         if not self.base_url:
-            self.base_url = os.getenv("TASKS_BASE_URL", "")
+            self.base_url = os.environ.get("TASKS_BASE_URL", "")
         
         if not self.service_account_email:
-            self.service_account_email = os.getenv("TASKS_SERVICE_ACCOUNT_EMAIL")
+            self.service_account_email = os.environ.get("TASKS_SERVICE_ACCOUNT_EMAIL")
         
         # デフォルトのリトライ設定
         if not self.retry_config:
-            self.retry_config = {
-                'max_attempts': 3,
-                'max_retry_duration': '600s',
-                'min_backoff': '5s',
-                'max_backoff': '60s',
-                'max_doublings': 3
-            }
+            self.retry_config = _DEFAULT_RETRY
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
@@ -54,7 +59,8 @@ class TasksConfig:
             'service_account_email': self.service_account_email,
             'base_url': self.base_url,
             'timeout_seconds': self.timeout_seconds,
-            'retry_config': self.retry_config
+            'retry_config': dict(self.retry_config),
+            'channel_pool_size': self.channel_pool_size
         }
     
     @classmethod
@@ -84,4 +90,8 @@ class TasksConfig:
         if self.timeout_seconds < 1 or self.timeout_seconds > 3600:
             return False
         
+        # gRPCチャネル数の検証
+        if self.channel_pool_size < 1 or self.channel_pool_size > 16:
+            return False
+        
         return True
@@ -4,10 +4,15 @@ Whisperアダプター
 Whisper音声認識エンジンとの連携を実装します。
 """
 
+import io
+import os
 import time
-from typing import List, Optional, Dict, Any
+import threading
+import wave
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 from pathlib import Path
 
+import numpy as np
 from faster_whisper import WhisperModel
 
 from core.interfaces.audio_processor import AudioProcessor
@@ -15,10 +20,47 @@ from core.interfaces.transcriber import Transcriber, TranscriptionConfig
 from core.models.audio_data import AudioData
 from core.models.transcription_data import TranscriptionData, TranscriptionSegment
 from utils.logging import get_logger
-from utils.audio_utils import get_audio_metadata, validate_audio_file
+from utils.audio_utils import decode_audio_to_wav, iter_audio_pcm, validate_audio_file
+from .whisper_config import AVAILABLE_MODELS, resolve_compute_type
 
 logger = get_logger(__name__)
 
+# Whisperが入力として受け付けるサンプルレート
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _read_wav_pcm(file_path: str) -> Optional[np.ndarray]:
+    """
+    16kHzモノラル16bitのWAVをメモリマップで読み込む
+    
+    Args:
+        file_path: WAVファイルのパス
+        
+    Returns:
+        Optional[np.ndarray]: float32のPCM（条件に合わない場合はNone）
+    """
+    if Path(file_path).suffix.lower() != '.wav':
+        return None
+    
+    try:
+        with open(file_path, 'rb') as f:
+            wav_file = wave.open(f)
+            if (wav_file.getframerate() != WHISPER_SAMPLE_RATE
+                    or wav_file.getnchannels() != 1
+                    or wav_file.getsampwidth() != 2):
+                return None
+            # ヘッダーを読み終えた位置がdataチャンクの先頭
+            offset = f.tell()
+            frames = wav_file.getnframes()
+        
+        if frames == 0:
+            return None
+        
+        samples = np.memmap(file_path, dtype='<i2', mode='r', offset=offset, shape=(frames,))
+        return samples.astype(np.float32) / 32768.0
+    except (OSError, EOFError, wave.Error, ValueError):
+        return None
+
 
 class WhisperAdapter(AudioProcessor, Transcriber):
     """Whisperアダプター"""
@@ -31,20 +73,56 @@ class WhisperAdapter(AudioProcessor, Transcriber):
             config: Whisper設定
         """
         self.config = config or {}
-        self.model = None
-        self._load_model()
+        self.pipeline = None
+        # モデルは初回利用時に読み込む
+        self._model = None
+        self._model_lock = threading.Lock()
+    
+    @property
+    def model(self) -> WhisperModel:
+        """Whisperモデル（初回アクセス時に読み込み）"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._load_model()
+        return self._model
     
     def _load_model(self):
         """Whisperモデルを読み込み"""
         try:
             model_size = self.config.get('model_size', 'large-v3')
             device = self.config.get('device', 'auto')
-            compute_type = self.config.get('compute_type', 'auto')
+            compute_type = resolve_compute_type(device, self.config.get('compute_type', 'auto'))
+            # num_workers > 1 で複数スレッドからの同時文字起こしが可能になる
+            num_workers = self.config.get('num_workers', 1)
+            cpu_threads = self.config.get('cpu_threads', 0)
+            if cpu_threads <= 0:
+                # FFmpeg用に1コアを残し、残りをワーカーで分け合う
+                cpu_threads = max(1, ((os.cpu_count() or 1) - 1) // num_workers)
             
-            logger.info(f"Loading Whisper model: {model_size}")
-            self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            logger.info(f"Loading Whisper model: {model_size} ({compute_type})")
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=compute_type,
+                num_workers=num_workers,
+                cpu_threads=cpu_threads
+            )
             logger.info("Whisper model loaded successfully")
             
+            # VADで区切った30秒窓をまとめてエンコーダに流すバッチ推論
+            batch_size = self.config.get('batch_size', 8)
+            if batch_size > 1:
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                    self.pipeline = BatchedInferencePipeline(model=model)
+                    logger.info(f"Batched inference enabled (batch_size: {batch_size})")
+                except ImportError:
+                    logger.warning("BatchedInferencePipeline is not available, using sequential inference")
+            
+            # パイプラインの準備が済んでから公開する
+            self._model = model
+            
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
@@ -76,29 +154,15 @@ class WhisperAdapter(AudioProcessor, Transcriber):
             if not is_valid:
                 raise ValueError(f"Invalid input audio file: {error_msg}")
             
-            import ffmpeg
-            
-            # 出力ディレクトリを作成
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # FFmpegを使用して音声を抽出
-            (
-                ffmpeg
-                .input(input_path)
-                .output(
-                    output_path, 
-                    ac=channels,           # チャンネル数
-                    ar=sample_rate,        # サンプルレート
-                    vn=None,               # 動画を無効化
-                    y=None,                # 上書き確認を無効化
-                    af="highpass=f=80,lowpass=f=8000,volume=1.2",  # 音声フィルタ
-                    acodec='pcm_s16le'     # 16bit PCM
-                )
-                .run(quiet=True, overwrite_output=True)
+            # 1回のデコードでWAVとPCMを得る
+            pcm, output_metadata = decode_audio_to_wav(
+                input_path, output_path, sample_rate, channels
             )
             
-            # 出力ファイルのメタデータを取得
-            output_metadata = get_audio_metadata(output_path)
+            # 文字起こしでWAVを再デコードしないよう、PCMを音声データに持たせる
+            samples = None
+            if channels == 1 and sample_rate == WHISPER_SAMPLE_RATE:
+                samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
             
             # 音声データを作成
             audio_data = AudioData(
@@ -110,7 +174,8 @@ class WhisperAdapter(AudioProcessor, Transcriber):
                 bit_depth=output_metadata['bit_depth'],
                 format=output_metadata['format'],
                 created_at=None,
-                metadata=output_metadata['raw_metadata']
+                metadata=output_metadata['raw_metadata'],
+                pcm=samples
             )
             
             logger.info(f"Audio extracted: {input_path} -> {output_path} (duration: {audio_data.duration:.2f}s)")
@@ -120,6 +185,31 @@ class WhisperAdapter(AudioProcessor, Transcriber):
             logger.error(f"Failed to extract audio: {e}")
             raise
     
+    def extract_audio_stream(
+        self, 
+        input_path: str, 
+        sample_rate: int = 16000,
+        channels: int = 1,
+        chunk_frames: int = 16000
+    ) -> Iterator[Any]:
+        """
+        音声ファイルをデコードしながらPCMを順に返す
+        
+        Args:
+            input_path: 入力ファイルパス
+            sample_rate: サンプルレート
+            channels: チャンネル数
+            chunk_frames: 1回に返すフレーム数
+            
+        Returns:
+            Iterator[np.ndarray]: float32 PCMの断片
+        """
+        is_valid, error_msg = validate_audio_file(input_path)
+        if not is_valid:
+            raise ValueError(f"Invalid input audio file: {error_msg}")
+        
+        return iter_audio_pcm(input_path, sample_rate, channels, chunk_frames)
+    
     def preprocess_audio(
         self, 
         audio_data: AudioData,
@@ -140,33 +230,6 @@ class WhisperAdapter(AudioProcessor, Transcriber):
         logger.info("Audio preprocessing completed")
         return audio_data
     
-    def validate_audio(self, audio_data: AudioData) -> bool:
-        """
-        音声データの妥当性を検証する
-        
-        Args:
-            audio_data: 検証する音声データ
-            
-        Returns:
-            bool: 妥当性の結果
-        """
-        try:
-            # 基本的な妥当性チェック
-            if not Path(audio_data.file_path).exists():
-                return False
-            
-            if audio_data.duration < 0.1:  # 0.1秒未満
-                return False
-            
-            if audio_data.sample_rate < 8000:  # サンプルレートが低すぎる
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Audio validation failed: {e}")
-            return False
-    
     def get_audio_info(self, audio_data: AudioData) -> Dict[str, Any]:
         """
         音声データの情報を取得する
@@ -208,26 +271,49 @@ class WhisperAdapter(AudioProcessor, Transcriber):
             config = TranscriptionConfig()
         
         try:
-            # Whisperで文字起こし
-            segments, info = self.model.transcribe(
-                audio_data.file_path,
+            options = dict(
                 language=config.language,
                 beam_size=config.beam_size,
                 best_of=config.best_of,
                 temperature=config.temperature,
                 vad_filter=config.vad_filter,
-                vad_parameters=config.vad_parameters,
+                # faster-whisperはdictのみをVadOptionsに変換するため、共有の読み取り専用マッピングを複製する
+                vad_parameters=dict(config.vad_parameters) if config.vad_parameters is not None else None,
                 word_timestamps=config.word_timestamps,
-                condition_on_previous_text=config.condition_on_previous_text,
                 initial_prompt=config.initial_prompt,
                 compression_ratio_threshold=config.compression_ratio_threshold,
                 log_prob_threshold=config.log_prob_threshold,
                 no_speech_threshold=config.no_speech_threshold,
             )
             
-            # セグメントを変換
+            model = self.model
+            
+            # 抽出済みのPCMがあれば配列のまま渡す
+            audio_input = self._take_pcm(audio_data)
+            
+            # Whisperで文字起こし（バッチ推論はVADによる区切りが前提）
+            if self.pipeline is not None and config.vad_filter:
+                segments, info = self.pipeline.transcribe(
+                    audio_input,
+                    batch_size=self.config.get('batch_size', 8),
+                    **options
+                )
+            else:
+                segments, info = model.transcribe(
+                    audio_input,
+                    condition_on_previous_text=config.condition_on_previous_text,
+                    **options
+                )
+            
+            # セグメントを変換（ジェネレータから逐次受け取り、本文はバッファに書き込む）
             transcription_segments = []
-            full_text_parts = []
+            full_text_buf = io.StringIO()
+            
+            # ループ内での属性・グローバル参照を避ける
+            append = transcription_segments.append
+            write = full_text_buf.write
+            segment_class = TranscriptionSegment
+            language = config.language
             
             for segment in segments:
                 start_time = segment.start if segment.start else 0.0
@@ -235,20 +321,20 @@ class WhisperAdapter(AudioProcessor, Transcriber):
                 text = (segment.text or "").strip()
                 
                 if text:
-                    transcription_segment = TranscriptionSegment(
+                    append(segment_class(
                         start_time=start_time,
                         end_time=end_time,
                         text=text,
-                        confidence=getattr(segment, 'avg_logprob', None),
-                        language=config.language
-                    )
-                    transcription_segments.append(transcription_segment)
-                    full_text_parts.append(text)
+                        confidence=segment.avg_logprob,
+                        language=language
+                    ))
+                    write(text)
+                    write("\n")
             
             # 文字起こしデータを作成
             transcription_data = TranscriptionData(
                 segments=transcription_segments,
-                full_text="\n".join(full_text_parts),
+                full_text=full_text_buf.getvalue().rstrip("\n"),
                 language=config.language,
                 model_used=self.config.get('model_size', 'unknown'),
                 processing_time=0.0,  # 後で設定
@@ -270,6 +356,26 @@ class WhisperAdapter(AudioProcessor, Transcriber):
             logger.error(f"Transcription failed: {e}")
             raise
     
+    def _take_pcm(self, audio_data: AudioData):
+        """
+        文字起こしに渡すPCMを取得する
+        
+        音声データが持つPCMは文字起こし後に不要なため、取り出した時点で手放す。
+        
+        Args:
+            audio_data: 音声データ
+            
+        Returns:
+            PCM配列（WAVとして読み込めない場合はファイルパス）
+        """
+        pcm, audio_data.pcm = audio_data.pcm, None
+        if pcm is not None:
+            return pcm
+        
+        # 保持していない場合も、16kHzモノラルWAVならデコードせずに読み込む
+        samples = _read_wav_pcm(audio_data.file_path)
+        return samples if samples is not None else audio_data.file_path
+    
     def transcribe_with_timestamps(
         self, 
         audio_data: AudioData,
@@ -289,17 +395,14 @@ class WhisperAdapter(AudioProcessor, Transcriber):
         # タイムスタンプは既に含まれている
         return self.transcribe(audio_data, config)
     
-    def get_available_models(self) -> List[str]:
+    def get_available_models(self) -> Tuple[str, ...]:
         """
         利用可能なモデル一覧を取得する
         
         Returns:
-            List[str]: モデル名のリスト
+            Tuple[str, ...]: モデル名のタプル
         """
-        return [
-            "tiny", "tiny.en", "base", "base.en", "small", "small.en",
-            "medium", "medium.en", "large-v1", "large-v2", "large-v3"
-        ]
+        return AVAILABLE_MODELS
     
     def validate_config(self, config: TranscriptionConfig) -> bool:
         """
@@ -5,10 +5,65 @@ Whisperの設定を管理します。
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Mapping
 
+from core.interfaces.transcriber import _DEFAULT_TEMPERATURE, _DEFAULT_VAD
 
-@dataclass
+
+# 利用可能なモデル（一覧用のタプルと、検証用のfrozenset）
+AVAILABLE_MODELS: Tuple[str, ...] = (
+    "tiny", "tiny.en", "base", "base.en", "small", "small.en",
+    "medium", "medium.en", "large-v1", "large-v2", "large-v3"
+)
+_AVAILABLE_MODEL_SET = frozenset(AVAILABLE_MODELS)
+_DEVICES = frozenset({"auto", "cpu", "cuda"})
+_COMPUTE_TYPES = frozenset({"auto", "float16", "int8", "int8_float16"})
+_LANGUAGES = frozenset({"ja", "en", "auto"})
+
+# validate()で検証する (フィールド名, 判定関数) の一覧
+_VALIDATORS = (
+    ('model_size', lambda v: v in _AVAILABLE_MODEL_SET),
+    ('device', lambda v: v in _DEVICES),
+    ('compute_type', lambda v: v in _COMPUTE_TYPES),
+    ('language', lambda v: v in _LANGUAGES),
+    ('beam_size', lambda v: 1 <= v <= 20),
+    ('best_of', lambda v: 1 <= v <= 20),
+    ('compression_ratio_threshold', lambda v: 0.0 <= v <= 10.0),
+    ('log_prob_threshold', lambda v: -2.0 <= v <= 1.0),
+    ('no_speech_threshold', lambda v: 0.0 <= v <= 1.0),
+    ('batch_size', lambda v: 1 <= v <= 64),
+    ('num_workers', lambda v: v >= 1),
+    ('cpu_threads', lambda v: v >= 0),
+)
+
+
+def resolve_compute_type(device: str, compute_type: str = "auto") -> str:
+    """
+    計算タイプを決定する
+    
+    "auto"の場合は、CPUではint8、GPUではint8_float16を使用します。
+    
+    Args:
+        device: デバイス（auto/cpu/cuda）
+        compute_type: 計算タイプ
+        
+    Returns:
+        str: 計算タイプ
+    """
+    if compute_type != "auto":
+        return compute_type
+    
+    if device == "auto":
+        try:
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:
+            device = "cpu"
+    
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+@dataclass(slots=True)
 class WhisperConfig:
     """Whisper設定"""
     model_size: str = "large-v3"
@@ -17,28 +72,30 @@ class WhisperConfig:
     language: str = "ja"
     beam_size: int = 5
     best_of: int = 5
-    temperature: List[float] = None
+    temperature: Optional[Tuple[float, ...]] = None
     vad_filter: bool = True
-    vad_parameters: Optional[Dict[str, Any]] = None
+    vad_parameters: Optional[Mapping[str, Any]] = None
     word_timestamps: bool = True
     condition_on_previous_text: bool = True
     initial_prompt: Optional[str] = None
     compression_ratio_threshold: float = 2.4
     log_prob_threshold: float = -1.0
     no_speech_threshold: float = 0.6
+    batch_size: int = 8
+    num_workers: int = 1
+    cpu_threads: int = 0
     
     def __post_init__(self):
         """初期化後の処理"""
+        self.compute_type = resolve_compute_type(self.device, self.compute_type)
+        
         if self.temperature is None:
-            self.temperature = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+            self.temperature = _DEFAULT_TEMPERATURE
+        elif isinstance(self.temperature, list):
+            self.temperature = tuple(self.temperature)
         
         if self.vad_parameters is None:
-            self.vad_parameters = {
-                'min_silence_duration_ms': 500,
-                'speech_pad_ms': 400,
-                'min_speech_duration_ms': 250,
-                'max_speech_duration_s': 30.0
-            }
+            self.vad_parameters = _DEFAULT_VAD
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
@@ -51,13 +108,16 @@ class WhisperConfig:
             'best_of': self.best_of,
             'temperature': self.temperature,
             'vad_filter': self.vad_filter,
-            'vad_parameters': self.vad_parameters,
+            'vad_parameters': dict(self.vad_parameters),
             'word_timestamps': self.word_timestamps,
             'condition_on_previous_text': self.condition_on_previous_text,
             'initial_prompt': self.initial_prompt,
             'compression_ratio_threshold': self.compression_ratio_threshold,
             'log_prob_threshold': self.log_prob_threshold,
-            'no_speech_threshold': self.no_speech_threshold
+            'no_speech_threshold': self.no_speech_threshold,
+            'batch_size': self.batch_size,
+            'num_workers': self.num_workers,
+            'cpu_threads': self.cpu_threads
         }
     
     @classmethod
@@ -65,45 +125,10 @@ class WhisperConfig:
         """辞書からインスタンスを作成"""
         return cls(**data)
     
-    def get_available_models(self) -> List[str]:
+    def get_available_models(self) -> Tuple[str, ...]:
         """利用可能なモデル一覧を取得"""
-        return [
-            "tiny", "tiny.en", "base", "base.en", "small", "small.en",
-            "medium", "medium.en", "large-v1", "large-v2", "large-v3"
-        ]
+        return AVAILABLE_MODELS
     
     def validate(self) -> bool:
         """設定の妥当性を検証"""
-        # モデルサイズの検証
-        if self.model_size not in self.get_available_models():
-            return False
-        
-        # デバイスの検証
-        if self.device not in ["auto", "cpu", "cuda"]:
-            return False
-        
-        # 計算タイプの検証
-        if self.compute_type not in ["auto", "float16", "int8", "int8_float16"]:
-            return False
-        
-        # 言語の検証
-        if self.language not in ["ja", "en", "auto"]:
-            return False
-        
-        # 数値パラメータの検証
-        if self.beam_size < 1 or self.beam_size > 20:
-            return False
-        
-        if self.best_of < 1 or self.best_of > 20:
-            return False
-        
-        if not (0.0 <= self.compression_ratio_threshold <= 10.0):
-            return False
-        
-        if not (-2.0 <= self.log_prob_threshold <= 1.0):
-            return False
-        
-        if not (0.0 <= self.no_speech_threshold <= 1.0):
-            return False
-        
-        return True
+        return all(check(getattr(self, name)) for name, check in _VALIDATORS)
@@ -4,7 +4,7 @@
 分野別の設定プリセットを管理します。
 """
 
-from .preset_manager import PresetManager
+from .preset_manager import PresetManager, compile_rules
 from .domain_presets import (
     DomainPreset,
     DOMAIN_PRESETS,
@@ -14,6 +14,7 @@ from .domain_presets import (
 
 __all__ = [
     'PresetManager',
+    'compile_rules',
     'DomainPreset',
     'DOMAIN_PRESETS',
     'get_domain_preset',
@@ -4,11 +4,13 @@
 各分野（経済学、会計学等）の設定プリセットを定義します。
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Iterator, Mapping, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainPreset:
     """ドメイン別プリセット"""
     name: str
@@ -17,68 +19,104 @@ class DomainPreset:
     openai_model: str
     temperature: float
     max_tokens: int
-    glossary_files: List[str]
-    rag_sources: List[str]
-    domain_keywords: List[str]
+    glossary_files: Tuple[str, ...]
+    rag_sources: Tuple[str, ...]
+    domain_keywords: Tuple[str, ...]
 
 
-# ドメイン別プリセット定義
-DOMAIN_PRESETS = {
-    "general": DomainPreset(
+# ドメイン別プリセットの定義（インスタンスは初回取得時に生成）
+_PRESET_SPECS: Dict[str, Dict[str, Any]] = {
+    "general": dict(
         name="general",
         description="一般的な講義",
         whisper_model="large-v3",
         openai_model="gpt-4o",
         temperature=0.3,
         max_tokens=4000,
-        glossary_files=["general.csv"],
-        rag_sources=["general_knowledge"],
-        domain_keywords=["講義", "説明", "内容"]
+        glossary_files=("general.csv",),
+        rag_sources=("general_knowledge",),
+        domain_keywords=("講義", "説明", "内容")
     ),
     
-    "economics": DomainPreset(
+    "economics": dict(
         name="economics",
         description="経済学講義",
         whisper_model="large-v3",
         openai_model="gpt-4o",
         temperature=0.2,
         max_tokens=4000,
-        glossary_files=["economics.csv", "accounting_finance.csv"],
-        rag_sources=["economics_knowledge", "company_data"],
-        domain_keywords=["経済", "市場", "需要", "供給", "価格", "GDP", "インフレ"]
+        glossary_files=("economics.csv", "accounting_finance.csv"),
+        rag_sources=("economics_knowledge", "company_data"),
+        domain_keywords=("経済", "市場", "需要", "供給", "価格", "GDP", "インフレ")
     ),
     
-    "accounting": DomainPreset(
+    "accounting": dict(
         name="accounting",
         description="会計学講義",
         whisper_model="large-v3",
         openai_model="gpt-4o",
         temperature=0.2,
         max_tokens=4000,
-        glossary_files=["accounting_finance.csv"],
-        rag_sources=["accounting_standards", "company_data"],
-        domain_keywords=["会計", "財務", "貸借対照表", "損益計算書", "キャッシュフロー"]
+        glossary_files=("accounting_finance.csv",),
+        rag_sources=("accounting_standards", "company_data"),
+        domain_keywords=("会計", "財務", "貸借対照表", "損益計算書", "キャッシュフロー")
     ),
     
-    "corporate_governance": DomainPreset(
+    "corporate_governance": dict(
         name="corporate_governance",
         description="コーポレートガバナンス講義",
         whisper_model="large-v3",
         openai_model="gpt-4o",
         temperature=0.2,
         max_tokens=4000,
-        glossary_files=["corporate_governance.csv"],
-        rag_sources=["corporate_law", "governance_code"],
-        domain_keywords=["ガバナンス", "取締役", "監査", "コンプライアンス", "ステークホルダー"]
+        glossary_files=("corporate_governance.csv",),
+        rag_sources=("corporate_law", "governance_code"),
+        domain_keywords=("ガバナンス", "取締役", "監査", "コンプライアンス", "ステークホルダー")
     )
 }
 
 
+@lru_cache(maxsize=None)
+def _build_preset(domain: str) -> DomainPreset:
+    """プリセットを生成（ドメインごとに一度だけ）"""
+    return DomainPreset(**{
+        key: _intern_value(value) for key, value in _PRESET_SPECS[domain].items()
+    })
+
+
+def _intern_value(value: Any) -> Any:
+    """文字列（タプル内の文字列を含む）をインターンする"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(_intern_value(item) for item in value)
+    return value
+
+
+class _LazyPresetMapping(Mapping):
+    """アクセスされたドメインのプリセットだけを生成するマッピング"""
+    
+    def __getitem__(self, domain: str) -> DomainPreset:
+        if domain not in _PRESET_SPECS:
+            raise KeyError(domain)
+        return _build_preset(domain)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PRESET_SPECS)
+    
+    def __len__(self) -> int:
+        return len(_PRESET_SPECS)
+
+
+# ドメイン別プリセット
+DOMAIN_PRESETS: Mapping[str, DomainPreset] = _LazyPresetMapping()
+
+
 def get_domain_preset(domain: str) -> DomainPreset:
     """ドメイン別プリセットを取得"""
-    return DOMAIN_PRESETS.get(domain, DOMAIN_PRESETS["general"])
+    return _build_preset(domain if domain in _PRESET_SPECS else "general")
 
 
 def list_available_domains() -> List[str]:
     """利用可能なドメイン一覧を取得"""
-    return list(DOMAIN_PRESETS.keys())
+    return list(_PRESET_SPECS.keys())
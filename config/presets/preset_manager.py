@@ -4,13 +4,30 @@
 分野別の設定プリセットを管理します。
 """
 
-from typing import Dict, Any, Optional, List
+import json
+import re
+import sys
+import warnings
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 from dataclasses import dataclass
 
-from ..settings import Settings, WhisperConfig, RAGConfig
+from ..settings import Settings, WhisperConfig, RAGConfig, _DEFAULT_TEMPERATURE
 
 
-@dataclass
+# 分野 → プリセットデータファイル名（config/presets/data/<name>.json）
+_PRESET_FILES: Dict[str, str] = {
+    "会計・財務": "accounting_finance",
+    "技術・工学": "technology",
+    "経済学": "economics",
+}
+
+_PRESET_DATA_DIR = Path(__file__).parent / "data"
+
+
+@dataclass(slots=True, frozen=True)
 class DomainPreset:
     """分野別プリセット"""
     name: str
@@ -18,256 +35,257 @@ class DomainPreset:
     description: str
     whisper_config: Dict[str, Any]
     rag_config: Dict[str, Any]
-    glossary_terms: List[str]
+    glossary_terms: Tuple[str, ...]
     initial_prompt: str
     postprocessing_rules: Dict[str, str]
 
 
-class PresetManager:
-    """プリセット管理"""
+def _dedupe_rules(domain: str, pairs: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    後処理ルールを重複排除して辞書にする
     
-    def __init__(self):
-        """プリセット管理を初期化"""
-        self.presets: Dict[str, DomainPreset] = {}
-        self._load_default_presets()
+    同じ誤変換に異なる置換先が定義されている場合は警告し、後の定義を採用します。
     
-    def _load_default_presets(self):
-        """デフォルトプリセットを読み込み"""
-        # 会計・財務プリセット
-        self.presets["会計・財務"] = DomainPreset(
-            name="会計・財務",
-            domain="会計・財務",
-            description="会計・財務分野の講義用プリセット",
-            whisper_config={
-                "model_size": "large-v3",
-                "beam_size": 5,
-                "best_of": 5,
-                "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                "initial_prompt": "これは会計・財務の講義です。専門用語が多く含まれています。"
-            },
-            rag_config={
-                "use_mygpt": True,
-                "use_chatgpt": True,
-                "confidence_threshold": 0.8,
-                "max_context_length": 4000
-            },
-            glossary_terms=[
-                "財務報告", "純利益", "純資産", "基準", "成果", "投資",
-                "事業遂行", "構築", "相対的", "一括管理", "金融投資",
-                "確実", "保有者", "サイミュレーション", "定義", "注目",
-                "経営", "減損", "利益", "正しい", "確実性", "チャプター",
-                "概念フレームワーク", "財務報告", "投資者", "企業価値",
-                "開示", "ポジション", "価値", "解釈", "構成要素", "各項目",
-                "法規制", "特定期間", "変動", "報告主体", "5年間", "オプション",
-                "取引", "リスク", "解放", "期待された", "実際", "確定",
-                "キャッシュフロー", "裏付け", "事実", "事業投資", "責任",
-                "遂行を通じて", "独立", "資産", "拡大", "事実として",
-                "観点", "基づいて", "識別", "事業遂行上", "構成価値",
-                "確保", "時価", "変動", "利益", "確実", "投資", "事業目的",
-                "構築", "保有者", "値上がり", "期待", "価値", "変動事実",
-                "として", "リスク", "解放", "ものとなる", "また", "金融投資",
-                "時価", "変動", "基づいて", "相対的", "認識", "ため", "時価",
-                "評価", "サイミュレーション", "構成要素", "定義", "注目",
-                "項目", "認識", "基礎", "経営", "減損", "少なくとも", "一方",
-                "利益", "経営", "定義", "満たした", "項目", "財務諸表情",
-                "認識対象", "正しい", "加え", "一定程度", "発生可能性",
-                "確実性", "求められる"
-            ],
-            initial_prompt="これは会計・財務の講義です。専門用語が多く含まれています。",
-            postprocessing_rules={
-                "罪務": "財務",
-                "罪有者": "所有者",
-                "創数": "総数",
-                "順利益": "純利益",
-                "順次": "純資産",
-                "基隣": "基準",
-                "正化": "成果",
-                "通し": "投資",
-                "事業水行": "事業遂行",
-                "構測": "構築",
-                "相影気": "相対的",
-                "一区限管": "一括管理",
-                "金入通し": "金融投資",
-                "確保": "確保",
-                "確讆": "確実",
-                "通証儒": "投資",
-                "保養師": "保有者",
-                "調子": "投資",
-                "ザイミューショーション": "サイミュレーション",
-                "ザイミューショー": "サイミュレーション",
-                "提議": "定義",
-                "注束": "注目",
-                "経役": "経営",
-                "減速": "減損",
-                "理想": "利益",
-                "経験": "経営",
-                "正じる": "正しい",
-                "格好外全性": "確実性",
-                "チャプターさん": "チャプター",
-                "概念フレームワーク": "概念フレームワーク",
-                "罪務法国": "財務報告",
-                "当時者": "投資者",
-                "企業性化": "企業価値",
-                "企業化地": "企業価値",
-                "解除": "開示",
-                "ポジション": "ポジション",
-                "性化": "価値",
-                "解じ": "解釈",
-                "構成予測": "構成要素",
-                "各個法規": "各項目",
-                "法規に刺激": "法規制",
-                "特定期間": "特定期間",
-                "銅石さん": "投資者",
-                "辺道学": "変動",
-                "法国主体": "報告主体",
-                "5月間": "5年間",
-                "オプション": "オプション",
-                "とり引き": "取引",
-                "リスク": "リスク",
-                "開放": "解放",
-                "通しの正化": "投資の成果",
-                "報告したい": "報告主体",
-                "期待された": "期待された",
-                "実実": "実際",
-                "確定": "確定",
-                "キャッシュフロー": "キャッシュフロー",
-                "裏付け": "裏付け",
-                "事店": "事実",
-                "事業通し": "事業投資",
-                "先役": "責任",
-                "水行通じて": "遂行を通じて",
-                "エルコード": "エルコード",
-                "リスクに構測": "リスクに構築",
-                "どくりつ": "独立",
-                "子さん": "資産",
-                "拡足": "拡大",
-                "事実を思って": "事実として",
-                "キャッシュフロー": "キャッシュフロー",
-                "角度": "観点",
-                "もとついて": "基づいて",
-                "相影気": "相対的",
-                "しき": "識別",
-                "一区限管": "一括管理",
-                "金入通し": "金融投資",
-                "事業水行上": "事業遂行上",
-                "先役": "責任",
-                "構成価値": "構成価値",
-                "確保": "確保",
-                "時間": "時価",
-                "変動": "変動",
-                "利益": "利益",
-                "確讆": "確実",
-                "通証儒": "投資",
-                "事業目的": "事業目的",
-                "構測": "構築",
-                "保養師": "保有者",
-                "値上がり": "値上がり",
-                "期待": "期待",
-                "調子": "投資",
-                "価値": "価値",
-                "変動事実": "変動事実",
-                "思って": "として",
-                "リスク": "リスク",
-                "開放": "解放",
-                "ものとなる": "ものとなる",
-                "また": "また",
-                "金融通締": "金融投資",
-                "時間": "時価",
-                "変動": "変動",
-                "もとついて": "基づいて",
-                "相影気": "相対的",
-                "認識": "認識",
-                "ため": "ため",
-                "時間": "時価",
-                "評価": "評価",
-                "ザイミューショーション": "サイミュレーション",
-                "ザイミューショー": "サイミュレーション",
-                "構成様子": "構成要素",
-                "提議": "定義",
-                "注束": "注目",
-                "項目": "項目",
-                "認識": "認識",
-                "きそ": "基礎",
-                "経役": "経営",
-                "減速": "減損",
-                "少なくとも": "少なくとも",
-                "一方": "一方",
-                "理想": "利益",
-                "経験": "経営",
-                "提議": "定義",
-                "見たした": "満たした",
-                "項目": "項目",
-                "罪務所表情": "財務諸表情",
-                "認識対象": "認識対象",
-                "正じる": "正しい",
-                "くわえ": "加え",
-                "一定程度": "一定程度",
-                "発生可能性": "発生可能性",
-                "格好外全性": "確実性",
-                "求められる": "求められる"
-            }
-        )
+    Args:
+        domain: 分野
+        pairs: (誤変換, 正しい表記)のペア
         
-        # 技術・工学プリセット
-        self.presets["技術・工学"] = DomainPreset(
-            name="技術・工学",
-            domain="技術・工学",
-            description="技術・工学分野の講義用プリセット",
-            whisper_config={
-                "model_size": "large-v3",
-                "beam_size": 5,
-                "best_of": 5,
-                "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                "initial_prompt": "これは技術・工学の講義です。専門用語が多く含まれています。"
-            },
-            rag_config={
-                "use_mygpt": True,
-                "use_chatgpt": True,
-                "confidence_threshold": 0.8,
-                "max_context_length": 4000
-            },
-            glossary_terms=[
-                "アルゴリズム", "データ構造", "プログラミング", "ソフトウェア",
-                "ハードウェア", "ネットワーク", "セキュリティ", "データベース",
-                "機械学習", "人工知能", "クラウド", "コンテナ", "マイクロサービス"
-            ],
-            initial_prompt="これは技術・工学の講義です。専門用語が多く含まれています。",
-            postprocessing_rules={}
+    Returns:
+        Dict[str, str]: 後処理ルール
+    """
+    rules: Dict[str, str] = {}
+    for src, dst in pairs:
+        previous = rules.get(src)
+        if previous is not None and previous != dst:
+            warnings.warn(f"Conflicting postprocessing rule in {domain}: {src} -> {previous} / {dst}")
+        rules[src] = dst
+    return rules
+
+
+def _unique_terms(terms: Iterable[str]) -> Tuple[str, ...]:
+    """用語リストを出現順を保ったまま重複排除する"""
+    return tuple(dict.fromkeys(terms))
+
+
+def _intern_json(value: Any) -> Any:
+    """
+    JSONから読み込んだ値の文字列をインターンする
+    
+    JSONデコーダーは同じ文字列でもファイルごとに別オブジェクトを生成するため、
+    分野間で共通するモデル名・設定キー・用語を同一オブジェクトにまとめます。
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_json(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _load_preset_data(name: str) -> Dict[str, Any]:
+    """プリセットデータファイルを読み込む（プロセス内で一度だけ）"""
+    path = _PRESET_DATA_DIR / f"{name}.json"
+    return _intern_json(json.loads(path.read_text(encoding="utf-8")))
+
+
+def _build_whisper_config(data: Dict[str, Any]) -> Dict[str, Any]:
+    """プリセットのWhisper設定を生成（温度列はタプルにし、既定値なら共有する）"""
+    config = dict(data)
+    temperature = config.get("temperature")
+    if isinstance(temperature, list):
+        temperature = tuple(temperature)
+        config["temperature"] = (
+            _DEFAULT_TEMPERATURE if temperature == _DEFAULT_TEMPERATURE else temperature
         )
+    return config
+
+
+def _build_preset(data: Dict[str, Any]) -> DomainPreset:
+    """プリセットデータからDomainPresetを生成"""
+    return DomainPreset(
+        name=data["name"],
+        domain=data["domain"],
+        description=data["description"],
+        whisper_config=_build_whisper_config(data["whisper_config"]),
+        rag_config=dict(data["rag_config"]),
+        glossary_terms=_unique_terms(data["glossary_terms"]),
+        initial_prompt=data["initial_prompt"],
+        postprocessing_rules=_dedupe_rules(data["domain"], data["postprocessing_rules"])
+    )
+
+
+RuleIndex = Dict[str, List[Tuple[str, str]]]
+
+
+def _build_rule_index(rules: Dict[str, str]) -> RuleIndex:
+    """
+    後処理ルールを先頭文字ごとにまとめた索引を作成する
+    
+    置換元と置換先が同じルールは何もしないため除外し、
+    各グループ内は長いルールから並べます（最長一致を優先するため）。
+    
+    Args:
+        rules: 後処理ルール
+        
+    Returns:
+        RuleIndex: 先頭文字 → (誤変換, 正しい表記)のリスト
+    """
+    index: RuleIndex = defaultdict(list)
+    for src, dst in sorted(rules.items(), key=lambda item: len(item[0]), reverse=True):
+        if src and src != dst:
+            index[src[0]].append((src, dst))
+    return dict(index)
+
+
+class _RegexRuleMatcher:
+    """正規表現による後処理ルールの一括置換（pyahocorasick未導入時のフォールバック）"""
+    
+    def __init__(self, index: RuleIndex):
+        self._rules = {src: dst for group in index.values() for src, dst in group}
+        # 先頭文字で分岐する形にまとめ、各位置で試す候補を同じ先頭文字のルールに絞る
+        alternatives = []
+        for first, group in index.items():
+            suffixes = "|".join(re.escape(src[1:]) for src, _ in group)
+            alternatives.append(f"{re.escape(first)}(?:{suffixes})")
+        self._pattern = re.compile("|".join(alternatives))
+    
+    def apply(self, text: str) -> str:
+        rules = self._rules
+        return self._pattern.sub(lambda m: rules[m.group(0)], text)
+
+
+class _AhoCorasickRuleMatcher:
+    """Aho-Corasickオートマトンによる後処理ルールの一括置換"""
+    
+    def __init__(self, index: RuleIndex):
+        import ahocorasick
         
-        # 経済学プリセット
-        self.presets["経済学"] = DomainPreset(
-            name="経済学",
-            domain="経済学",
-            description="経済学分野の講義用プリセット",
-            whisper_config={
-                "model_size": "large-v3",
-                "beam_size": 5,
-                "best_of": 5,
-                "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                "initial_prompt": "これは経済学の講義です。専門用語が多く含まれています。"
-            },
-            rag_config={
-                "use_mygpt": True,
-                "use_chatgpt": True,
-                "confidence_threshold": 0.8,
-                "max_context_length": 4000
-            },
-            glossary_terms=[
-                "需要", "供給", "価格", "市場", "GDP", "インフレ", "失業",
-                "財政政策", "金融政策", "経済成長", "ミクロ経済学", "マクロ経済学"
-            ],
-            initial_prompt="これは経済学の講義です。専門用語が多く含まれています。",
-            postprocessing_rules={}
+        automaton = ahocorasick.Automaton()
+        for group in index.values():
+            for src, dst in group:
+                automaton.add_word(src, (len(src), dst))
+        automaton.make_automaton()
+        self._automaton = automaton
+    
+    def apply(self, text: str) -> str:
+        parts = []
+        position = 0
+        # 重ならない最長一致を左から順に取り出す
+        for end_index, (length, replacement) in self._automaton.iter_long(text):
+            start = end_index - length + 1
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end_index + 1
+        if not parts:
+            return text
+        parts.append(text[position:])
+        return "".join(parts)
+
+
+class _HyperscanRuleMatcher:
+    """Hyperscan（SIMDによる複数パターン照合）による後処理ルールの一括置換"""
+    
+    def __init__(self, index: RuleIndex):
+        import hyperscan
+        
+        rules = [(src.encode("utf-8"), dst.encode("utf-8")) for group in index.values() for src, dst in group]
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(src.decode("utf-8")).encode("utf-8") for src, _ in rules],
+            ids=list(range(len(rules))),
+            elements=len(rules),
+            flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(rules)
         )
+        self._database = database
+        self._replacements = [dst for _, dst in rules]
+    
+    def apply(self, text: str) -> str:
+        data = text.encode("utf-8")
+        matches: List[Tuple[int, int, int]] = []
+        
+        def on_match(rule_id, start, end, flags, context):
+            matches.append((start, -end, rule_id))
+        
+        self._database.scan(data, match_event_handler=on_match)
+        if not matches:
+            return text
+        
+        # 全一致から、重ならない最長一致を左から順に選ぶ
+        matches.sort()
+        replacements = self._replacements
+        parts = []
+        position = 0
+        for start, neg_end, rule_id in matches:
+            if start < position:
+                continue
+            parts.append(data[position:start])
+            parts.append(replacements[rule_id])
+            position = -neg_end
+        parts.append(data[position:])
+        return b"".join(parts).decode("utf-8")
+
+
+# 置換器の優先順（未導入のライブラリは飛ばし、最後は正規表現にフォールバック）
+_RULE_MATCHERS = (_HyperscanRuleMatcher, _AhoCorasickRuleMatcher)
+
+
+def compile_rules(rules: Dict[str, str]) -> Optional[Any]:
+    """
+    置換ルールを一括置換器にコンパイルする
+    
+    テキストを1回走査するだけで全ルールを適用し、重なる候補は最長一致を優先します。
+    
+    Args:
+        rules: 置換元 → 置換先の辞書
+        
+    Returns:
+        Optional[Any]: apply(text)を持つ置換器（有効なルールがない場合はNone）
+    """
+    return _compile_rule_index(_build_rule_index(rules))
+
+
+def _compile_rule_index(index: RuleIndex) -> Optional[Any]:
+    """ルール索引から利用可能な最速の置換器を作成"""
+    if not index:
+        return None
+    for matcher_class in _RULE_MATCHERS:
+        try:
+            return matcher_class(index)
+        except ImportError:
+            continue
+    return _RegexRuleMatcher(index)
+
+
+class PresetManager:
+    """プリセット管理"""
+    
+    def __init__(self):
+        """プリセット管理を初期化"""
+        # 生成済みのプリセット（初回取得時にデータファイルから生成）
+        self.presets: Dict[str, DomainPreset] = {}
+        # 分野ごとの後処理ルールの索引と、コンパイル済みの置換器
+        self._rule_index: Dict[str, RuleIndex] = {}
+        self._compiled_rules: Dict[str, Any] = {}
+        # 用語の所属判定用
+        self._glossary_sets: Dict[str, frozenset] = {}
     
     def get_preset(self, domain: str) -> Optional[DomainPreset]:
         """指定分野のプリセットを取得"""
-        return self.presets.get(domain)
+        preset = self.presets.get(domain)
+        if preset is None:
+            name = _PRESET_FILES.get(domain)
+            if name is None:
+                return None
+            preset = _build_preset(_load_preset_data(name))
+            self.presets[domain] = preset
+            self._glossary_sets[domain] = frozenset(preset.glossary_terms)
+        return preset
     
     def list_presets(self) -> List[str]:
         """利用可能なプリセット一覧を取得"""
-        return list(self.presets.keys())
+        return list(_PRESET_FILES.keys())
     
     def apply_preset(self, settings: Settings, domain: str) -> Settings:
         """プリセットを設定に適用"""
@@ -275,28 +293,78 @@ class PresetManager:
         if not preset:
             raise ValueError(f"Preset not found for domain: {domain}")
         
-        # Whisper設定を適用
-        for key, value in preset.whisper_config.items():
-            if hasattr(settings.whisper, key):
-                setattr(settings.whisper, key, value)
+        # Whisper設定を適用（設定クラスに存在するフィールドのみ）
+        whisper_config = preset.whisper_config
+        for key in WhisperConfig._FIELDS & whisper_config.keys():
+            setattr(settings.whisper, key, whisper_config[key])
         
         # RAG設定を適用
-        for key, value in preset.rag_config.items():
-            if hasattr(settings.rag, key):
-                setattr(settings.rag, key, value)
+        rag_config = preset.rag_config
+        for key in RAGConfig._FIELDS & rag_config.keys():
+            setattr(settings.rag, key, rag_config[key])
         
         return settings
     
-    def get_glossary_terms(self, domain: str) -> List[str]:
+    def get_glossary_terms(self, domain: str) -> Tuple[str, ...]:
         """分野別の用語リストを取得"""
         preset = self.get_preset(domain)
         if not preset:
-            return []
+            return ()
         return preset.glossary_terms
     
+    def has_glossary_term(self, domain: str, term: str) -> bool:
+        """用語が分野別の用語リストに含まれるかを判定"""
+        if self.get_preset(domain) is None:
+            return False
+        return term in self._glossary_sets[domain]
+    
     def get_postprocessing_rules(self, domain: str) -> Dict[str, str]:
         """分野別の後処理ルールを取得"""
         preset = self.get_preset(domain)
         if not preset:
             return {}
         return preset.postprocessing_rules
+    
+    def precompile_rules(self, domains: Optional[Iterable[str]] = None) -> None:
+        """
+        後処理ルールの置換器を事前に構築する
+        
+        常駐プロセスの起動時に呼び出すと、最初の文字起こしでのコンパイルを避けられます。
+        
+        Args:
+            domains: 対象の分野（省略時は全分野）
+        """
+        for domain in (domains if domains is not None else _PRESET_FILES):
+            self._get_rule_matcher(domain)
+    
+    def apply_rules(self, domain: str, text: str) -> str:
+        """
+        分野別の後処理ルールを文字起こしテキストに適用する
+        
+        全ルールを1回の走査で置換します（重なる場合は最長一致を優先）。
+        
+        Args:
+            domain: 分野
+            text: 文字起こしテキスト
+            
+        Returns:
+            str: 置換後のテキスト
+        """
+        matcher = self._get_rule_matcher(domain)
+        if matcher is None:
+            return text
+        return matcher.apply(text)
+    
+    def _get_rule_matcher(self, domain: str) -> Optional[Any]:
+        """分野別の置換器を取得（ルールがない分野はNone）"""
+        matcher = self._compiled_rules.get(domain)
+        if matcher is None:
+            index = self._rule_index.get(domain)
+            if index is None:
+                index = _build_rule_index(self.get_postprocessing_rules(domain))
+                self._rule_index[domain] = index
+            matcher = _compile_rule_index(index)
+            if matcher is None:
+                return None
+            self._compiled_rules[domain] = matcher
+        return matcher
@@ -5,12 +5,70 @@
 """
 
 import os
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from dataclasses import dataclass, field, fields, asdict
 from pathlib import Path
 
 
-@dataclass
+# 作成済みのディレクトリ（プロセス内で一度だけmkdirする）
+_dirs_created: set = set()
+
+# Whisperの温度フォールバック列（不変のため全インスタンス・プリセットで共有する）
+_DEFAULT_TEMPERATURE: Tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+# 真とみなす環境変数の値
+_TRUE_SET = frozenset({"1", "true", "yes", "on"})
+
+
+def _to_bool(value: str) -> bool:
+    """環境変数の文字列を真偽値に変換"""
+    return value.strip().lower() in _TRUE_SET
+
+
+# 環境変数と設定項目の対応表（環境変数名, 設定のパス, 変換関数）
+_ENV_MAP: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    # Whisper設定
+    ("WHISPER_MODEL", "whisper.model", str),
+    ("WHISPER_DEVICE", "whisper.device", str),
+    ("WHISPER_COMPUTE_TYPE", "whisper.compute_type", str),
+    ("WHISPER_BATCH_SIZE", "whisper.batch_size", int),
+    ("WHISPER_NUM_WORKERS", "whisper.num_workers", int),
+    ("WHISPER_CPU_THREADS", "whisper.cpu_threads", int),
+    # OpenAI設定
+    ("OPENAI_API_KEY", "openai.api_key", str),
+    ("OPENAI_MODEL", "openai.model", str),
+    ("OPENAI_TEMPERATURE", "openai.temperature", float),
+    ("OPENAI_MAX_TOKENS", "openai.max_tokens", int),
+    # MyGPT設定
+    ("MYGPT_API_KEY", "mygpt.api_key", str),
+    ("MYGPT_MODEL", "mygpt.model", str),
+    ("MYGPT_TEMPERATURE", "mygpt.temperature", float),
+    ("MYGPT_MAX_TOKENS", "mygpt.max_tokens", int),
+    # RAG設定
+    ("RAG_USE_MYGPT", "rag.use_mygpt", _to_bool),
+    ("RAG_USE_CHATGPT", "rag.use_chatgpt", _to_bool),
+    ("RAG_KNOWLEDGE_BASE_PATH", "rag.knowledge_base_path", str),
+    # ストレージ設定
+    ("OUTPUT_DIR", "storage.output_dir", str),
+    ("TEMP_DIR", "storage.temp_dir", str),
+    ("BACKUP_DIR", "storage.backup_dir", str),
+    # ログ設定
+    ("LOG_LEVEL", "logging.level", str),
+    ("LOG_FILE_PATH", "logging.file_path", str),
+    # プロジェクト設定
+    ("DEBUG", "debug", _to_bool),
+)
+
+
+def _set_attr_path(obj: Any, attr_path: str, value: Any) -> None:
+    """ドット区切りのパスで属性を設定"""
+    *parents, name = attr_path.split(".")
+    for parent in parents:
+        obj = getattr(obj, parent)
+    setattr(obj, name, value)
+
+
+@dataclass(slots=True)
 class WhisperConfig:
     """Whisper設定"""
     model: str = "large-v3"
@@ -19,9 +77,12 @@ class WhisperConfig:
     language: str = "ja"
     beam_size: int = 5
     best_of: int = 5
-    temperature: List[float] = field(default_factory=lambda: [0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+    temperature: Tuple[float, ...] = _DEFAULT_TEMPERATURE
     vad_filter: bool = True
     word_timestamps: bool = True
+    batch_size: int = 8
+    num_workers: int = 1
+    cpu_threads: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
@@ -34,15 +95,22 @@ class WhisperConfig:
             'best_of': self.best_of,
             'temperature': self.temperature,
             'vad_filter': self.vad_filter,
-            'word_timestamps': self.word_timestamps
+            'word_timestamps': self.word_timestamps,
+            'batch_size': self.batch_size,
+            'num_workers': self.num_workers,
+            'cpu_threads': self.cpu_threads
         }
 
 
-@dataclass
+# プリセット適用時に参照するフィールド名の集合
+WhisperConfig._FIELDS = frozenset(f.name for f in fields(WhisperConfig))
+
+
+@dataclass(slots=True)
 class OpenAIConfig:
     """OpenAI設定"""
     api_key: str = ""
-    model: str = "gpt-4"
+    model: Optional[str] = None  # 全タスク共通のモデル（Noneの場合はタスクごとの既定モデル）
     temperature: float = 0.3
     max_tokens: int = 4000
     timeout: int = 30
@@ -58,7 +126,7 @@ class OpenAIConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGConfig:
     """RAG設定"""
     use_mygpt: bool = True
@@ -78,7 +146,10 @@ class RAGConfig:
         }
 
 
-@dataclass
+RAGConfig._FIELDS = frozenset(f.name for f in fields(RAGConfig))
+
+
+@dataclass(slots=True)
 class StorageConfig:
     """ストレージ設定"""
     output_dir: str = "./output"
@@ -98,7 +169,7 @@ class StorageConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """ログ設定"""
     level: str = "INFO"
@@ -118,7 +189,7 @@ class LoggingConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MyGPTConfig:
     """MyGPT設定"""
     api_key: str = ""
@@ -138,7 +209,7 @@ class MyGPTConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """全体設定"""
     whisper: WhisperConfig = field(default_factory=WhisperConfig)
@@ -160,39 +231,11 @@ class Settings:
     
     def _load_from_environment(self):
         """環境変数から設定を読み込み"""
-        # Whisper設定
-        self.whisper.model = os.getenv("WHISPER_MODEL", self.whisper.model)
-        self.whisper.device = os.getenv("WHISPER_DEVICE", self.whisper.device)
-        self.whisper.compute_type = os.getenv("WHISPER_COMPUTE_TYPE", self.whisper.compute_type)
-        
-        # OpenAI設定
-        self.openai.api_key = os.getenv("OPENAI_API_KEY", self.openai.api_key)
-        self.openai.model = os.getenv("OPENAI_MODEL", self.openai.model)
-        self.openai.temperature = float(os.getenv("OPENAI_TEMPERATURE", str(self.openai.temperature)))
-        self.openai.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", str(self.openai.max_tokens)))
-        
-        # MyGPT設定
-        self.mygpt.api_key = os.getenv("MYGPT_API_KEY", self.mygpt.api_key)
-        self.mygpt.model = os.getenv("MYGPT_MODEL", self.mygpt.model)
-        self.mygpt.temperature = float(os.getenv("MYGPT_TEMPERATURE", str(self.mygpt.temperature)))
-        self.mygpt.max_tokens = int(os.getenv("MYGPT_MAX_TOKENS", str(self.mygpt.max_tokens)))
-        
-        # RAG設定
-        self.rag.use_mygpt = os.getenv("RAG_USE_MYGPT", "true").lower() == "true"
-        self.rag.use_chatgpt = os.getenv("RAG_USE_CHATGPT", "true").lower() == "true"
-        self.rag.knowledge_base_path = os.getenv("RAG_KNOWLEDGE_BASE_PATH")
-        
-        # ストレージ設定
-        self.storage.output_dir = os.getenv("OUTPUT_DIR", self.storage.output_dir)
-        self.storage.temp_dir = os.getenv("TEMP_DIR", self.storage.temp_dir)
-        self.storage.backup_dir = os.getenv("BACKUP_DIR", self.storage.backup_dir)
-        
-        # ログ設定
-        self.logging.level = os.getenv("LOG_LEVEL", self.logging.level)
-        self.logging.file_path = os.getenv("LOG_FILE_PATH")
-        
-        # プロジェクト設定
-        self.debug = os.getenv("DEBUG", "false").lower() == "true"
+        for env_key, attr_path, cast in _ENV_MAP:
+            raw = os.environ.get(env_key)
+            if raw is None:
+                continue
+            _set_attr_path(self, attr_path, cast(raw))
     
     def _validate_settings(self):
         """設定の妥当性を検証"""
@@ -201,51 +244,31 @@ class Settings:
             print("Warning: OPENAI_API_KEY not set, ChatGPT features will be disabled")
         
         # ディレクトリの作成
-        for dir_path in [self.storage.output_dir, self.storage.temp_dir, self.storage.backup_dir]:
-            Path(dir_path).mkdir(parents=True, exist_ok=True)
+        for dir_path in (self.storage.output_dir, self.storage.temp_dir, self.storage.backup_dir):
+            if dir_path not in _dirs_created:
+                Path(dir_path).mkdir(parents=True, exist_ok=True)
+                _dirs_created.add(dir_path)
     
     def get_whisper_config(self) -> Dict[str, Any]:
         """Whisper設定を辞書形式で取得"""
-        return {
-            'model_size': self.whisper.model,
-            'device': self.whisper.device,
-            'compute_type': self.whisper.compute_type,
-            'language': self.whisper.language,
-            'beam_size': self.whisper.beam_size,
-            'best_of': self.whisper.best_of,
-            'temperature': self.whisper.temperature,
-            'vad_filter': self.whisper.vad_filter,
-            'word_timestamps': self.whisper.word_timestamps
-        }
+        return self.whisper.to_dict()
     
     def get_openai_config(self) -> Dict[str, Any]:
         """OpenAI設定を辞書形式で取得"""
-        return {
-            'api_key': self.openai.api_key,
-            'model': self.openai.model,
-            'temperature': self.openai.temperature,
-            'max_tokens': self.openai.max_tokens,
-            'timeout': self.openai.timeout
-        }
+        return self.openai.to_dict()
     
     def get_rag_config(self) -> Dict[str, Any]:
         """RAG設定を辞書形式で取得"""
-        return {
-            'use_mygpt': self.rag.use_mygpt,
-            'use_chatgpt': self.rag.use_chatgpt,
-            'knowledge_base_path': self.rag.knowledge_base_path,
-            'confidence_threshold': self.rag.confidence_threshold,
-            'max_context_length': self.rag.max_context_length
-        }
+        return self.rag.to_dict()
     
     def to_dict(self) -> Dict[str, Any]:
         """設定を辞書形式で取得"""
         return {
-            'whisper': self.whisper.__dict__,
-            'openai': self.openai.__dict__,
-            'rag': self.rag.__dict__,
-            'storage': self.storage.__dict__,
-            'logging': self.logging.__dict__,
+            'whisper': asdict(self.whisper),
+            'openai': asdict(self.openai),
+            'rag': asdict(self.rag),
+            'storage': asdict(self.storage),
+            'logging': asdict(self.logging),
             'project_name': self.project_name,
             'version': self.version,
             'debug': self.debug
@@ -5,64 +5,71 @@
 """
 
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+
+def _env_snapshot(names: Tuple[str, ...]) -> Tuple[Optional[str], ...]:
+    """指定した環境変数の現在値を取得"""
+    environ = os.environ
+    return tuple(environ.get(name) for name in names)
+
+
+def _missing_vars(names: Tuple[str, ...], snapshot: Tuple[Optional[str], ...]) -> Tuple[str, ...]:
+    """未設定の環境変数を抽出"""
+    return tuple(name for name, value in zip(names, snapshot) if not value)
+
+
+_CLOUDFLARE_VARS = ('CLOUDFLARE_API_TOKEN', 'CLOUDFLARE_ZONE_ID', 'CLOUDFLARE_DOMAIN')
+_GCP_VARS = ('GCP_PROJECT_ID', 'GCP_REGION')
 
 
 class ConfigValidator:
     """設定値の検証クラス"""
     
     def __init__(self):
-        self.required_vars = [
+        self.required_vars = (
             'OPENAI_API_KEY',
             'GCP_PROJECT_ID',
             'GCP_REGION'
-        ]
+        )
         
-        self.optional_vars = [
+        self.optional_vars = (
             'CLOUDFLARE_API_TOKEN',
             'CLOUDFLARE_ZONE_ID',
             'VERCEL_ORG_ID',
             'VERCEL_PROJECT_ID'
-        ]
+        )
     
     def validate_required_vars(self) -> List[str]:
         """必須環境変数の検証"""
-        missing_vars = []
-        for var in self.required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        return missing_vars
+        names = tuple(self.required_vars)
+        return list(_missing_vars(names, _env_snapshot(names)))
     
     def validate_optional_vars(self) -> List[str]:
         """オプション環境変数の検証"""
-        missing_vars = []
-        for var in self.optional_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        return missing_vars
+        names = tuple(self.optional_vars)
+        return list(_missing_vars(names, _env_snapshot(names)))
     
     def validate_all(self) -> Dict[str, Any]:
         """全設定値の検証"""
-        required_missing = self.validate_required_vars()
-        optional_missing = self.validate_optional_vars()
+        required = tuple(self.required_vars)
+        optional = tuple(self.optional_vars)
+        # 必須・オプションを1回のスナップショットで判定する
+        snapshot = _env_snapshot(required + optional)
+        split = len(required)
+        required_missing = _missing_vars(required, snapshot[:split])
+        optional_missing = _missing_vars(optional, snapshot[split:])
         
         return {
-            'required_missing': required_missing,
-            'optional_missing': optional_missing,
-            'is_valid': len(required_missing) == 0
+            'required_missing': list(required_missing),
+            'optional_missing': list(optional_missing),
+            'is_valid': not required_missing
         }
     
     def validate_cloudflare_config(self) -> bool:
         """CloudFlare設定の検証"""
-        api_token = os.getenv('CLOUDFLARE_API_TOKEN')
-        zone_id = os.getenv('CLOUDFLARE_ZONE_ID')
-        domain = os.getenv('CLOUDFLARE_DOMAIN')
-        
-        return bool(api_token and zone_id and domain)
+        return all(_env_snapshot(_CLOUDFLARE_VARS))
     
     def validate_gcp_config(self) -> bool:
         """GCP設定の検証"""
-        project_id = os.getenv('GCP_PROJECT_ID')
-        region = os.getenv('GCP_REGION')
-        
-        return bool(project_id and region)
+        return all(_env_snapshot(_GCP_VARS))
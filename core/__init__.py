@@ -9,31 +9,53 @@ Darwin プロジェクト - コア機能層
 - models: データモデル定義
 """
 
-from .interfaces import (
-    AudioProcessor,
-    Transcriber,
-    TextProcessor,
-    OutputGenerator,
-    RAGInterface,
-    PDFProcessor
-)
-
-from .services import (
-    AudioService,
-    TranscriptionService,
-    TextProcessingService,
-    OutputService,
-    RAGService,
-    PDFAnalysisService
-)
-
-from .models import (
-    AudioData,
-    TranscriptionData,
-    ProcessingResult,
-    LectureRecord,
-    MasterText
-)
+import importlib
+from typing import Any, Dict, Tuple
+
+# 公開名 → 定義元のサブパッケージ（初回参照時にインポートする）
+# サービス層は音声・PDF・RAG関連の重いライブラリを読み込むため、
+# `import core` の時点では読み込まない
+_LAZY: Dict[str, Tuple[str, str]] = {
+    # Interfaces
+    'AudioProcessor': ('.interfaces', 'AudioProcessor'),
+    'Transcriber': ('.interfaces', 'Transcriber'),
+    'TextProcessor': ('.interfaces', 'TextProcessor'),
+    'OutputGenerator': ('.interfaces', 'OutputGenerator'),
+    'RAGInterface': ('.interfaces', 'RAGInterface'),
+    'PDFProcessor': ('.interfaces', 'PDFProcessor'),
+    
+    # Services
+    'AudioService': ('.services', 'AudioService'),
+    'TranscriptionService': ('.services', 'TranscriptionService'),
+    'TextProcessingService': ('.services', 'TextProcessingService'),
+    'OutputService': ('.services', 'OutputService'),
+    'RAGService': ('.services', 'RAGService'),
+    'PDFAnalysisService': ('.services', 'PDFAnalysisService'),
+    
+    # Models
+    'AudioData': ('.models', 'AudioData'),
+    'TranscriptionData': ('.models', 'TranscriptionData'),
+    'ProcessingResult': ('.models', 'ProcessingResult'),
+    'LectureRecord': ('.models', 'LectureRecord'),
+    'MasterText': ('.models', 'MasterText'),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """公開名を初回参照時にインポートする（PEP 562）"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """公開名の一覧（遅延読み込み分を含む）"""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Interfaces
@@ -8,7 +8,7 @@
 from .audio_processor import AudioProcessor
 from .transcriber import Transcriber
 from .text_processor import TextProcessor
-from .output_generator import OutputGenerator
+from .output_generator import OutputGenerator, OutputConfig, CustomStyles
 from .rag_interface import RAGInterface
 from .pdf_processor import PDFProcessor
 
@@ -17,6 +17,8 @@ __all__ = [
     'Transcriber',
     'TextProcessor',
     'OutputGenerator',
+    'OutputConfig',
+    'CustomStyles',
     'RAGInterface',
     'PDFProcessor'
 ]
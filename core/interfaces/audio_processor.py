@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Iterator
 from pathlib import Path
 
 from ..models.audio_data import AudioData
@@ -36,6 +36,54 @@ class AudioProcessor(ABC):
         """
         pass
     
+    def extract_audio_batch(
+        self, 
+        input_output_pairs: Sequence[Tuple[str, str]],
+        sample_rate: int = 16000,
+        channels: int = 1
+    ) -> List[AudioData]:
+        """
+        複数の音声ファイルからまとめて音声データを抽出する
+        
+        既定の実装は1件ずつ extract_audio を呼び出します。
+        
+        Args:
+            input_output_pairs: (入力ファイルパス, 出力ファイルパス)のリスト
+            sample_rate: サンプルレート（デフォルト: 16000Hz）
+            channels: チャンネル数（デフォルト: 1=モノラル）
+            
+        Returns:
+            List[AudioData]: 入力と同じ順序の音声データ
+        """
+        return [
+            self.extract_audio(input_path, output_path, sample_rate, channels)
+            for input_path, output_path in input_output_pairs
+        ]
+    
+    @abstractmethod
+    def extract_audio_stream(
+        self, 
+        input_path: str, 
+        sample_rate: int = 16000,
+        channels: int = 1,
+        chunk_frames: int = 16000
+    ) -> Iterator[Any]:
+        """
+        音声ファイルをデコードしながらPCMを順に返す
+        
+        出力ファイルを作成せずに音声を扱います。
+        
+        Args:
+            input_path: 入力ファイルパス
+            sample_rate: サンプルレート（デフォルト: 16000Hz）
+            channels: チャンネル数（デフォルト: 1=モノラル）
+            chunk_frames: 1回に返すフレーム数
+            
+        Returns:
+            Iterator[np.ndarray]: float32 PCMの断片
+        """
+        pass
+    
     @abstractmethod
     def preprocess_audio(
         self, 
@@ -54,7 +102,6 @@ class AudioProcessor(ABC):
         """
         pass
     
-    @abstractmethod
     def validate_audio(self, audio_data: AudioData) -> bool:
         """
         音声データの妥当性を検証する
@@ -65,7 +112,7 @@ class AudioProcessor(ABC):
         Returns:
             bool: 妥当性の結果
         """
-        pass
+        return audio_data.is_valid
     
     @abstractmethod
     def get_audio_info(self, audio_data: AudioData) -> Dict[str, Any]:
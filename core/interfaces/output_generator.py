@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -21,9 +21,25 @@ class OutputFormat(Enum):
     TXT = "txt"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class CustomStyles:
+    """出力のスタイル設定"""
+    font_family: str = "sans-serif"
+    font_size: int = 11
+    line_height: float = 1.6
+    text_color: str = "#333333"
+    accent_color: str = "#1a5fb4"
+    page_size: str = "A4"
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CustomStyles':
+        """辞書からインスタンスを作成（未知のキーは無視）"""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+@dataclass(slots=True, frozen=True)
 class OutputConfig:
-    """出力設定"""
+    """出力設定（ハッシュ可能なため、生成済みテンプレート等のキャッシュキーに使える）"""
     format: OutputFormat = OutputFormat.MARKDOWN
     title: str = "講義録"
     include_timestamps: bool = True
@@ -31,7 +47,7 @@ class OutputConfig:
     include_summary: bool = True
     include_questions: bool = True
     template_path: Optional[str] = None
-    custom_styles: Optional[Dict[str, Any]] = None
+    custom_styles: Optional[CustomStyles] = None
 
 
 class OutputGenerator(ABC):
@@ -55,6 +71,26 @@ class OutputGenerator(ABC):
         """
         pass
     
+    def generate_batch(
+        self, 
+        processing_results: Sequence[ProcessingResult],
+        config: Optional[OutputConfig] = None
+    ) -> List[str]:
+        """
+        複数の処理結果からまとめて出力を生成する
+        
+        既定の実装は1件ずつ generate_output を呼び出します。
+        テンプレートや接続などを使い回せる実装ではオーバーライドしてください。
+        
+        Args:
+            processing_results: 処理結果のリスト
+            config: 出力設定（全件で共通）
+            
+        Returns:
+            List[str]: 処理結果と同じ順序の出力
+        """
+        return [self.generate_output(result, config) for result in processing_results]
+    
     @abstractmethod
     def generate_markdown(
         self, 
@@ -109,6 +145,60 @@ class OutputGenerator(ABC):
         """
         pass
     
+    def generate_markdown_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: Optional[OutputConfig] = None
+    ) -> Iterator[str]:
+        """
+        Markdown形式の出力を生成された順に分割して返す
+        
+        既定の実装は generate_markdown の結果を1回で返します。
+        長い講義録を逐次出力できる実装ではオーバーライドしてください。
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[str]: Markdown形式の出力の断片
+        """
+        yield self.generate_markdown(processing_result, config)
+    
+    def generate_html_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: Optional[OutputConfig] = None
+    ) -> Iterator[str]:
+        """
+        HTML形式の出力を生成された順に分割して返す
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[str]: HTML形式の出力の断片
+        """
+        yield self.generate_html(processing_result, config)
+    
+    def generate_pdf_stream(
+        self, 
+        processing_result: ProcessingResult,
+        config: Optional[OutputConfig] = None
+    ) -> Iterator[bytes]:
+        """
+        PDF形式の出力を生成された順に分割して返す
+        
+        Args:
+            processing_result: 処理結果
+            config: 出力設定
+            
+        Returns:
+            Iterator[bytes]: PDF形式の出力の断片
+        """
+        yield self.generate_pdf(processing_result, config)
+    
     @abstractmethod
     def generate_summary(
         self, 
@@ -21,6 +21,7 @@ class PDFProcessingConfig:
     language: str = "ja"
     ocr_enabled: bool = True
     table_extraction_method: str = "auto"
+    num_workers: Optional[int] = None  # ページ並列抽出の分割数（Noneの場合は既定値、1の場合は逐次抽出）
 
 
 @dataclass
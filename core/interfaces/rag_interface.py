@@ -21,6 +21,9 @@ class RAGConfig:
     confidence_threshold: float = 0.8
     max_context_length: int = 4000
     temperature: float = 0.3
+    semantic_cache: bool = False
+    cache_threshold: float = 0.95
+    lsh_tables: int = 16
 
 
 @dataclass
@@ -31,6 +34,9 @@ class KnowledgeItem:
     domain: str
     metadata: Dict[str, Any]
     confidence: float = 1.0
+    # 正規化済み埋め込みのint8コードとスケール（再登録時の埋め込み計算を省略できる）
+    quantized_embedding: Optional[bytes] = None
+    scale: float = 1.0
 
 
 class RAGInterface(ABC):
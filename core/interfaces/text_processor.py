@@ -5,9 +5,12 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Callable
 from dataclasses import dataclass
 
+from utils.text_utils import TextUtils
+
 from ..models.transcription_data import TranscriptionData
 from ..models.processing_result import ProcessingResult
 
@@ -72,6 +75,9 @@ class TextProcessor(ABC):
         """
         用語辞書を適用する
         
+        用語ごとにstr.replaceを繰り返さず、全用語を1回の走査で置換すること
+        （重なる場合は長い語を優先。config.presets.compile_rulesで置換器を作成できる）。
+        
         Args:
             text: 処理するテキスト
             glossary: 用語辞書
@@ -101,25 +107,29 @@ class TextProcessor(ABC):
         """
         pass
     
-    @abstractmethod
     def extract_unknown_terms(
         self, 
         text: str,
-        known_terms: List[str],
-        top_k: int = 200
+        known_terms: Iterable[str],
+        top_k: int = 200,
+        tokenizer: Optional[Callable[[str], Iterable[str]]] = None
     ) -> List[Tuple[str, int]]:
         """
         未知語候補を抽出する
         
         Args:
             text: 処理するテキスト
-            known_terms: 既知の用語リスト
+            known_terms: 既知の用語
             top_k: 抽出する上位k個
+            tokenizer: 用語候補の抽出関数（形態素解析器など。省略時は正規表現による抽出）
             
         Returns:
             List[Tuple[str, int]]: (用語, 頻度)のリスト
         """
-        pass
+        known = known_terms if isinstance(known_terms, (set, frozenset)) else frozenset(known_terms)
+        tokens = (tokenizer or TextUtils.extract_terms)(text)
+        # most_commonはtop_k指定時にヒープで上位だけを取り出す
+        return Counter(t for t in tokens if t not in known).most_common(top_k)
     
     @abstractmethod
     def validate_text_quality(
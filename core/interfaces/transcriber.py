@@ -4,14 +4,26 @@
 音声データからテキストへの変換を行う抽象インターフェースを定義します。
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Mapping
 from dataclasses import dataclass
 
 from ..models.audio_data import AudioData
 from ..models.transcription_data import TranscriptionData
 
 
+# 既定値は全インスタンスで共有する（変更する場合は新しい値を代入する）
+_DEFAULT_TEMPERATURE: Tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+_DEFAULT_VAD: Mapping[str, Any] = MappingProxyType({
+    'min_silence_duration_ms': 500,
+    'speech_pad_ms': 400,
+    'min_speech_duration_ms': 250,
+    'max_speech_duration_s': 30.0
+})
+
+
 @dataclass
 class TranscriptionConfig:
     """文字起こし設定"""
@@ -21,9 +33,9 @@ class TranscriptionConfig:
     language: str = "ja"
     beam_size: int = 5
     best_of: int = 5
-    temperature: List[float] = None
+    temperature: Optional[Sequence[float]] = None
     vad_filter: bool = True
-    vad_parameters: Optional[Dict[str, Any]] = None
+    vad_parameters: Optional[Mapping[str, Any]] = None
     word_timestamps: bool = True
     condition_on_previous_text: bool = True
     initial_prompt: Optional[str] = None
@@ -32,16 +44,19 @@ class TranscriptionConfig:
     no_speech_threshold: float = 0.6
     
     def __post_init__(self):
+        # 種類の少ない設定値はインターンして設定間で共有する
+        self.model_size = sys.intern(self.model_size)
+        self.device = sys.intern(self.device)
+        self.compute_type = sys.intern(self.compute_type)
+        self.language = sys.intern(self.language)
+        
         if self.temperature is None:
-            self.temperature = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+            self.temperature = _DEFAULT_TEMPERATURE
+        elif isinstance(self.temperature, list):
+            self.temperature = tuple(self.temperature)
         
         if self.vad_parameters is None:
-            self.vad_parameters = {
-                'min_silence_duration_ms': 500,
-                'speech_pad_ms': 400,
-                'min_speech_duration_ms': 250,
-                'max_speech_duration_s': 30.0
-            }
+            self.vad_parameters = _DEFAULT_VAD
 
 
 class Transcriber(ABC):
@@ -7,7 +7,7 @@
 from .audio_data import AudioData
 from .transcription_data import TranscriptionData, TranscriptionSegment
 from .processing_result import ProcessingResult
-from .lecture_record import LectureRecord, LectureMetadata
+from .lecture_record import LectureRecord, LectureMetadata, LogEntry
 from .master_text import MasterText, MasterTextVersion
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     'ProcessingResult',
     'LectureRecord',
     'LectureMetadata',
+    'LogEntry',
     'MasterText',
     'MasterTextVersion'
 ]
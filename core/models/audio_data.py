@@ -4,13 +4,23 @@
 音声ファイルの情報とメタデータを管理するデータモデルを定義します。
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import os
+import sys
+import wave
+import warnings
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Iterable, List, Set
 from pathlib import Path
 from datetime import datetime
 
+from .cached import cached_slot_property
+from .timestamps import format_datetime, parse_datetime
 
-@dataclass
+# RMS計算時に一度に読み込むフレーム数
+_RMS_BLOCK_FRAMES = 1 << 20
+
+
+@dataclass(slots=True)
 class AudioData:
     """音声データ"""
     file_path: str
@@ -22,34 +32,95 @@ class AudioData:
     format: str
     created_at: datetime
     metadata: Dict[str, Any]
+    # デコード済みのfloat32 PCM（抽出時に得られた場合のみ。シリアライズしない）
+    pcm: Optional[Any] = field(default=None, repr=False, compare=False)
+    # 派生値のキャッシュ（cached_slot_property が使用）
+    _cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        """初期化後の処理"""
-        # ファイル存在チェックは警告のみ（ファイルがまだ作成されていない場合があるため）
-        if not Path(self.file_path).exists():
-            import warnings
-            warnings.warn(f"Audio file not found: {self.file_path}")
+    def validate(self) -> bool:
+        """
+        音声ファイルの存在を確認する
+        
+        生成時には確認しないため（ファイルがまだ作成されていない場合や
+        大量の記録を読み込む場合があるため）、必要な呼び出し側で明示的に使用します。
+        
+        Returns:
+            bool: ファイルが存在するか
+        """
+        if self.path.exists():
+            return True
+        warnings.warn(f"Audio file not found: {self.file_path}")
+        return False
     
-    @property
+    @cached_slot_property
+    def path(self) -> Path:
+        """ファイルパス（Pathオブジェクト）"""
+        return Path(self.file_path)
+    
+    @cached_slot_property
     def file_name(self) -> str:
         """ファイル名を取得"""
-        return Path(self.file_path).name
+        return self.path.name
     
-    @property
+    @cached_slot_property
     def file_extension(self) -> str:
         """ファイル拡張子を取得"""
-        return Path(self.file_path).suffix.lower()
+        return self.path.suffix.lower()
+    
+    @cached_slot_property
+    def duration_seconds(self) -> float:
+        """再生時間（秒）。メタデータにない場合はWAVヘッダーから取得"""
+        if self.duration > 0:
+            return float(self.duration)
+        try:
+            with wave.open(self.file_path, 'rb') as wav_file:
+                return wav_file.getnframes() / wav_file.getframerate()
+        except Exception:
+            return 0.0
+    
+    @cached_slot_property
+    def rms(self) -> Optional[float]:
+        """音量のRMS（16bit WAVのみ。[0.0, 1.0]、算出できない場合はNone）"""
+        try:
+            import numpy as np
+            
+            with wave.open(self.file_path, 'rb') as wav_file:
+                if wav_file.getsampwidth() != 2:
+                    return None
+                total = 0.0
+                count = 0
+                while True:
+                    frames = wav_file.readframes(_RMS_BLOCK_FRAMES)
+                    if not frames:
+                        break
+                    samples = np.frombuffer(frames, dtype=np.int16).astype(np.float64)
+                    total += float(np.dot(samples, samples))
+                    count += samples.size
+            if count == 0:
+                return 0.0
+            return (total / count) ** 0.5 / 32768.0
+        except Exception:
+            return None
+    
+    @cached_slot_property
+    def has_valid_format(self) -> bool:
+        """文字起こしに使える形式かどうか（0.1秒以上、8kHz以上）"""
+        return self.duration_seconds >= 0.1 and self.sample_rate >= 8000
     
     @property
+    def is_valid(self) -> bool:
+        """文字起こしに使える音声かどうか（ファイルの存在は呼び出しごとに確認する）"""
+        return self.path.exists() and self.has_valid_format
+    
+    @cached_slot_property
     def duration_formatted(self) -> str:
         """フォーマットされた再生時間を取得"""
-        hours = int(self.duration // 3600)
-        minutes = int((self.duration % 3600) // 60)
-        seconds = int(self.duration % 60)
+        minutes, seconds = divmod(int(self.duration), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換（serialize_datetimes=Falseの場合、日時はdatetimeのまま）"""
         return {
             'file_path': self.file_path,
             'file_size': self.file_size,
@@ -58,10 +129,41 @@ class AudioData:
             'channels': self.channels,
             'bit_depth': self.bit_depth,
             'format': self.format,
-            'created_at': self.created_at.isoformat(),
+            'created_at': format_datetime(self.created_at, serialize_datetimes),
             'metadata': self.metadata
         }
     
+    @classmethod
+    def from_dicts(cls, data_list: Iterable[Dict[str, Any]]) -> List['AudioData']:
+        """
+        複数の辞書からインスタンスを作成する
+        
+        ファイルの存在確認はディレクトリごとに1回の一覧取得で行い、
+        見つからないファイルは警告します。
+        
+        Args:
+            data_list: to_dict 形式の辞書のリスト
+            
+        Returns:
+            List[AudioData]: 音声データのリスト
+        """
+        records = [cls.from_dict(data) for data in data_list]
+        
+        listings: Dict[str, Set[str]] = {}
+        for record in records:
+            directory, name = os.path.split(record.file_path)
+            entries = listings.get(directory)
+            if entries is None:
+                try:
+                    entries = set(os.listdir(directory or '.'))
+                except OSError:
+                    entries = set()
+                listings[directory] = entries
+            if name not in entries:
+                warnings.warn(f"Audio file not found: {record.file_path}")
+        
+        return records
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AudioData':
         """辞書からインスタンスを作成"""
@@ -72,7 +174,7 @@ class AudioData:
             sample_rate=data['sample_rate'],
             channels=data['channels'],
             bit_depth=data['bit_depth'],
-            format=data['format'],
-            created_at=datetime.fromisoformat(data['created_at']),
+            format=sys.intern(data['format']),  # 種類が少ないため全レコードで共有する
+            created_at=parse_datetime(data['created_at']),
             metadata=data['metadata']
         )
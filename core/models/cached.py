@@ -0,0 +1,39 @@
+"""
+スロット対応のキャッシュ付きプロパティ
+
+__slots__ を持つデータクラスでは functools.cached_property が使えないため、
+インスタンスの _cache スロットに計算結果を保存するプロパティを定義します。
+"""
+
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class cached_slot_property(Generic[T]):
+    """
+    初回参照時に計算し、以降は instance._cache の値を返すプロパティ
+    
+    利用するクラスには ``_cache: Optional[Dict[str, Any]] = field(default=None, init=False,
+    repr=False, compare=False)`` を宣言してください。
+    """
+    
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance: Optional[Any], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance._cache
+        if cache is None:
+            cache = instance._cache = {}
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
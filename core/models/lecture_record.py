@@ -4,11 +4,19 @@
 講義の記録とメタデータを管理するデータモデルを定義します。
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+import os
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Deque, Set
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
+
+from .timestamps import format_datetime, parse_datetime
+
+
+# 保持する処理ログの上限（超えた分は古いものから捨てる）
+MAX_PROCESSING_LOG = 10_000
 
 
 class LectureStatus(Enum):
@@ -20,7 +28,40 @@ class LectureStatus(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+# to_dict / from_dict 用の変換表（Enumの値参照・値からの逆引きを辞書参照にする）
+_STATUS_TO_VALUE: Dict[LectureStatus, str] = {status: status.value for status in LectureStatus}
+_VALUE_TO_STATUS: Dict[str, LectureStatus] = {status.value: status for status in LectureStatus}
+
+
+@dataclass(slots=True, frozen=True)
+class LogEntry:
+    """処理ログのエントリ"""
+    step: str
+    status: str
+    timestamp: datetime
+    details: Dict[str, Any]
+    
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            'step': self.step,
+            'status': self.status,
+            'timestamp': format_datetime(self.timestamp, serialize_datetimes),
+            'details': self.details
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LogEntry':
+        """辞書からインスタンスを作成"""
+        return cls(
+            step=data['step'],
+            status=data['status'],
+            timestamp=parse_datetime(data['timestamp']),
+            details=data.get('details', {})
+        )
+
+
+@dataclass(slots=True)
 class LectureMetadata:
     """講義メタデータ"""
     title: str
@@ -32,28 +73,33 @@ class LectureMetadata:
     tags: List[str] = None
     language: str = "ja"
     quality_score: Optional[float] = None
+    # タグの所属判定用（tagsは順序を保つためリストのまま持つ）
+    _tag_set: Set[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """初期化後の処理"""
         if self.tags is None:
             self.tags = []
+        self._tag_set = set(self.tags)
     
     def add_tag(self, tag: str) -> None:
         """タグを追加"""
-        if tag not in self.tags:
+        if tag not in self._tag_set:
+            self._tag_set.add(tag)
             self.tags.append(tag)
     
     def remove_tag(self, tag: str) -> None:
         """タグを削除"""
-        if tag in self.tags:
+        if tag in self._tag_set:
+            self._tag_set.remove(tag)
             self.tags.remove(tag)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換（serialize_datetimes=Falseの場合、日時はdatetimeのまま）"""
         return {
             'title': self.title,
             'instructor': self.instructor,
-            'date': self.date.isoformat(),
+            'date': format_datetime(self.date, serialize_datetimes),
             'duration': self.duration,
             'domain': self.domain,
             'description': self.description,
@@ -65,20 +111,21 @@ class LectureMetadata:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LectureMetadata':
         """辞書からインスタンスを作成"""
+        # 講師・分野・言語は種類が少ないため、インターンして全レコードで共有する
         return cls(
             title=data['title'],
-            instructor=data['instructor'],
-            date=datetime.fromisoformat(data['date']),
+            instructor=sys.intern(data['instructor']),
+            date=parse_datetime(data['date']),
             duration=data['duration'],
-            domain=data['domain'],
+            domain=sys.intern(data['domain']),
             description=data.get('description'),
             tags=data.get('tags', []),
-            language=data.get('language', 'ja'),
+            language=sys.intern(data.get('language', 'ja')),
             quality_score=data.get('quality_score')
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LectureRecord:
     """講義記録"""
     id: str
@@ -91,7 +138,7 @@ class LectureRecord:
     status: LectureStatus = LectureStatus.DRAFT
     created_at: datetime = None
     updated_at: datetime = None
-    processing_log: List[Dict[str, Any]] = None
+    processing_log: Deque[LogEntry] = None
     custom_metadata: Dict[str, Any] = None
     # 追加属性
     audio_duration: float = 0.0
@@ -101,12 +148,16 @@ class LectureRecord:
     
     def __post_init__(self):
         """初期化後の処理"""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
         if self.processing_log is None:
-            self.processing_log = []
+            self.processing_log = deque(maxlen=MAX_PROCESSING_LOG)
+        elif not isinstance(self.processing_log, deque):
+            self.processing_log = deque(self.processing_log, maxlen=MAX_PROCESSING_LOG)
         if self.custom_metadata is None:
             self.custom_metadata = {}
         if self.technical_terms is None:
@@ -115,12 +166,12 @@ class LectureRecord:
     @property
     def audio_file_exists(self) -> bool:
         """音声ファイルの存在確認"""
-        return Path(self.audio_file_path).exists()
+        return os.path.exists(self.audio_file_path)
     
     @property
     def pdf_file_exists(self) -> bool:
         """PDFファイルの存在確認"""
-        return self.pdf_file_path and Path(self.pdf_file_path).exists()
+        return bool(self.pdf_file_path) and os.path.exists(self.pdf_file_path)
     
     @property
     def is_processing_complete(self) -> bool:
@@ -129,14 +180,10 @@ class LectureRecord:
     
     def add_processing_log(self, step: str, status: str, details: Dict[str, Any] = None) -> None:
         """処理ログを追加"""
-        log_entry = {
-            'step': step,
-            'status': status,
-            'timestamp': datetime.now().isoformat(),
-            'details': details or {}
-        }
-        self.processing_log.append(log_entry)
-        self.updated_at = datetime.now()
+        # 時刻の読み取りは1回にまとめ、文字列化はto_dictまで遅らせる
+        now = datetime.now()
+        self.processing_log.append(LogEntry(step, status, now, details or {}))
+        self.updated_at = now
     
     def update_status(self, status: LectureStatus) -> None:
         """ステータスを更新"""
@@ -153,20 +200,20 @@ class LectureRecord:
             'final_transcript': self.final_transcript_path
         }
     
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換（serialize_datetimes=Falseの場合、日時はdatetimeのまま）"""
         return {
             'id': self.id,
-            'metadata': self.metadata.to_dict(),
+            'metadata': self.metadata.to_dict(serialize_datetimes),
             'audio_file_path': self.audio_file_path,
             'pdf_file_path': self.pdf_file_path,
             'raw_transcript_path': self.raw_transcript_path,
             'processed_transcript_path': self.processed_transcript_path,
             'final_transcript_path': self.final_transcript_path,
-            'status': self.status.value,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'processing_log': self.processing_log,
+            'status': _STATUS_TO_VALUE[self.status],
+            'created_at': format_datetime(self.created_at, serialize_datetimes),
+            'updated_at': format_datetime(self.updated_at, serialize_datetimes),
+            'processing_log': [entry.to_dict(serialize_datetimes) for entry in self.processing_log],
             'custom_metadata': self.custom_metadata
         }
     
@@ -181,9 +228,12 @@ class LectureRecord:
             raw_transcript_path=data.get('raw_transcript_path'),
             processed_transcript_path=data.get('processed_transcript_path'),
             final_transcript_path=data.get('final_transcript_path'),
-            status=LectureStatus(data['status']),
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at']),
-            processing_log=data.get('processing_log', []),
+            status=_VALUE_TO_STATUS[data['status']],
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at']),
+            processing_log=deque(
+                (LogEntry.from_dict(entry) for entry in data.get('processing_log', [])),
+                maxlen=MAX_PROCESSING_LOG
+            ),
             custom_metadata=data.get('custom_metadata', {})
         )
@@ -4,10 +4,13 @@
 講義録のマスターテキストとバージョン管理を管理するデータモデルを定義します。
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
+
+from .cached import cached_slot_property
+from .timestamps import format_datetime, parse_datetime
 from pathlib import Path
 
 
@@ -20,7 +23,12 @@ class MasterTextStatus(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+# to_dict / from_dict 用の変換表（Enumの値参照・値からの逆引きを辞書参照にする）
+_STATUS_TO_VALUE: Dict[MasterTextStatus, str] = {status: status.value for status in MasterTextStatus}
+_VALUE_TO_STATUS: Dict[str, MasterTextStatus] = {status.value: status for status in MasterTextStatus}
+
+
+@dataclass(slots=True)
 class MasterTextVersion:
     """マスターテキストバージョン"""
     version: str
@@ -30,15 +38,17 @@ class MasterTextVersion:
     change_summary: str
     quality_score: Optional[float] = None
     metadata: Dict[str, Any] = None
+    # 派生値のキャッシュ（cached_slot_property が使用）
+    _cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """初期化後の処理"""
         if self.metadata is None:
             self.metadata = {}
     
-    @property
+    @cached_slot_property
     def word_count(self) -> int:
-        """単語数を取得"""
+        """単語数を取得（内容は変更されないため初回のみ計算）"""
         return len(self.content.split())
     
     @property
@@ -46,12 +56,12 @@ class MasterTextVersion:
         """文字数を取得"""
         return len(self.content)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換（serialize_datetimes=Falseの場合、日時はdatetimeのまま）"""
         return {
             'version': self.version,
             'content': self.content,
-            'created_at': self.created_at.isoformat(),
+            'created_at': format_datetime(self.created_at, serialize_datetimes),
             'created_by': self.created_by,
             'change_summary': self.change_summary,
             'quality_score': self.quality_score,
@@ -64,7 +74,7 @@ class MasterTextVersion:
         return cls(
             version=data['version'],
             content=data['content'],
-            created_at=datetime.fromisoformat(data['created_at']),
+            created_at=parse_datetime(data['created_at']),
             created_by=data['created_by'],
             change_summary=data['change_summary'],
             quality_score=data.get('quality_score'),
@@ -72,7 +82,7 @@ class MasterTextVersion:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterText:
     """マスターテキスト"""
     id: str
@@ -84,23 +94,36 @@ class MasterText:
     created_at: datetime = None
     updated_at: datetime = None
     metadata: Dict[str, Any] = None
+    # バージョン文字列 → バージョン（add_version で更新）
+    _by_version: Dict[str, MasterTextVersion] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # 最新バージョンと作成日時順の履歴（履歴は add_version で破棄し、次回参照時に再計算）
+    _latest: Optional[MasterTextVersion] = field(default=None, init=False, repr=False, compare=False)
+    _history: Optional[Tuple[MasterTextVersion, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """初期化後の処理"""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
         if self.metadata is None:
             self.metadata = {}
+        # 同じバージョン文字列が複数ある場合は先頭のものを優先する
+        self._by_version = {v.version: v for v in reversed(self.versions)}
+        if self.versions:
+            self._latest = max(self.versions, key=lambda v: v.created_at)
     
     @property
     def current_content(self) -> str:
         """現在の内容を取得"""
-        for version in self.versions:
-            if version.version == self.current_version:
-                return version.content
-        return ""
+        version = self._by_version.get(self.current_version)
+        return version.content if version is not None else ""
     
     @property
     def version_count(self) -> int:
@@ -110,9 +133,7 @@ class MasterText:
     @property
     def latest_version(self) -> Optional[MasterTextVersion]:
         """最新バージョンを取得"""
-        if not self.versions:
-            return None
-        return max(self.versions, key=lambda v: v.created_at)
+        return self._latest
     
     def add_version(
         self, 
@@ -121,36 +142,45 @@ class MasterText:
         change_summary: str,
         quality_score: Optional[float] = None
     ) -> str:
-        """新しいバージョンを追加"""
+        """新しいバージョンを追加（内容が現在のバージョンと同じ場合は追加せず、そのバージョンを返す）"""
+        current = self._by_version.get(self.current_version)
+        if current is not None and current.content == content:
+            return current.version
+        
         # バージョン番号を生成（簡易版）
         version_number = len(self.versions) + 1
         version = f"v{version_number}"
+        now = datetime.now()
         
         new_version = MasterTextVersion(
             version=version,
             content=content,
-            created_at=datetime.now(),
+            created_at=now,
             created_by=created_by,
             change_summary=change_summary,
             quality_score=quality_score
         )
         
         self.versions.append(new_version)
+        self._by_version.setdefault(version, new_version)
+        # max() と同じく、作成日時が同じ場合は先に追加されたものを最新とする
+        if self._latest is None or new_version.created_at > self._latest.created_at:
+            self._latest = new_version
+        self._history = None
         self.current_version = version
-        self.updated_at = datetime.now()
+        self.updated_at = now
         
         return version
     
     def get_version(self, version: str) -> Optional[MasterTextVersion]:
         """指定バージョンを取得"""
-        for v in self.versions:
-            if v.version == version:
-                return v
-        return None
+        return self._by_version.get(version)
     
     def get_version_history(self) -> List[MasterTextVersion]:
         """バージョン履歴を取得（作成日時順）"""
-        return sorted(self.versions, key=lambda v: v.created_at)
+        if self._history is None:
+            self._history = tuple(sorted(self.versions, key=lambda v: v.created_at))
+        return list(self._history)
     
     def update_status(self, status: MasterTextStatus) -> None:
         """ステータスを更新"""
@@ -161,17 +191,17 @@ class MasterText:
         """品質スコアの推移を取得"""
         return [v.quality_score for v in self.versions if v.quality_score is not None]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
+    def to_dict(self, serialize_datetimes: bool = True) -> Dict[str, Any]:
+        """辞書形式に変換（serialize_datetimes=Falseの場合、日時はdatetimeのまま）"""
         return {
             'id': self.id,
             'lecture_id': self.lecture_id,
             'title': self.title,
             'current_version': self.current_version,
-            'versions': [v.to_dict() for v in self.versions],
-            'status': self.status.value,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'versions': [v.to_dict(serialize_datetimes) for v in self.versions],
+            'status': _STATUS_TO_VALUE[self.status],
+            'created_at': format_datetime(self.created_at, serialize_datetimes),
+            'updated_at': format_datetime(self.updated_at, serialize_datetimes),
             'metadata': self.metadata
         }
     
@@ -184,8 +214,8 @@ class MasterText:
             title=data['title'],
             current_version=data['current_version'],
             versions=[MasterTextVersion.from_dict(v) for v in data['versions']],
-            status=MasterTextStatus(data['status']),
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at']),
+            status=_VALUE_TO_STATUS[data['status']],
+            created_at=parse_datetime(data['created_at']),
+            updated_at=parse_datetime(data['updated_at']),
             metadata=data.get('metadata', {})
         )
@@ -4,11 +4,13 @@
 テキスト処理の結果とメタデータを管理するデータモデルを定義します。
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
+from .timestamps import parse_datetime
+
 
 class ProcessingStatus(Enum):
     """処理ステータス"""
@@ -19,7 +21,12 @@ class ProcessingStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# to_dict / from_dict 用の変換表（Enumの値参照・値からの逆引きを辞書参照にする）
+_STATUS_TO_VALUE: Dict[ProcessingStatus, str] = {status: status.value for status in ProcessingStatus}
+_VALUE_TO_STATUS: Dict[str, ProcessingStatus] = {status.value: status for status in ProcessingStatus}
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """処理結果"""
     raw_text: str
@@ -34,6 +41,10 @@ class ProcessingResult:
     audio_duration: float = 0.0
     transcription: Optional[Any] = None
     technical_terms: List[str] = None
+    # to_dict 用の日時文字列（作成日時, 更新日時, 各ISO文字列）。日時が差し替わったら作り直す
+    _iso_cache: Optional[Tuple[datetime, datetime, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """初期化後の処理"""
@@ -102,33 +113,53 @@ class ProcessingResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
+        created_iso, updated_iso = self._iso_timestamps()
         return {
             'raw_text': self.raw_text,
             'processed_text': self.processed_text,
             'enhanced_text': self.enhanced_text,
-            'status': self.status.value,
+            'status': _STATUS_TO_VALUE[self.status],
             'processing_time': self.processing_time,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': created_iso,
+            'updated_at': updated_iso,
             'metadata': self.metadata,
             'audio_duration': self.audio_duration,
             'transcription': self.transcription.to_dict() if self.transcription else None,
             'technical_terms': self.technical_terms
         }
     
+    def _iso_timestamps(self) -> Tuple[str, str]:
+        """作成日時・更新日時のISO文字列を取得（日時が変わっていなければ前回の結果を使う）"""
+        cache = self._iso_cache
+        if cache is None or cache[0] is not self.created_at or cache[1] is not self.updated_at:
+            cache = self._iso_cache = (
+                self.created_at,
+                self.updated_at,
+                self.created_at.isoformat(),
+                self.updated_at.isoformat()
+            )
+        return cache[2], cache[3]
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProcessingResult':
-        """辞書からインスタンスを作成"""
-        return cls(
-            raw_text=data['raw_text'],
-            processed_text=data['processed_text'],
-            enhanced_text=data.get('enhanced_text'),
-            status=ProcessingStatus(data['status']),
-            processing_time=data['processing_time'],
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at']),
-            metadata=data.get('metadata', {}),
-            audio_duration=data.get('audio_duration', 0.0),
-            transcription=data.get('transcription'),
-            technical_terms=data.get('technical_terms', [])
-        )
+        """
+        辞書からインスタンスを作成
+        
+        全フィールドを辞書から設定するため__init__/__post_init__は通さない
+        （フィールドを追加した場合はここにも追加すること）。
+        """
+        get = data.get
+        result = object.__new__(cls)
+        result.raw_text = data['raw_text']
+        result.processed_text = data['processed_text']
+        result.enhanced_text = get('enhanced_text')
+        result.status = _VALUE_TO_STATUS[data['status']]
+        result.processing_time = data['processing_time']
+        result.created_at = parse_datetime(data['created_at'])
+        result.updated_at = parse_datetime(data['updated_at'])
+        result.metadata = get('metadata') or {}
+        result.audio_duration = get('audio_duration', 0.0)
+        result.transcription = get('transcription')
+        result.technical_terms = get('technical_terms') or []
+        result._iso_cache = None
+        return result
@@ -0,0 +1,40 @@
+"""
+日時のシリアライズ
+
+データモデルの to_dict / from_dict で共通して使う日時の変換を定義します。
+"""
+
+from datetime import datetime
+from typing import Any, Optional, Union
+
+
+def format_datetime(value: Optional[datetime], as_string: bool = True) -> Union[str, datetime, None]:
+    """
+    日時を辞書に格納する形式に変換する
+    
+    Args:
+        value: 日時
+        as_string: ISO 8601文字列にするか（Falseの場合はdatetimeのまま返し、
+            orjson等のシリアライザーに変換を任せる）
+        
+    Returns:
+        Union[str, datetime, None]: 変換後の値
+    """
+    if value is None or not as_string:
+        return value
+    return value.isoformat()
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    辞書に格納された日時を復元する
+    
+    Args:
+        value: ISO 8601文字列、datetime、またはNone
+        
+    Returns:
+        Optional[datetime]: 日時
+    """
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
@@ -4,12 +4,29 @@
 文字起こし結果とセグメント情報を管理するデータモデルを定義します。
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+from .timestamps import parse_datetime
+
+
+# これ未満のセグメント数では索引を作らず線形に走査する
+_INDEX_MIN_SEGMENTS = 64
+
+
+@lru_cache(maxsize=1)
+def _clock_labels() -> Tuple[List[str], List[str]]:
+    """時刻ラベルの部品（"00"〜"99"の時、"00:00"〜"59:59"の分秒）"""
+    hours = [f"{h:02d}" for h in range(100)]
+    minute_seconds = [f"{m:02d}:{s:02d}" for m in range(60) for s in range(60)]
+    return hours, minute_seconds
+
+
+@dataclass(slots=True)
 class TranscriptionSegment:
     """文字起こしセグメント"""
     start_time: float
@@ -36,9 +53,8 @@ class TranscriptionSegment:
     
     def _format_time(self, seconds: float) -> str:
         """時間をフォーマット"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
     def to_dict(self) -> Dict[str, Any]:
@@ -54,18 +70,24 @@ class TranscriptionSegment:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TranscriptionSegment':
-        """辞書からインスタンスを作成"""
-        return cls(
-            start_time=data['start_time'],
-            end_time=data['end_time'],
-            text=data['text'],
-            confidence=data.get('confidence'),
-            speaker=data.get('speaker'),
-            language=data.get('language')
-        )
+        """辞書からインスタンスを作成（全フィールドを辞書から設定するため__init__は通さない）"""
+        get = data.get
+        segment = object.__new__(cls)
+        segment.start_time = data['start_time']
+        segment.end_time = data['end_time']
+        segment.text = data['text']
+        segment.confidence = get('confidence')
+        segment.speaker = get('speaker')
+        segment.language = get('language')
+        return segment
 
 
-@dataclass
+# セグメントの辞書変換（ループ内で属性参照・バウンドメソッド生成を省く）
+_segment_to_dict = TranscriptionSegment.to_dict
+_segment_from_dict = TranscriptionSegment.from_dict
+
+
+@dataclass(slots=True)
 class TranscriptionData:
     """文字起こしデータ"""
     segments: List[TranscriptionSegment]
@@ -75,6 +97,10 @@ class TranscriptionData:
     processing_time: float
     created_at: datetime
     metadata: Dict[str, Any]
+    # 時間範囲検索用の索引（segmentsのリスト, 作成時のセグメント数, 開始時間順の並び, 開始時間, 終了時間）
+    _time_index: Optional[Tuple[list, int, np.ndarray, np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @property
     def total_duration(self) -> float:
@@ -98,16 +124,74 @@ class TranscriptionData:
         """テキストを取得（full_textのエイリアス）"""
         return self.full_text
     
+    def format_all_timecodes(self) -> List[Tuple[str, str]]:
+        """
+        全セグメントの開始・終了時間をまとめてフォーマットする
+        
+        字幕出力などで全セグメントを処理する場合は、セグメントごとに
+        start_time_formatted / end_time_formatted を参照するより速い。
+        
+        Returns:
+            List[Tuple[str, str]]: セグメント順の(開始時間, 終了時間)
+        """
+        count = len(self.segments)
+        if count == 0:
+            return []
+        
+        # 時と分秒への分解は配列でまとめて行い、文字列は事前に作った部品をつなぐだけにする
+        times = np.empty(2 * count, dtype=np.float64)
+        times[:count] = [segment.start_time for segment in self.segments]
+        times[count:] = [segment.end_time for segment in self.segments]
+        hours, remainders = np.divmod(times.astype(np.int64), 3600)
+        hour_labels, minute_second_labels = _clock_labels()
+        labels = [
+            (hour_labels[h] if h < 100 else str(h)) + ":" + minute_second_labels[r]
+            for h, r in zip(hours.tolist(), remainders.tolist())
+        ]
+        return list(zip(labels[:count], labels[count:]))
+    
     def get_segments_by_time_range(
         self, 
         start_time: float, 
         end_time: float
     ) -> List[TranscriptionSegment]:
-        """指定時間範囲のセグメントを取得"""
-        return [
-            segment for segment in self.segments
-            if segment.start_time >= start_time and segment.end_time <= end_time
-        ]
+        """指定時間範囲のセグメントを取得（セグメントの順序は保つ）"""
+        segments = self.segments
+        if len(segments) < _INDEX_MIN_SEGMENTS:
+            return [
+                segment for segment in segments
+                if segment.start_time >= start_time and segment.end_time <= end_time
+            ]
+        
+        order, starts, ends = self._get_time_index()
+        # 開始時間が範囲内のものを二分探索で絞り込み、その中で終了時間を判定する
+        lo = np.searchsorted(starts, start_time, side='left')
+        hi = np.searchsorted(starts, end_time, side='right')
+        candidates = order[lo:hi]
+        hits = np.sort(candidates[ends[candidates] <= end_time])
+        return [segments[i] for i in hits.tolist()]
+    
+    def _get_time_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        時間範囲検索用の索引を取得
+        
+        segmentsの差し替え・追加があれば作り直す（既存セグメントの時間の書き換えは検知しない）。
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (開始時間順の並び, 並べ替え済みの開始時間, 終了時間)
+        """
+        index = self._time_index
+        segments = self.segments
+        if index is None or index[0] is not segments or index[1] != len(segments):
+            starts = np.fromiter(
+                (segment.start_time for segment in segments), dtype=np.float64, count=len(segments)
+            )
+            ends = np.fromiter(
+                (segment.end_time for segment in segments), dtype=np.float64, count=len(segments)
+            )
+            order = np.argsort(starts, kind='stable')
+            index = self._time_index = (segments, len(segments), order, starts[order], ends)
+        return index[2], index[3], index[4]
     
     def get_text_by_time_range(
         self, 
@@ -121,7 +205,7 @@ class TranscriptionData:
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
         return {
-            'segments': [segment.to_dict() for segment in self.segments],
+            'segments': [_segment_to_dict(segment) for segment in self.segments],
             'full_text': self.full_text,
             'language': self.language,
             'model_used': self.model_used,
@@ -132,13 +216,14 @@ class TranscriptionData:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TranscriptionData':
-        """辞書からインスタンスを作成"""
-        return cls(
-            segments=[TranscriptionSegment.from_dict(seg) for seg in data['segments']],
-            full_text=data['full_text'],
-            language=data['language'],
-            model_used=data['model_used'],
-            processing_time=data['processing_time'],
-            created_at=datetime.fromisoformat(data['created_at']),
-            metadata=data['metadata']
-        )
+        """辞書からインスタンスを作成（全フィールドを辞書から設定するため__init__は通さない）"""
+        transcription = object.__new__(cls)
+        transcription.segments = [_segment_from_dict(seg) for seg in data['segments']]
+        transcription.full_text = data['full_text']
+        transcription.language = data['language']
+        transcription.model_used = data['model_used']
+        transcription.processing_time = data['processing_time']
+        transcription.created_at = parse_datetime(data['created_at'])
+        transcription.metadata = data['metadata']
+        transcription._time_index = None
+        return transcription
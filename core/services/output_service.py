@@ -4,13 +4,23 @@
 処理済みテキストから各種出力形式を生成するビジネスロジックを実装します。
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Iterable, Union
 from pathlib import Path
 
 from ..interfaces.output_generator import OutputGenerator, OutputConfig, OutputFormat
 from ..models.processing_result import ProcessingResult
 
 
+# 出力形式ごとのファイル拡張子
+_EXTENSIONS = {
+    OutputFormat.MARKDOWN: '.md',
+    OutputFormat.HTML: '.html',
+    OutputFormat.PDF: '.pdf',
+    OutputFormat.DOCX: '.docx',
+    OutputFormat.TXT: '.txt'
+}
+
+
 class OutputService:
     """出力生成サービス"""
     
@@ -59,6 +69,42 @@ class OutputService:
         
         return self.output_generator.generate_output(processing_result, config)
     
+    def generate_batch_output(
+        self, 
+        processing_results: Sequence[ProcessingResult],
+        title: str = "講義録",
+        format: OutputFormat = OutputFormat.MARKDOWN,
+        include_timestamps: bool = True,
+        include_glossary: bool = True,
+        include_summary: bool = True,
+        include_questions: bool = True
+    ) -> List[str]:
+        """
+        複数の講義録出力をまとめて生成する
+        
+        Args:
+            processing_results: 処理結果のリスト
+            title: タイトル
+            format: 出力形式
+            include_timestamps: タイムスタンプを含むか
+            include_glossary: 用語集を含むか
+            include_summary: サマリーを含むか
+            include_questions: 確認問題を含むか
+            
+        Returns:
+            List[str]: 処理結果と同じ順序の出力
+        """
+        config = OutputConfig(
+            format=format,
+            title=title,
+            include_timestamps=include_timestamps,
+            include_glossary=include_glossary,
+            include_summary=include_summary,
+            include_questions=include_questions
+        )
+        
+        return self.output_generator.generate_batch(processing_results, config)
+    
     def generate_markdown_output(
         self, 
         processing_result: ProcessingResult,
@@ -197,14 +243,7 @@ class OutputService:
             
             # 形式に応じてファイル拡張子を設定
             if not output_file.suffix:
-                extensions = {
-                    OutputFormat.MARKDOWN: '.md',
-                    OutputFormat.HTML: '.html',
-                    OutputFormat.PDF: '.pdf',
-                    OutputFormat.DOCX: '.docx',
-                    OutputFormat.TXT: '.txt'
-                }
-                output_file = output_file.with_suffix(extensions[format])
+                output_file = output_file.with_suffix(_EXTENSIONS[format])
             
             # ファイルに書き込み
             if format == OutputFormat.PDF:
@@ -221,3 +260,41 @@ class OutputService:
         except Exception as e:
             print(f"Error saving output: {e}")
             return False
+    
+    def save_output_stream(
+        self, 
+        chunks: Iterable[Union[str, bytes]],
+        output_path: str,
+        format: OutputFormat = OutputFormat.MARKDOWN,
+        buffer_size: int = 64 * 1024
+    ) -> bool:
+        """
+        分割して生成された出力を受け取った順にファイルへ書き込む
+        
+        出力全体をメモリ上に保持せず、断片ごとにバッファ経由で書き込みます。
+        
+        Args:
+            chunks: 出力の断片（generate_*_stream の戻り値）
+            output_path: 保存先パス（拡張子は save_output と同じ規則）
+            format: 出力形式
+            buffer_size: 書き込みバッファのサイズ
+            
+        Returns:
+            bool: 保存の成功/失敗
+        """
+        try:
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            if not output_file.suffix:
+                output_file = output_file.with_suffix(_EXTENSIONS[format])
+            
+            with open(output_file, 'wb', buffering=buffer_size) as f:
+                for chunk in chunks:
+                    f.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error saving output: {e}")
+            return False
@@ -4,7 +4,7 @@
 文字起こしテキストの処理に関するビジネスロジックを実装します。
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Callable
 import time
 
 from ..interfaces.text_processor import TextProcessor, TextProcessingConfig
@@ -117,22 +117,24 @@ class TextProcessingService:
     def extract_unknown_terms(
         self, 
         text: str,
-        known_terms: List[str],
-        top_k: int = 200
+        known_terms: Iterable[str],
+        top_k: int = 200,
+        tokenizer: Optional[Callable[[str], Iterable[str]]] = None
     ) -> List[Tuple[str, int]]:
         """
         未知語候補を抽出する
         
         Args:
             text: 処理するテキスト
-            known_terms: 既知の用語リスト
+            known_terms: 既知の用語
             top_k: 抽出する上位k個
+            tokenizer: 用語候補の抽出関数（省略時は正規表現による抽出）
             
         Returns:
             List[Tuple[str, int]]: (用語, 頻度)のリスト
         """
         return self.text_processor.extract_unknown_terms(
-            text, known_terms, top_k
+            text, known_terms, top_k, tokenizer
         )
     
     def validate_text_quality(
@@ -6,12 +6,14 @@
 
 import csv
 import json
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from datetime import datetime
 
 from ...utils.logging import get_logger
 from ...utils.text_utils import TextUtils
+from ...config.presets.preset_manager import compile_rules
 
 logger = get_logger(__name__)
 
@@ -32,6 +34,8 @@ class GlossaryManager:
         # 辞書キャッシュ
         self._glossary_cache: Dict[str, Dict[str, str]] = {}
         self._last_modified: Dict[str, datetime] = {}
+        # 分野ごとのコンパイル済み置換器（辞書の読み込み・保存時に破棄）
+        self._matcher_cache: Dict[str, Any] = {}
     
     def load_glossary(
         self, 
@@ -76,6 +80,7 @@ class GlossaryManager:
         
         # キャッシュを更新
         self._glossary_cache[domain] = glossary
+        self._matcher_cache.pop(domain, None)
         if glossary_path.exists():
             self._last_modified[domain] = datetime.fromtimestamp(glossary_path.stat().st_mtime)
         
@@ -108,6 +113,7 @@ class GlossaryManager:
             
             # キャッシュを更新
             self._glossary_cache[domain] = glossary
+            self._matcher_cache.pop(domain, None)
             self._last_modified[domain] = datetime.now()
             
             logger.info(f"Glossary saved: {domain} ({len(glossary)} terms)")
@@ -275,18 +281,14 @@ class GlossaryManager:
         if not glossary:
             return text
         
-        # 長い語から先に置換（表記ゆれの衝突を防ぐ）
-        sorted_glossary = sorted(
-            glossary.items(), 
-            key=lambda x: len(x[0]), 
-            reverse=True
-        )
+        # 全用語を1回の走査で置換（重なる場合は長い語を優先し、表記ゆれの衝突を防ぐ）
+        if domain not in self._matcher_cache:
+            self._matcher_cache[domain] = compile_rules(glossary)
         
-        result = text
-        for term, normalized in sorted_glossary:
-            result = result.replace(term, normalized)
-        
-        return result
+        matcher = self._matcher_cache[domain]
+        if matcher is None:
+            return text
+        return matcher.apply(text)
     
     def extract_unknown_terms(
         self, 
@@ -306,17 +308,13 @@ class GlossaryManager:
             List[Tuple[str, int]]: (用語, 頻度)のリスト
         """
         glossary = self.load_glossary(domain)
-        known_terms = set(glossary.keys()) | set(glossary.values())
+        known_terms = frozenset(glossary.keys()) | frozenset(glossary.values())
         
         # 用語候補を抽出
         terms = TextUtils.extract_terms(text)
         
-        # 既知の用語を除外
-        unknown_terms = [term for term in terms if term not in known_terms]
-        
-        # 頻度を計算
-        from collections import Counter
-        counter = Counter(unknown_terms)
+        # 既知の用語を除外しながら頻度を計算（中間リストは作らない）
+        counter = Counter(term for term in terms if term not in known_terms)
         
         return counter.most_common(top_k)
     
@@ -404,6 +402,7 @@ class GlossaryManager:
                 # キャッシュをクリア
                 if domain in self._glossary_cache:
                     del self._glossary_cache[domain]
+                self._matcher_cache.pop(domain, None)
                 
                 logger.info(f"Glossary restored: {domain}")
                 return True
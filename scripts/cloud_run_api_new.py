@@ -9,10 +9,13 @@ import json
 import tempfile
 import subprocess
 from flask import Flask, request, jsonify
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import time
 import hashlib
 import hmac
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # 新しいアーキテクチャのインポート
 from core.services.lecture_processing_service import LectureProcessingService
@@ -28,23 +31,46 @@ from utils.cloud_audio_manager import CloudAudioManager
 from utils.audio_utils import get_audio_metadata
 import psutil
 
+class OrjsonProvider(DefaultJSONProvider):
+    """orjsonでJSONを変換するプロバイダー（大きな文字起こし結果の応答を高速化）"""
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # セキュリティ強化: 特定のOriginのみ許可
-CORS(app, 
-     origins=[
-         "https://darwin.sambo-office.com",  # 本番ドメイン
-         "https://lecture-to-text-7nbgp21xf-yoshis-projects-421cbceb.vercel.app",  # 現在のVercel URL
-         "https://lecture-to-text-qov0p5jjn-yoshis-projects-421cbceb.vercel.app",
-         "https://lecture-to-text.vercel.app",
-         "https://lecture-to-text-omega.vercel.app",
-         "https://lecture-to-text-7xtgo3bbl-yoshis-projects-421cbceb.vercel.app",
-         "http://localhost:3000"  # 開発用
-     ],
-     allow_headers=["Content-Type", "X-API-Key", "Authorization"],
-     allow_methods=["GET", "POST", "OPTIONS", "PUT", "DELETE"],
-     supports_credentials=True
-)
+CORS_ALLOWED_ORIGINS = frozenset({
+    "https://darwin.sambo-office.com",  # 本番ドメイン
+    "https://lecture-to-text-7nbgp21xf-yoshis-projects-421cbceb.vercel.app",  # 現在のVercel URL
+    "https://lecture-to-text-qov0p5jjn-yoshis-projects-421cbceb.vercel.app",
+    "https://lecture-to-text.vercel.app",
+    "https://lecture-to-text-omega.vercel.app",
+    "https://lecture-to-text-7xtgo3bbl-yoshis-projects-421cbceb.vercel.app",
+    "http://localhost:3000"  # 開発用
+})
+CORS_ALLOW_HEADERS = "Content-Type, X-API-Key, Authorization"
+CORS_ALLOW_METHODS = "GET, POST, OPTIONS, PUT, DELETE"
+
+@app.after_request
+def apply_cors_headers(response):
+    """許可されたOriginからのリクエストにのみCORSヘッダーを付与"""
+    origin = request.headers.get('Origin')
+    # 応答はOriginによって変わるため、既存のVary（Accept-Encoding等）に追加する
+    response.vary.add('Origin')
+    if origin in CORS_ALLOWED_ORIGINS:
+        headers = response.headers
+        headers['Access-Control-Allow-Origin'] = origin
+        headers['Access-Control-Allow-Credentials'] = 'true'
+        headers['Access-Control-Allow-Headers'] = CORS_ALLOW_HEADERS
+        headers['Access-Control-Allow-Methods'] = CORS_ALLOW_METHODS
+    return response
 
 # APIキー設定
 API_KEY = os.getenv('NEXT_PUBLIC_API_KEY', 'default-secret-key-change-this')
@@ -57,6 +83,11 @@ MAX_MEMORY_MB = int(os.getenv('MAX_MEMORY_MB', '6144'))  # 6GB
 CHUNK_DURATION = int(os.getenv('CHUNK_DURATION', '300'))  # 5分
 ENABLE_STREAMING = os.getenv('ENABLE_STREAMING', 'true').lower() == 'true'
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'lecture-to-text-audio-chunks')
+# 同時に処理するチャンク数（Whisperのワーカー数もこれに合わせる）
+CHUNK_WORKERS = max(1, int(os.getenv('CHUNK_WORKERS', '4')))
+
+# 起動時にサービス（Whisperモデルを含む）を読み込むか
+PRELOAD_SERVICES = os.getenv('PRELOAD_SERVICES', 'true').lower() == 'true'
 
 def get_memory_usage():
     """現在のメモリ使用量を取得（MB）"""
@@ -107,46 +138,64 @@ def process_with_streaming(audio_path, title, temp_dir):
             all_technical_terms = []
             
             chunk_count = 0
+            completed_count = 0
             total_chunks = int(duration / CHUNK_DURATION) + 1
             
-            for chunk_info in processor.split_audio_file(audio_path):
-                chunk_count += 1
-                processing_status["current_step"] = f"チャンク処理中... ({chunk_count}/{total_chunks})"
-                processing_status["progress"] = 20 + (chunk_count / total_chunks) * 60
-                
-                print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] チャンク {chunk_count}/{total_chunks} 処理中: {chunk_info['duration']:.2f}秒")
-                log_memory_usage(f"チャンク{chunk_count}処理開始")
-                
-                # チャンクをCloud Storageにアップロード
-                cloud_manager.upload_chunk(
-                    session_id=session_id,
-                    chunk_index=chunk_info['chunk_index'],
-                    chunk_path=chunk_info['chunk_path'],
-                    start_time=chunk_info['start_time'],
-                    end_time=chunk_info['end_time']
-                )
-                
-                # チャンクを処理
-                chunk_result = lecture_service.process_lecture(
-                    audio_file_path=chunk_info['chunk_path'],
-                    title=f"{title} (チャンク {chunk_count})",
-                    domain="general"
-                )
+            def process_chunk(chunk_number, chunk_info):
+                """1チャンクをアップロードして処理（ワーカースレッドで実行）"""
+                try:
+                    # チャンクをCloud Storageにアップロード
+                    cloud_manager.upload_chunk(
+                        session_id=session_id,
+                        chunk_index=chunk_info['chunk_index'],
+                        chunk_path=chunk_info['chunk_path'],
+                        start_time=chunk_info['start_time'],
+                        end_time=chunk_info['end_time']
+                    )
+                    
+                    # チャンクを処理
+                    return lecture_service.process_lecture(
+                        audio_file_path=chunk_info['chunk_path'],
+                        title=f"{title} (チャンク {chunk_number})",
+                        domain="general"
+                    )
+                finally:
+                    # チャンクファイルを削除してメモリを解放
+                    try:
+                        os.remove(chunk_info['chunk_path'])
+                    except OSError:
+                        pass
+            
+            def collect(chunk_result):
+                """完了したチャンクの結果を順に蓄積"""
+                nonlocal completed_count
+                completed_count += 1
+                processing_status["current_step"] = f"チャンク処理中... ({completed_count}/{total_chunks})"
+                processing_status["progress"] = 20 + (completed_count / total_chunks) * 60
                 
-                # 結果を蓄積
                 if chunk_result.transcription and chunk_result.transcription.text:
                     all_transcripts.append(chunk_result.transcription.text)
                 
                 if chunk_result.technical_terms:
                     all_technical_terms.extend(chunk_result.technical_terms)
                 
-                log_memory_usage(f"チャンク{chunk_count}処理完了")
+                log_memory_usage(f"チャンク{completed_count}処理完了")
+            
+            # チャンクを並列に処理し、結果はチャンク順に受け取る
+            # 分割済みのチャンクが溜まりすぎないよう、未完了のチャンクはワーカー数までに抑える
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+                for chunk_info in processor.split_audio_file(audio_path):
+                    chunk_count += 1
+                    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] チャンク {chunk_count}/{total_chunks} 処理中: {chunk_info['duration']:.2f}秒")
+                    log_memory_usage(f"チャンク{chunk_count}処理開始")
+                    
+                    pending.append(executor.submit(process_chunk, chunk_count, chunk_info))
+                    if len(pending) >= CHUNK_WORKERS:
+                        collect(pending.popleft().result())
                 
-                # チャンクファイルを削除してメモリを解放
-                try:
-                    os.remove(chunk_info['chunk_path'])
-                except:
-                    pass
+                while pending:
+                    collect(pending.popleft().result())
             
             # 結果をマージ
             processing_status["current_step"] = "結果マージ中..."
@@ -230,7 +279,14 @@ def init_services():
             
             # アダプターを初期化
             print("Whisperアダプターを初期化中...")
-            whisper_adapter = WhisperAdapter(settings.whisper.to_dict())
+            # 並列に処理するチャンク数だけ、Whisperも同時に推論できるようにする
+            whisper_config = settings.whisper.to_dict()
+            whisper_config['num_workers'] = max(whisper_config['num_workers'], CHUNK_WORKERS)
+            whisper_adapter = WhisperAdapter(whisper_config)
+            
+            # モデルは初回アクセス時に読み込まれるため、ここで読み込んでおく
+            print("Whisperモデルを読み込み中...")
+            whisper_adapter.model
             
             print("OpenAIアダプターを初期化中...")
             openai_adapter = OpenAIAdapter(settings.openai.to_dict())
@@ -271,7 +327,7 @@ processing_status = {
 
 def add_cors_headers(response):
     """レスポンスにCORSヘッダーを追加"""
-    # flask-corsが既にCORSヘッダーを設定しているので、追加の設定は不要
+    # apply_cors_headersが既にCORSヘッダーを設定しているので、追加の設定は不要
     # 必要に応じて追加のヘッダーを設定
     return response
 
@@ -316,7 +372,7 @@ def verify_api_key():
         return add_cors_headers(response), 401
     return None
 
-# OPTIONSハンドラーは不要（flask-corsが自動処理）
+# OPTIONSハンドラーは不要（Flaskが自動応答し、apply_cors_headersがヘッダーを付与）
 
 @app.route('/process-audio', methods=['POST'])
 def process_audio():
@@ -378,12 +434,13 @@ def process_audio():
         print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] ファイル名: {audio_file.filename}")
         print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] ファイルサイズ: {file_size / 1024 / 1024:.2f} MB")
         
-        # サービスを初期化
-        processing_status["current_step"] = "サービス初期化中..."
-        processing_status["progress"] = 5
-        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] サービス初期化中...")
-        init_services()
-        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] サービス初期化完了")
+        # サービスを初期化（起動時に読み込み済みでなければここで行う）
+        if lecture_service is None:
+            processing_status["current_step"] = "サービス初期化中..."
+            processing_status["progress"] = 5
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] サービス初期化中...")
+            init_services()
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] サービス初期化完了")
         
         # 一時ディレクトリを作成
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -462,5 +519,10 @@ def process_audio():
         return add_cors_headers(response), 500
 
 if __name__ == '__main__':
+    # 最初のリクエストでモデル読み込みを待たないよう、起動時に初期化しておく
+    # （インポート時に実行すると、multiprocessingの子プロセスでも初期化されてしまう）
+    if PRELOAD_SERVICES:
+        init_services()
+    
     port = int(os.environ.get('PORT', 8080))
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -148,7 +148,7 @@ class EnvironmentSetup:
                 subscription_name="darwin-subscription"
             )
             
-            adapter = PubSubAdapter(config.to_dict())
+            adapter = PubSubAdapter(config)
             
             # トピックとサブスクリプションを作成
             if adapter.create_topic() and adapter.create_subscription():
@@ -12,6 +12,9 @@ setup(
     description="AI-powered lecture transcription and analysis system",
     author="Darwin Team",
     packages=find_packages(),
+    package_data={
+        "config.presets": ["data/*.json"],
+    },
     python_requires=">=3.11",
     install_requires=[
         "openai>=1.0.0",
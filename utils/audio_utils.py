@@ -6,7 +6,8 @@
 
 import os
 import json
-from typing import Dict, Any, Optional, Tuple
+import wave
+from typing import Dict, Any, Optional, Tuple, Iterator
 from pathlib import Path
 import subprocess
 import tempfile
@@ -15,6 +16,10 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 文字起こし用の音声フィルタ（ハイパス80Hz、ローパス8kHz、音量1.2倍）
+# 係数は入力のサンプルレートに依存するため、biquad係数ではなくフィルタ名で指定する
+AUDIO_BANDPASS_FILTER = "highpass=f=80,lowpass=f=8000,volume=1.2"
+
 
 def get_audio_metadata(file_path: str) -> Dict[str, Any]:
     """
@@ -194,6 +199,11 @@ def get_audio_duration(file_path: str) -> float:
     Returns:
         float: 音声の長さ（秒）
     """
+    # ヘッダーから読める形式はffprobeを起動せずに取得する
+    duration = _read_duration_from_header(file_path)
+    if duration is not None:
+        return duration
+    
     try:
         metadata = get_audio_metadata(file_path)
         return metadata['duration']
@@ -202,6 +212,166 @@ def get_audio_duration(file_path: str) -> float:
         return 0.0
 
 
+def _read_duration_from_header(file_path: str) -> Optional[float]:
+    """
+    ファイルヘッダーから音声の長さを取得する
+    
+    Args:
+        file_path: 音声ファイルのパス
+        
+    Returns:
+        Optional[float]: 音声の長さ（秒）。読み取れない場合はNone
+    """
+    file_ext = Path(file_path).suffix.lower()
+    try:
+        if file_ext == '.wav':
+            with wave.open(file_path, 'rb') as wav_file:
+                return wav_file.getnframes() / wav_file.getframerate()
+        
+        if file_ext in ('.flac', '.ogg', '.aiff', '.au'):
+            import soundfile
+            info = soundfile.info(file_path)
+            return info.frames / info.samplerate
+        
+        if file_ext == '.mp3':
+            from mutagen.mp3 import MP3
+            return MP3(file_path).info.length
+    except Exception:
+        # 未対応のエンコーディングやライブラリ未導入の場合はffprobeに任せる
+        pass
+    
+    return None
+
+
+def decode_audio_to_wav(
+    input_path: str, 
+    output_path: str, 
+    sample_rate: int = 16000,
+    channels: int = 1
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    音声ファイルを1回だけデコードし、16bit PCMとWAVファイルを得る
+    
+    Args:
+        input_path: 入力ファイルパス
+        output_path: 出力WAVファイルパス
+        sample_rate: サンプルレート
+        channels: チャンネル数
+        
+    Returns:
+        Tuple[bytes, Dict[str, Any]]: (16bit PCM, get_audio_metadataと同じ形式のメタデータ)
+    """
+    import ffmpeg
+    
+    # 出力ディレクトリを作成
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    # FFmpegで1回だけデコードし、16bit PCMを標準出力から受け取る
+    pcm, _ = (
+        ffmpeg
+        .input(input_path)
+        .output(
+            'pipe:',
+            format='s16le',
+            ac=channels,               # チャンネル数
+            ar=sample_rate,            # サンプルレート
+            vn=None,                   # 動画を無効化
+            af=AUDIO_BANDPASS_FILTER,  # 音声フィルタ
+            acodec='pcm_s16le',        # 16bit PCM
+            threads=1                  # Whisperの推論とコアを奪い合わないよう制限
+        )
+        .global_args('-filter_threads', '1')
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+    
+    # 同じPCMからWAVファイルを書き出す（ffprobeでの再読み込みは不要）
+    with wave.open(output_path, 'wb') as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    
+    stream = {
+        'codec_name': 'pcm_s16le',
+        'sample_rate': sample_rate,
+        'channels': channels
+    }
+    metadata = {
+        'duration': len(pcm) / (2 * channels * sample_rate),
+        'sample_rate': sample_rate,
+        'channels': channels,
+        'bit_rate': 16 * channels * sample_rate,
+        'bit_depth': 16,
+        'codec_name': 'pcm_s16le',
+        'file_size': Path(output_path).stat().st_size,
+        'format': Path(output_path).suffix.lower(),
+        'raw_metadata': stream
+    }
+    return pcm, metadata
+
+
+def iter_audio_pcm(
+    input_path: str, 
+    sample_rate: int = 16000,
+    channels: int = 1,
+    chunk_frames: int = 16000
+) -> Iterator[Any]:
+    """
+    音声ファイルをデコードしながらfloat32 PCMを順に返す
+    
+    一時WAVファイルを経由せず、FFmpegの標準出力から chunk_frames フレームずつ読み込みます。
+    
+    Args:
+        input_path: 入力ファイルパス
+        sample_rate: サンプルレート
+        channels: チャンネル数
+        chunk_frames: 1回に返すフレーム数
+        
+    Returns:
+        Iterator[np.ndarray]: [-1.0, 1.0) のfloat32 PCM（複数チャンネルは (フレーム数, チャンネル数)）
+    """
+    import ffmpeg
+    import numpy as np
+    
+    process = (
+        ffmpeg
+        .input(input_path)
+        .output(
+            'pipe:',
+            format='s16le',
+            ac=channels,
+            ar=sample_rate,
+            vn=None,
+            af=AUDIO_BANDPASS_FILTER,
+            acodec='pcm_s16le',
+            threads=1
+        )
+        .global_args('-filter_threads', '1', '-nostats', '-loglevel', 'error')
+        .run_async(pipe_stdout=True)
+    )
+    
+    chunk_bytes = chunk_frames * channels * 2
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            samples = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
+            yield samples if channels == 1 else samples.reshape(-1, channels)
+    except BaseException:
+        # 途中で読み込みをやめた場合（GeneratorExitを含む）はFFmpegを終了させる
+        process.kill()
+        process.stdout.close()
+        process.wait()
+        raise
+    
+    # EOFに達した場合はFFmpegの終了を待ち、終了コードを確認する
+    process.stdout.close()
+    return_code = process.wait()
+    if return_code != 0:
+        raise RuntimeError(f"FFmpeg failed to decode {input_path} (exit code {return_code})")
+
+
 def convert_audio_format(
     input_path: str, 
     output_path: str, 
@@ -230,13 +400,6 @@ def convert_audio_format(
         # 出力ディレクトリを作成
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # 音声フィルタを構築
-        audio_filters = [
-            f"highpass=f=80",      # ハイパスフィルタ
-            f"lowpass=f=8000",     # ローパスフィルタ
-            "volume=1.2"           # 音量調整
-        ]
-        
         # FFmpegで変換
         (
             ffmpeg
@@ -246,7 +409,7 @@ def convert_audio_format(
                 ac=channels,                    # チャンネル数
                 ar=sample_rate,                 # サンプルレート
                 acodec=codec,                   # コーデック
-                af=",".join(audio_filters),     # 音声フィルタ
+                af=AUDIO_BANDPASS_FILTER,       # 音声フィルタ
                 vn=None,                        # 動画を無効化
                 y=None                          # 上書き確認を無効化
             )
@@ -0,0 +1,83 @@
+"""
+PDF処理ユーティリティ
+
+PDFのページ並列抽出で使うプロセスプールとワーカー関数を提供します。
+
+ワーカープロセスはこのモジュールだけを読み込むため、adapters パッケージ
+（Whisper・OpenAI・Google Cloudのクライアント）を読み込まないようにしてください。
+"""
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+# 並列抽出で1ワーカーに割り当てる最小ページ数（これ未満はプロセス間のやり取りの方が高くつく）
+MIN_PAGES_PER_WORKER = 8
+
+# PDF抽出用プロセスプールのワーカー数の上限（リクエスト処理と同じマシンで動くため控えめにする）
+MAX_PDF_WORKERS = 4
+
+# プロセス間で共有するPDF抽出用プール（初回の並列抽出時に作成）
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    PDF抽出用のプロセスプールを取得する
+    
+    リクエストごとにプロセスを起動しないよう、プールはモジュールで1つだけ作成する。
+    スレッドを持つサーバープロセスをforkすると安全でないため、forkserver（なければspawn）で起動する。
+    
+    Returns:
+        ProcessPoolExecutor: 共有のプロセスプール
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context(
+                    'forkserver' if 'forkserver' in methods else 'spawn'
+                )
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=min(MAX_PDF_WORKERS, os.cpu_count() or 1),
+                    mp_context=context
+                )
+    return _pdf_pool
+
+
+def reset_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    壊れたプロセスプールを破棄する（次回の並列抽出で作り直す）
+    
+    Args:
+        pool: 破棄するプール
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False)
+
+
+def extract_page_range_text(pdf_path: str, start: int, end: int) -> str:
+    """
+    指定範囲のページのテキストを抽出する（ワーカープロセスで実行）
+    
+    Args:
+        pdf_path: PDFファイルパス
+        start: 開始ページ
+        end: 終了ページ（含まない）
+        
+    Returns:
+        str: ページ順に連結したテキスト
+    """
+    import PyPDF2
+    
+    with open(pdf_path, 'rb') as file:
+        pages = PyPDF2.PdfReader(file).pages
+        return "".join(pages[i].extract_text() + "\n" for i in range(start, end))
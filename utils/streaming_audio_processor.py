@@ -13,10 +13,25 @@ import subprocess
 import psutil
 
 from utils.logging import get_logger
-from utils.audio_utils import get_audio_metadata, validate_audio_file
+from utils.audio_utils import AUDIO_BANDPASS_FILTER, get_audio_metadata, validate_audio_file
 
 logger = get_logger(__name__)
 
+# チャンク抽出に使うFFmpegコマンドの固定部分
+# （Whisperの推論スレッドとコアを奪い合わないよう、FFmpegは1スレッドに制限する）
+_FFMPEG_BASE = (
+    'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostdin', '-y',
+    '-filter_threads', '1'
+)
+_FFMPEG_OUTPUT_ARGS = (
+    '-vn',
+    '-threads', '1',
+    '-acodec', 'pcm_s16le',                            # 16bit PCM
+    '-ar', '16000',                                    # 16kHz
+    '-ac', '1',                                        # モノラル
+    '-af', AUDIO_BANDPASS_FILTER                       # 音声フィルタ
+)
+
 
 class StreamingAudioProcessor:
     """ストリーミング音声処理クラス"""
@@ -148,24 +163,18 @@ class StreamingAudioProcessor:
             bool: 抽出成功の可否
         """
         try:
-            import ffmpeg
-            
             # 出力ディレクトリを作成
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             
-            # FFmpegでチャンクを抽出
-            (
-                ffmpeg
-                .input(input_path, ss=start_time, t=end_time - start_time)
-                .output(
-                    output_path,
-                    acodec='pcm_s16le',  # 16bit PCM
-                    ar=16000,            # 16kHz
-                    ac=1,                # モノラル
-                    af="highpass=f=80,lowpass=f=8000,volume=1.2"  # 音声フィルタ
-                )
-                .run(quiet=True, overwrite_output=True)
-            )
+            # FFmpegでチャンクを抽出（可変部分のみ組み立てる）
+            cmd = _FFMPEG_BASE + (
+                '-ss', f'{start_time}',
+                '-t', f'{end_time - start_time}',
+                '-i', input_path
+            ) + _FFMPEG_OUTPUT_ARGS + (output_path,)
+            
+            # 機密なfdは持たないため、close_fdsによるfd走査を省略する
+            subprocess.run(cmd, check=True, close_fds=False)
             
             return True
             
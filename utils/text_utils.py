@@ -62,13 +62,12 @@ class TextUtils:
         Returns:
             List[str]: 用語候補のリスト
         """
-        terms = []
+        # 正規表現エンジン（C実装）で候補を一括抽出する
+        terms = TextUtils.CANDIDATE_RE.findall(text)
         
-        # 正規表現で候補を抽出
-        for match in TextUtils.CANDIDATE_RE.finditer(text):
-            term = match.group(0)
-            if len(term) >= min_length:
-                terms.append(term)
+        # 候補は正規表現の時点で2文字以上のため、それより長い指定の場合のみ絞り込む
+        if min_length > 2:
+            terms = [term for term in terms if len(term) >= min_length]
         
         return terms
     